@@ -8,11 +8,11 @@ import io
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from flask import Flask, jsonify, request, send_file, abort
+from flask import Flask, Response, jsonify, request, send_file, abort, stream_with_context
 from flask_cors import CORS
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 from uuid import uuid4
 from PIL import Image, ImageDraw, ImageFont
@@ -21,7 +21,10 @@ import requests
 import traceback
 
 from dotenv import load_dotenv
+import filecmp
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트 추가
 project_root = Path(__file__).parent.parent
@@ -32,16 +35,39 @@ load_dotenv(project_root / ".env")
 print("OPENAI KEY EXISTS:", bool(os.getenv("OPENAI_API_KEY")))
 
 from backend.project_manager import ProjectManager
-from backend.models import Project, Scene
+from backend.project_store import ProjectConflictError, write_json_atomic
+from backend.project_catalog import (
+    ProjectCatalog, SORT_COLUMNS, decode_cursor, encode_cursor, expand_fields, project_fields
+)
+from backend.project_index import ProjectMetaIndex
+from backend.project_watcher import ProjectWatcher
+from backend.image_batch import RateLimitedError, get_image_provider, get_rate_limiter, generate_with_retry, run_image_batch
+from backend.render_jobs import (
+    RenderJobQueue, RENDER_TARGETS, render_project_video, resolve_render_engine, resolve_subtitles_path,
+    resolve_trim_silence
+)
+from backend.models import Project, ProjectView, Scene
+from backend import json_backend
 from src.common.logger import logger
+from src.common.settings import settings
 from src.video.tts import get_audio_duration
-from src.video.render import render_video_simple
-from src.video.srt import format_timestamp, split_sentences_ko, write_srt
+from src.video.tts_cache import synthesize_cached
+from src.video.tts_stream import write_stream, part_path_for, register_partial, finish_partial, get_partial, tail_partial
+from src.video.render import get_encode_profile
+from src.video.render_scheduler import SegmentRenderError
+from src.video.srt import cues_to_srt, split_sentences_ko, write_srt
+from src.video.timing import time_sentences
+from src.video.silence import analyze_silence
+from src.video.audio_trim import edge_trim_bounds, get_trim_params
 import mimetypes
 import shutil
 
 app = Flask(__name__)
 
+# 응답 JSON 인코딩 (orjson 설치 시 빠른 경로, storage.json.backend 설정)
+if json_backend.FastJSONProvider is not None:
+    app.json = json_backend.FastJSONProvider(app)
+
 # CORS 모든 origin 허용
 CORS(app, 
      origins='*',
@@ -69,6 +95,23 @@ try:
 except Exception as migration_error:
     logger.error(f"[MIGRATION] duplicate project dir migration failed: {migration_error}")
 
+# 프로젝트 카탈로그 (SQLite WAL, 목록 필터/정렬/페이지용 - 디스크에서 언제든 재구축 가능)
+_catalog_path = str(settings.get('projects.catalog.path', 'storage/catalog.sqlite3'))
+if _catalog_path != ':memory:' and not Path(_catalog_path).is_absolute():
+    _catalog_path = str(project_root / _catalog_path)
+project_catalog = ProjectCatalog(_catalog_path)
+
+# 프로젝트 메타 인덱스 (목록 조회용, 서버 시작 시 build - 파일 하단 참고)
+project_index = ProjectMetaIndex(pm, lambda pid, pdir: _build_project_index_entry(pid, pdir), catalog=project_catalog)
+pm.add_change_listener(project_index.invalidate)
+render_jobs = RenderJobQueue(pm.projects_root)
+project_watcher = ProjectWatcher(
+    pm.projects_root,
+    project_index.invalidate_path,
+    mode=str(settings.get('projects.watcher', 'auto')),
+    poll_interval=float(settings.get('projects.poll_interval', 2.0)),
+)
+
 # --------------------------------------------
 # IMAGE STYLES (Synced with Frontend)
 # --------------------------------------------
@@ -185,7 +228,7 @@ def _validate_and_resolve_path(project_id: str, relative_path: str):
 
 
 def _resolve_storage_tts_path(project_id: str, filename: str):
-    """Storage projects root → files inside per-project tts folder"""
+    """TTS 파일 경로 해석 (단일 사본: 프로젝트 assets/audio 우선, 구버전 storage tts 폴더 fallback)"""
     if not filename:
         raise ValueError("filename is required")
     if filename.startswith('/') or filename.startswith('\\'):
@@ -193,21 +236,80 @@ def _resolve_storage_tts_path(project_id: str, filename: str):
     if ':' in filename:
         raise ValueError("invalid filename")
 
-    tts_dir = STORAGE_ROOT / project_id / "tts"
-    tts_dir.mkdir(parents=True, exist_ok=True)
+    for base in (pm.get_project_dir(project_id) / "assets" / "audio", STORAGE_ROOT / project_id / "tts"):
+        root = base.resolve()
+        target = (base / filename).resolve()
+        if not str(target).startswith(str(root)):
+            raise ValueError("filename points outside TTS storage")
+        if target.is_file():
+            return target
+    raise FileNotFoundError("TTS file not found")
+
+
+STORAGE_TTS_MIGRATION_MARKER = STORAGE_ROOT / ".tts_single_copy"
+
+
+def _migrate_storage_tts():
+    """storage/projects/<id>/tts 중복 사본 정리 (1회)
+
+    - 프로젝트 assets/audio에 같은 내용이 있으면 storage 사본 삭제
+    - 프로젝트 쪽에 없으면 assets/audio로 이동
+    - 내용이 다른 파일은 그대로 둠 (serve_storage_tts는 프로젝트 파일 우선)
+    """
+    if STORAGE_TTS_MIGRATION_MARKER.exists():
+        return
+    removed = moved = kept = 0
+    for storage_dir in STORAGE_ROOT.iterdir():
+        tts_dir = storage_dir / "tts"
+        if not tts_dir.is_dir():
+            continue
+        project_dir = pm.get_project_dir(storage_dir.name)
+        if not project_dir.exists():
+            continue
+        audio_dir = project_dir / "assets" / "audio"
+        for storage_file in tts_dir.iterdir():
+            if not storage_file.is_file():
+                continue
+            project_file = audio_dir / storage_file.name
+            try:
+                if not project_file.exists():
+                    audio_dir.mkdir(parents=True, exist_ok=True)
+                    os.replace(storage_file, project_file)
+                    moved += 1
+                elif os.path.samefile(storage_file, project_file) or filecmp.cmp(storage_file, project_file, shallow=False):
+                    storage_file.unlink()
+                    removed += 1
+                else:
+                    kept += 1
+            except OSError as e:
+                logger.warning(f"[TTS_MIGRATE] {storage_file}: {e}")
+                kept += 1
+        for empty_dir in (tts_dir, storage_dir):
+            try:
+                empty_dir.rmdir()
+            except OSError:
+                break
+    STORAGE_TTS_MIGRATION_MARKER.write_text(datetime.now().isoformat(), encoding='utf-8')
+    logger.info(f"[TTS_MIGRATE] storage tts dedupe: removed={removed} moved={moved} kept={kept}")
+
 
-    target = (tts_dir / filename).resolve()
-    root = tts_dir.resolve()
-    if not str(target).startswith(str(root)):
-        raise ValueError("filename points outside TTS storage")
-    if not target.exists():
-        raise FileNotFoundError("TTS file not found")
-    return target
+def _partial_tts_response(project_id: str, filename: str):
+    """합성 중인 TTS 파일이면 늘어나는 대로 스트리밍하는 응답 (아니면 None)"""
+    entry = get_partial((project_id, filename))
+    if entry is None:
+        return None
+    mime = 'audio/wav' if filename.lower().endswith('.wav') else 'audio/mpeg'
+    response = Response(stream_with_context(tail_partial(entry)), mimetype=mime)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 
 @app.route('/files/projects/<project_id>/tts/<path:filename>', methods=['GET'])
 def serve_storage_tts(project_id, filename):
     """Serve TTS assets stored under storage/projects"""
+    partial_response = _partial_tts_response(project_id, filename)
+    if partial_response is not None:
+        return partial_response
     try:
         full_path = _resolve_storage_tts_path(project_id, filename)
     except FileNotFoundError:
@@ -251,6 +353,10 @@ def serve_project():
 @app.route('/api/projects/<project_id>/files/<path:file_path>', methods=['GET'])
 def serve_project_file(project_id, file_path):
     """프로젝트 내 파일 제공 (Secure)"""
+    if file_path.startswith('assets/audio/') and '/' not in file_path[len('assets/audio/'):]:
+        partial_response = _partial_tts_response(project_id, file_path[len('assets/audio/'):])
+        if partial_response is not None:
+            return partial_response
     try:
         full_path = _validate_and_resolve_path(project_id, file_path)
         return send_file(str(full_path))
@@ -331,9 +437,8 @@ def create_project_from_topic():
         json_path = pm._get_project_json_path(project.id)
         if json_path.exists():
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                    project_dict['folderName'] = json_data.get('folderName', project.id)
+                json_data = json_backend.load_path(json_path)
+                project_dict['folderName'] = json_data.get('folderName', project.id)
             except:
                 project_dict['folderName'] = project.id
         
@@ -561,8 +666,7 @@ def get_project(project_id):
             scenes_json_path = project_path / "scenes.json"
             if scenes_json_path.exists():
                 try:
-                    with open(scenes_json_path, 'r', encoding='utf-8') as f:
-                        raw = json.load(f)
+                    raw = json_backend.load_path(scenes_json_path)
                     scenes_list = raw if isinstance(raw, list) else raw.get('scenes', [])
                     if scenes_list:
                         out['scenes'] = scenes_list
@@ -598,8 +702,7 @@ def get_project(project_id):
         scenes_json_path = project_path / "scenes.json"
         if (not project_dict.get('scenes') or len(project_dict.get('scenes', [])) == 0) and scenes_json_path.exists():
             try:
-                with open(scenes_json_path, 'r', encoding='utf-8') as f:
-                    raw = json.load(f)
+                raw = json_backend.load_path(scenes_json_path)
                 scenes_list = raw if isinstance(raw, list) else raw.get('scenes', [])
                 if scenes_list:
                     project_dict['scenes'] = scenes_list
@@ -624,11 +727,16 @@ def get_project(project_id):
 
 @app.route('/api/projects/<project_id>', methods=['PUT'])
 def update_project(project_id):
-    """프로젝트 전체 저장"""
+    """프로젝트 전체 저장
+
+    body에 마지막으로 읽은 revision 필수 (디스크 revision과 다르면 409, 없으면 400)
+    """
     try:
         data = request.get_json()
         if not data:
             return jsonify({'ok': False, 'error': 'No data provided'}), 400
+        if data.get('revision') is None:
+            return jsonify({'ok': False, 'error': 'revision is required'}), 400
         
         # project.json의 데이터로부터 Project 객체 재구성
         project = Project.from_dict(data)
@@ -641,14 +749,43 @@ def update_project(project_id):
             }), 200
         else:
             return jsonify({'ok': False, 'error': 'Failed to save'}), 500
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         logger.error(f"프로젝트 저장 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
+def _conflict_response(error: ProjectConflictError):
+    """revision 충돌 응답 (클라이언트는 최신 프로젝트를 다시 읽고 재시도)"""
+    logger.warning(f"[API] {error}")
+    return jsonify({
+        'ok': False,
+        'error': str(error),
+        'conflict': True,
+        'revision': error.actual,
+    }), 409
+
+
+def _check_revision(project_id: str, data: Dict[str, Any], project: Project):
+    """body의 revision(있으면 꺼냄)이 디스크 revision과 다르면 409 응답, 같거나 없으면 None"""
+    expected_revision = data.pop('revision', None)
+    if expected_revision is not None and str(expected_revision) != str(project.revision):
+        return _conflict_response(ProjectConflictError(project_id, expected_revision, project.revision))
+    return None
+
+
 @app.route('/api/projects/<project_id>', methods=['PATCH'])
 def partial_update_project(project_id):
-    """프로젝트 부분 업데이트 (title/status 등)"""
+    """프로젝트 부분 업데이트 (title/status 등)
+
+    body에 revision이 있으면 디스크 revision과 다를 때 409 (다른 요청이 먼저 저장함)
+    """
+    with pm.project_lock(project_id):
+        return _partial_update_project_locked(project_id)
+
+
+def _partial_update_project_locked(project_id):
     request_id = request.headers.get('X-Request-Id', 'N/A')
     print(f"REQ PATCH {request.path} projectId={project_id} rid={request_id}")
     
@@ -661,6 +798,9 @@ def partial_update_project(project_id):
         if not project:
             logger.warning(f"[API] PROJECT NOT FOUND: {project_id}")
             return jsonify({'ok': False, 'error': 'Project not found'}), 404
+        conflict = _check_revision(project_id, data, project)
+        if conflict:
+            return conflict
         
         # project.json 경로 확인
         json_path = pm._get_project_json_path(project_id)
@@ -746,44 +886,12 @@ def partial_update_project(project_id):
             # project.json에도 title 필드 저장
             updated_at = datetime.now().astimezone().isoformat()
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                json_data['title'] = new_title
-                json_data['topic'] = new_title  # topic도 함께 업데이트 (호환성)
-                json_data['updatedAt'] = updated_at
-                # folderName은 절대 변경하지 않음 (중요!)
-                try:
-                    with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                        json.dump(json_data, f, indent=2, ensure_ascii=False)
-                except (UnicodeEncodeError, UnicodeDecodeError) as e:
-                    logger.error(f"Unicode error writing project.json (title update) for {project_id}: {e}")
-                    # 이모지 제거 후 재시도
-                    import re
-                    emoji_pattern = re.compile("["
-                        "\U0001F600-\U0001F64F"
-                        "\U0001F300-\U0001F5FF"
-                        "\U0001F680-\U0001F6FF"
-                        "\U0001F700-\U0001F77F"
-                        "\U0001F780-\U0001F7FF"
-                        "\U0001F800-\U0001F8FF"
-                        "\U0001F900-\U0001F9FF"
-                        "\U0001FA00-\U0001FA6F"
-                        "\U0001FA70-\U0001FAFF"
-                        "\u2600-\u26FF"
-                        "\u2700-\u27BF"
-                        "]+", flags=re.UNICODE)
-                    def remove_emoji_from_dict(d):
-                        if isinstance(d, dict):
-                            return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                        elif isinstance(d, list):
-                            return [remove_emoji_from_dict(item) for item in d]
-                        elif isinstance(d, str):
-                            return emoji_pattern.sub('', d)
-                        return d
-                    json_data_no_emoji = remove_emoji_from_dict(json_data)
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump(json_data_no_emoji, f, indent=2, ensure_ascii=False)
-                    logger.info(f"project.json saved without emoji (title update) for {project_id}")
+                def _set_title(json_data):
+                    json_data['title'] = new_title
+                    json_data['topic'] = new_title  # topic도 함께 업데이트 (호환성)
+                    json_data['updatedAt'] = updated_at
+                    # folderName은 절대 변경하지 않음 (중요!)
+                pm.update_project_json(project_id, _set_title)
                 print(f"TITLE_SAVED projectId={project_id} title={new_title} rid={request_id}")
                 
                 # TITLE.txt 업데이트 (폴더명은 변경하지 않음)
@@ -796,8 +904,7 @@ def partial_update_project(project_id):
                 
                 # 저장 후 재읽기 검증
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        reloaded = json.load(f)
+                    reloaded = json_backend.load_path(json_path)
                     print(f"META_AFTER_TITLE_UPDATE projectId={project_id} title={reloaded.get('title')} topic={reloaded.get('topic')} folderName={reloaded.get('folderName')} rid={request_id}")
                 except Exception as reload_error:
                     logger.warning(f"[API] Failed to reload project.json for {project_id}: {reload_error}")
@@ -833,8 +940,7 @@ def partial_update_project(project_id):
             if 'scenes' in data:
                 try:
                     scenes_list = project.to_dict().get('scenes', [])
-                    with open(project_path / "scenes.json", 'w', encoding='utf-8') as f:
-                        json.dump(scenes_list, f, indent=2, ensure_ascii=False)
+                    write_json_atomic(project_path / "scenes.json", scenes_list)
                 except Exception as e:
                     logger.warning(f"[API] scenes.json 쓰기 실패: {e}")
         else:
@@ -843,8 +949,7 @@ def partial_update_project(project_id):
         
         # 저장 후 재읽기 검증
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                reloaded_data = json.load(f)
+            reloaded_data = json_backend.load_path(json_path)
             print(f"META_AFTER_WRITE projectId={project_id} title={reloaded_data.get('title') or reloaded_data.get('topic')} status={reloaded_data.get('status')} imagesCount={reloaded_data.get('imagesCount')} rid={request_id}")
         except Exception as e:
             print(f"META_RELOAD_FAILED projectId={project_id} error={e} rid={request_id}")
@@ -873,7 +978,7 @@ def partial_update_project(project_id):
                 project_dict['archived'] = getattr(project.status, 'archived', False) if project.status else False
                 project_dict['pinned'] = getattr(project.status, 'isPinned', False) if project.status else False
             # JSON serializable 확인
-            json.dumps(project_dict)
+            json_backend.dumps(project_dict, compact=True)
         except Exception as e:
             logger.error(f"[API] project.to_dict() 실패: {project_id}, 에러: {e}")
             # 기본 정보만 반환 (안전한 dict만)
@@ -889,6 +994,9 @@ def partial_update_project(project_id):
             'ok': True,
             'project': project_dict
         }), 200
+    except ProjectConflictError as e:
+        print(f"RESP_CONFLICT projectId={project_id} error={e} rid={request_id}")
+        return _conflict_response(e)
     except FileNotFoundError as e:
         print(f"RESP_ERROR projectId={project_id} FileNotFound: {e} rid={request_id}")
         logger.error(f"[API] Project file not found: {e}")
@@ -932,81 +1040,83 @@ def batch_archive_projects():
         
         for project_id in project_ids:
             try:
-                project = pm.get_project(project_id)
-                if not project:
-                    failed.append({'id': project_id, 'reason': 'Project not found'})
-                    logger.warning(f"[API] 배치 보관 실패: {project_id} - Project not found")
-                    continue
+                with pm.project_lock(project_id):
+                    project = pm.get_project(project_id)
+                    if not project:
+                        failed.append({'id': project_id, 'reason': 'Project not found'})
+                        logger.warning(f"[API] 배치 보관 실패: {project_id} - Project not found")
+                        continue
                 
-                # Status 객체가 dataclass 인스턴스인지 확인하고, 아니면 새로 생성
-                if not hasattr(project.status, '__dataclass_fields__'):
-                    # Status가 dict이거나 다른 타입인 경우 새로 생성
-                    from backend.models import Status
-                    status_dict = {}
-                    if isinstance(project.status, dict):
-                        status_dict = project.status.copy()
-                    elif hasattr(project.status, '__dict__'):
-                        status_dict = dict(project.status.__dict__)
+                    # Status 객체가 dataclass 인스턴스인지 확인하고, 아니면 새로 생성
+                    if not hasattr(project.status, '__dataclass_fields__'):
+                        # Status가 dict이거나 다른 타입인 경우 새로 생성
+                        from backend.models import Status
+                        status_dict = {}
+                        if isinstance(project.status, dict):
+                            status_dict = project.status.copy()
+                        elif hasattr(project.status, '__dict__'):
+                            status_dict = dict(project.status.__dict__)
+                        else:
+                            status_dict = {
+                                'script': getattr(project.status, 'script', 'pending'),
+                                'images': getattr(project.status, 'images', 'pending'),
+                                'tts': getattr(project.status, 'tts', 'pending'),
+                                'render': getattr(project.status, 'render', 'pending'),
+                                'archived': getattr(project.status, 'archived', False),
+                                'isPinned': getattr(project.status, 'isPinned', False),
+                                'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None),
+                            }
+                        status_dict['archived'] = (status_value == 'archived')
+                        project.status = Status(**status_dict)
                     else:
-                        status_dict = {
-                            'script': getattr(project.status, 'script', 'pending'),
-                            'images': getattr(project.status, 'images', 'pending'),
-                            'tts': getattr(project.status, 'tts', 'pending'),
-                            'render': getattr(project.status, 'render', 'pending'),
-                            'archived': getattr(project.status, 'archived', False),
-                            'isPinned': getattr(project.status, 'isPinned', False),
-                            'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None),
-                        }
-                    status_dict['archived'] = (status_value == 'archived')
-                    project.status = Status(**status_dict)
-                else:
-                    # Status 객체의 archived 필드 직접 업데이트
-                    project.status.archived = (status_value == 'archived')
+                        # Status 객체의 archived 필드 직접 업데이트
+                        project.status.archived = (status_value == 'archived')
                 
-                project.updatedAt = datetime.now().isoformat()
+                    project.updatedAt = datetime.now().isoformat()
                 
-                # 프로젝트 저장
-                json_path = pm._get_project_json_path(project_id)
-                print(f"META_PATH projectId={project_id} path={json_path} rid={request_id}")
+                    # 프로젝트 저장
+                    json_path = pm._get_project_json_path(project_id)
+                    print(f"META_PATH projectId={project_id} path={json_path} rid={request_id}")
                 
-                if pm.save_project(project):
-                    updated.append(project_id)
-                    print(f"SAVE_SUCCESS projectId={project_id} rid={request_id}")
+                    if pm.save_project(project):
+                        updated.append(project_id)
+                        print(f"SAVE_SUCCESS projectId={project_id} rid={request_id}")
                     
-                    # 저장 후 재읽기 검증
-                    try:
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            reloaded = json.load(f)
-                        print(f"META_AFTER_WRITE projectId={project_id} title={reloaded.get('title') or reloaded.get('topic')} status={reloaded.get('status')} rid={request_id}")
-                    except Exception as e:
-                        print(f"META_RELOAD_FAILED projectId={project_id} error={e} rid={request_id}")
-                    
-                    # 메타 보정 및 저장 (이미지/카운트 보정 포함)
-                    meta = reconcile_and_persist_meta(project_id, force=True)
-                    if meta:
-                        updated_projects.append(meta)
-                    else:
-                        # 메타 보정 실패 시 최소 정보
-                        # project.json에서 title 읽기
-                        json_path = pm._get_project_json_path(project_id)
+                        # 저장 후 재읽기 검증
                         try:
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                json_data = json.load(f)
-                            project_title = json_data.get('title') or json_data.get('topic') or getattr(project, 'topic', '')
-                        except:
-                            project_title = getattr(project, 'topic', '')
-                        updated_projects.append({
-                            'id': project_id,
-                            'title': project_title,
-                            'status': status_value,
-                            'updatedAt': project.updatedAt,
-                        })
+                            reloaded = json_backend.load_path(json_path)
+                            print(f"META_AFTER_WRITE projectId={project_id} title={reloaded.get('title') or reloaded.get('topic')} status={reloaded.get('status')} rid={request_id}")
+                        except Exception as e:
+                            print(f"META_RELOAD_FAILED projectId={project_id} error={e} rid={request_id}")
                     
-                    logger.info(f"[API] 배치 보관 성공: {project_id} -> {status_value}")
-                    print(f"ARCHIVE_SUCCESS projectId={project_id} status={status_value} rid={request_id}")
-                else:
-                    failed.append({'id': project_id, 'reason': 'Save operation failed'})
-                    logger.warning(f"[API] 배치 보관 실패: {project_id} - Save operation failed")
+                        # 메타 보정 및 저장 (이미지/카운트 보정 포함)
+                        meta = reconcile_and_persist_meta(project_id, force=True)
+                        if meta:
+                            updated_projects.append(meta)
+                        else:
+                            # 메타 보정 실패 시 최소 정보
+                            # project.json에서 title 읽기
+                            json_path = pm._get_project_json_path(project_id)
+                            try:
+                                json_data = json_backend.load_path(json_path)
+                                project_title = json_data.get('title') or json_data.get('topic') or getattr(project, 'topic', '')
+                            except:
+                                project_title = getattr(project, 'topic', '')
+                            updated_projects.append({
+                                'id': project_id,
+                                'title': project_title,
+                                'status': status_value,
+                                'updatedAt': project.updatedAt,
+                            })
+                    
+                        logger.info(f"[API] 배치 보관 성공: {project_id} -> {status_value}")
+                        print(f"ARCHIVE_SUCCESS projectId={project_id} status={status_value} rid={request_id}")
+                    else:
+                        failed.append({'id': project_id, 'reason': 'Save operation failed'})
+                        logger.warning(f"[API] 배치 보관 실패: {project_id} - Save operation failed")
+            except ProjectConflictError as e:
+                failed.append({'id': project_id, 'reason': str(e), 'conflict': True})
+                logger.warning(f"[API] 배치 상태 변경 충돌: {project_id} - {e}")
             except Exception as e:
                 failed.append({'id': project_id, 'reason': str(e)})
                 logger.error(f"[API] 배치 보관 실패: {project_id}, 에러: {e}")
@@ -1062,78 +1172,80 @@ def batch_unarchive_projects():
         
         for project_id in project_ids:
             try:
-                project = pm.get_project(project_id)
-                if not project:
-                    failed.append({'id': project_id, 'reason': 'Project not found'})
-                    logger.warning(f"[API] 배치 보관 해제 실패: {project_id} - Project not found")
-                    continue
+                with pm.project_lock(project_id):
+                    project = pm.get_project(project_id)
+                    if not project:
+                        failed.append({'id': project_id, 'reason': 'Project not found'})
+                        logger.warning(f"[API] 배치 보관 해제 실패: {project_id} - Project not found")
+                        continue
                 
-                # Status 객체가 dataclass 인스턴스인지 확인하고, 아니면 새로 생성
-                if not hasattr(project.status, '__dataclass_fields__'):
-                    from backend.models import Status
-                    status_dict = {}
-                    if isinstance(project.status, dict):
-                        status_dict = project.status.copy()
-                    elif hasattr(project.status, '__dict__'):
-                        status_dict = dict(project.status.__dict__)
+                    # Status 객체가 dataclass 인스턴스인지 확인하고, 아니면 새로 생성
+                    if not hasattr(project.status, '__dataclass_fields__'):
+                        from backend.models import Status
+                        status_dict = {}
+                        if isinstance(project.status, dict):
+                            status_dict = project.status.copy()
+                        elif hasattr(project.status, '__dict__'):
+                            status_dict = dict(project.status.__dict__)
+                        else:
+                            status_dict = {
+                                'script': getattr(project.status, 'script', 'pending'),
+                                'images': getattr(project.status, 'images', 'pending'),
+                                'tts': getattr(project.status, 'tts', 'pending'),
+                                'render': getattr(project.status, 'render', 'pending'),
+                                'archived': getattr(project.status, 'archived', False),
+                                'isPinned': getattr(project.status, 'isPinned', False),
+                                'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None),
+                            }
+                        status_dict['archived'] = False
+                        project.status = Status(**status_dict)
                     else:
-                        status_dict = {
-                            'script': getattr(project.status, 'script', 'pending'),
-                            'images': getattr(project.status, 'images', 'pending'),
-                            'tts': getattr(project.status, 'tts', 'pending'),
-                            'render': getattr(project.status, 'render', 'pending'),
-                            'archived': getattr(project.status, 'archived', False),
-                            'isPinned': getattr(project.status, 'isPinned', False),
-                            'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None),
-                        }
-                    status_dict['archived'] = False
-                    project.status = Status(**status_dict)
-                else:
-                    project.status.archived = False
+                        project.status.archived = False
                 
-                project.updatedAt = datetime.now().isoformat()
+                    project.updatedAt = datetime.now().isoformat()
                 
-                # 프로젝트 저장
-                json_path = pm._get_project_json_path(project_id)
-                print(f"META_PATH projectId={project_id} path={json_path} rid={request_id}")
+                    # 프로젝트 저장
+                    json_path = pm._get_project_json_path(project_id)
+                    print(f"META_PATH projectId={project_id} path={json_path} rid={request_id}")
                 
-                if pm.save_project(project):
-                    updated.append(project_id)
-                    print(f"SAVE_SUCCESS projectId={project_id} rid={request_id}")
+                    if pm.save_project(project):
+                        updated.append(project_id)
+                        print(f"SAVE_SUCCESS projectId={project_id} rid={request_id}")
                     
-                    # 저장 후 재읽기 검증
-                    try:
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            reloaded = json.load(f)
-                        print(f"META_AFTER_WRITE projectId={project_id} title={reloaded.get('title') or reloaded.get('topic')} status={reloaded.get('status')} rid={request_id}")
-                    except Exception as e:
-                        print(f"META_RELOAD_FAILED projectId={project_id} error={e} rid={request_id}")
-                    
-                    # 메타 보정 및 저장
-                    meta = reconcile_and_persist_meta(project_id, force=True)
-                    if meta:
-                        updated_projects.append(meta)
-                    else:
-                        # project.json에서 title 읽기
-                        json_path = pm._get_project_json_path(project_id)
+                        # 저장 후 재읽기 검증
                         try:
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                json_data = json.load(f)
-                            project_title = json_data.get('title') or json_data.get('topic') or getattr(project, 'topic', '')
-                        except:
-                            project_title = getattr(project, 'topic', '')
-                        updated_projects.append({
-                            'id': project_id,
-                            'title': project_title,
-                            'status': 'active',
-                            'updatedAt': project.updatedAt,
-                        })
+                            reloaded = json_backend.load_path(json_path)
+                            print(f"META_AFTER_WRITE projectId={project_id} title={reloaded.get('title') or reloaded.get('topic')} status={reloaded.get('status')} rid={request_id}")
+                        except Exception as e:
+                            print(f"META_RELOAD_FAILED projectId={project_id} error={e} rid={request_id}")
                     
-                    logger.info(f"[API] 배치 보관 해제 성공: {project_id}")
-                    print(f"UNARCHIVE_SUCCESS projectId={project_id} rid={request_id}")
-                else:
-                    failed.append({'id': project_id, 'reason': 'Save operation failed'})
-                    logger.warning(f"[API] 배치 보관 해제 실패: {project_id} - Save operation failed")
+                        # 메타 보정 및 저장
+                        meta = reconcile_and_persist_meta(project_id, force=True)
+                        if meta:
+                            updated_projects.append(meta)
+                        else:
+                            # project.json에서 title 읽기
+                            json_path = pm._get_project_json_path(project_id)
+                            try:
+                                json_data = json_backend.load_path(json_path)
+                                project_title = json_data.get('title') or json_data.get('topic') or getattr(project, 'topic', '')
+                            except:
+                                project_title = getattr(project, 'topic', '')
+                            updated_projects.append({
+                                'id': project_id,
+                                'title': project_title,
+                                'status': 'active',
+                                'updatedAt': project.updatedAt,
+                            })
+                    
+                        logger.info(f"[API] 배치 보관 해제 성공: {project_id}")
+                        print(f"UNARCHIVE_SUCCESS projectId={project_id} rid={request_id}")
+                    else:
+                        failed.append({'id': project_id, 'reason': 'Save operation failed'})
+                        logger.warning(f"[API] 배치 보관 해제 실패: {project_id} - Save operation failed")
+            except ProjectConflictError as e:
+                failed.append({'id': project_id, 'reason': str(e), 'conflict': True})
+                logger.warning(f"[API] 배치 상태 변경 충돌: {project_id} - {e}")
             except Exception as e:
                 failed.append({'id': project_id, 'reason': str(e)})
                 logger.error(f"[API] 배치 보관 해제 실패: {project_id}, 에러: {e}")
@@ -1219,9 +1331,13 @@ def batch_delete_projects():
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
-def compute_project_facts(project_id: str) -> Dict[str, Any]:
-    """실제 파일 시스템 기준으로 프로젝트 사실(facts) 계산 (메타 보정용)"""
-    project_path = pm._get_project_path(project_id)
+def compute_project_facts(project_id: str, project: Project = None, project_path: Path = None) -> Dict[str, Any]:
+    """실제 파일 시스템 기준으로 프로젝트 사실(facts) 계산 (메타 보정용)
+
+    project / project_path를 넘기면 project.json 재로드와 폴더 탐색을 생략
+    """
+    if project_path is None:
+        project_path = pm._get_project_path(project_id)
     
     # 파일 존재 여부 확인
     script_path = project_path / "script.txt"
@@ -1235,15 +1351,14 @@ def compute_project_facts(project_id: str) -> Dict[str, Any]:
     scenes_count = 0
     if has_scenes_json:
         try:
-            with open(scenes_json_path, 'r', encoding='utf-8') as f:
-                scenes_data = json.load(f)
-                if isinstance(scenes_data, list):
-                    scenes_count = len(scenes_data)
-                elif isinstance(scenes_data, dict) and 'scenes' in scenes_data:
-                    scenes_count = len(scenes_data['scenes'])
-                # scenes.json이 비어있거나 유효하지 않으면 0
-                if scenes_count == 0:
-                    logger.warning(f"[FACTS] scenes.json exists but is empty or invalid for {project_id}")
+            scenes_data = json_backend.load_path(scenes_json_path)
+            if isinstance(scenes_data, list):
+                scenes_count = len(scenes_data)
+            elif isinstance(scenes_data, dict) and 'scenes' in scenes_data:
+                scenes_count = len(scenes_data['scenes'])
+            # scenes.json이 비어있거나 유효하지 않으면 0
+            if scenes_count == 0:
+                logger.warning(f"[FACTS] scenes.json exists but is empty or invalid for {project_id}")
         except Exception as e:
             logger.warning(f"[FACTS] Failed to read scenes.json for {project_id}: {e}")
             scenes_count = 0
@@ -1276,10 +1391,10 @@ def compute_project_facts(project_id: str) -> Dict[str, Any]:
         all_image_files.extend(image_files)
     
     # 3) 씬 객체의 image_path에서 실제 파일 존재 여부 확인
-    project = pm.get_project(project_id)  # project 객체 가져오기
-    if project and project.scenes:
-        for scene in project.scenes:
-            image_path = getattr(scene, 'image_path', None) if hasattr(scene, 'image_path') else None
+    if project is None:
+        project = pm.get_project_view(project_id)  # 씬 이미지 경로만 필요 (Scene 변환 생략)
+    if project:
+        for image_path in dict.fromkeys(project.scene_values('image_path')):
             if image_path and image_path.strip():
                 if image_path.startswith('http'):
                     # URL인 경우 카운트에 포함 (외부 이미지)
@@ -1349,15 +1464,16 @@ def compute_project_facts(project_id: str) -> Dict[str, Any]:
 
 def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str, Any]:
     """프로젝트 메타를 보정하고 project.json에 저장 (단일 진실 소스)"""
-    project = pm.get_project(project_id)
+    # 헤더/메타 필드와 씬 이미지 경로만 필요 -> 지연 로딩 뷰 (Scene 변환 없음)
+    project = pm.get_project_view(project_id)
     if not project:
         logger.warning(f"[RECONCILE] Project not found: {project_id}")
         return None
     
-    # 현재 메타 읽기 (project.json에서)
-    project_dict = project.to_dict()
+    # 현재 메타 읽기 (project.json 원본 - 메타 필드는 모델(to_dict)에 없음)
+    project_dict = project.raw
     current_meta = {
-        'status': project_dict.get('status', {}).get('archived', False) and 'archived' or 'active',
+        'status': 'archived' if getattr(project.status, 'archived', False) else 'active',
         'hasScript': project_dict.get('hasScript'),
         'hasScenesJson': project_dict.get('hasScenesJson'),
         'scenesCount': project_dict.get('scenesCount'),
@@ -1368,7 +1484,7 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
     }
     
     # 실제 파일 시스템에서 facts 계산
-    facts = compute_project_facts(project_id)
+    facts = compute_project_facts(project_id, project=project)
     
     # 메타가 없거나 불일치하면 보정
     needs_update = force or (
@@ -1407,95 +1523,62 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
         print(f"META_PATH projectId={project_id} path={json_path}")
         
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # 메타 필드 추가/업데이트
-            json_data['hasScript'] = facts['hasScript']
-            json_data['hasScenesJson'] = facts['hasScenesJson']
-            json_data['scenesCount'] = facts['scenesCount']
-            json_data['imagesCount'] = facts['imagesCount']
-            json_data['previewImageUrl'] = facts['previewImageUrl']
-            json_data['hasTts'] = facts.get('hasTts', False)
-            json_data['ttsCount'] = facts.get('ttsCount', 0)
-            json_data['hasVideo'] = facts.get('hasVideo', False)
-            # status: 항상 객체로 저장 (문자열로 덮어쓰면 isPinned 손실 → 즐겨찾기/보관 안 됨)
-            current_status = json_data.get('status')
-
-            # [DEBUG] Persistence Check logic
-            mem_pinned = getattr(project.status, 'isPinned', False) if project.status else False
-            disk_pinned = current_status.get('isPinned', False) if isinstance(current_status, dict) else False
-            logger.info(f"[RECONCILE] Persistence check {project_id}: disk_status_type={type(current_status)}, disk_pinned={disk_pinned}, mem_pinned={mem_pinned}, target_archived={status_value=='archived'}")
-
-            if isinstance(current_status, dict):
-                # 기존 값 유지 + archived 업데이트 + isPinned 명시적 보장
-                # (메모리상에 isPinned가 있으면 그것을 우선, 없으면 디스크 값 유지 - 단, 언핀 동작을 고려해야 함)
-                # reconcile은 보통 facts(파일상태) 보정이 목적이므로, 사용자 설정(isPinned)은 disk 값을 신뢰하되, 
-                # project 객체가 최신이라면 project객체 값을 써야 함.
-                # 여기서는 **current_status로 디스크 값을 깔고, project.status에 있는 값이 '명확하다면' 덮어쓰기?
-                # 하지만 project.status는 보통 disk에서 로드됨.
-                pass
-                json_data['status'] = { **current_status, 'archived': status_value == 'archived' }
-            else:
-                is_pinned = getattr(project.status, 'isPinned', False) if project.status else False
-                json_data['status'] = {
-                    'script': getattr(project.status, 'script', 'pending') if project.status else 'pending',
-                    'images': getattr(project.status, 'images', 'pending') if project.status else 'pending',
-                    'tts': getattr(project.status, 'tts', 'pending') if project.status else 'pending',
-                    'render': getattr(project.status, 'render', 'pending') if project.status else 'pending',
-                    'archived': status_value == 'archived',
-                    'isPinned': is_pinned,
-                    'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None) if project.status else None,
-                }
-            # title 필드 확정 (없으면 topic을 title로 저장) - 항상 보장
-            if 'title' not in json_data or not json_data.get('title') or json_data.get('title', '').strip() == '':
-                title_value = json_data.get('topic') or json_data.get('name', '')
-                if title_value:
-                    json_data['title'] = title_value
-                    print(f"META_TITLE_SET projectId={project_id} title={title_value}")
-            if archived_at:
-                json_data['archivedAt'] = archived_at
-            json_data['updatedAt'] = now
-            
-            # 저장
-            try:
-                with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-            except (UnicodeEncodeError, UnicodeDecodeError) as e:
-                logger.error(f"Unicode error writing project.json (reconcile) for {project_id}: {e}")
-                # 이모지 제거 후 재시도
-                import re
-                emoji_pattern = re.compile("["
-                    "\U0001F600-\U0001F64F"
-                    "\U0001F300-\U0001F5FF"
-                    "\U0001F680-\U0001F6FF"
-                    "\U0001F700-\U0001F77F"
-                    "\U0001F780-\U0001F7FF"
-                    "\U0001F800-\U0001F8FF"
-                    "\U0001F900-\U0001F9FF"
-                    "\U0001FA00-\U0001FA6F"
-                    "\U0001FA70-\U0001FAFF"
-                    "\u2600-\u26FF"
-                    "\u2700-\u27BF"
-                    "]+", flags=re.UNICODE)
-                def remove_emoji_from_dict(d):
-                    if isinstance(d, dict):
-                        return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                    elif isinstance(d, list):
-                        return [remove_emoji_from_dict(item) for item in d]
-                    elif isinstance(d, str):
-                        return emoji_pattern.sub('', d)
-                    return d
-                json_data_no_emoji = remove_emoji_from_dict(json_data)
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data_no_emoji, f, indent=2, ensure_ascii=False)
-                logger.info(f"project.json saved without emoji (reconcile) for {project_id}")
+            def _apply_meta(json_data):
+                # 메타 필드 추가/업데이트 (잠금 안에서 읽은 최신 project.json 기준)
+                json_data['hasScript'] = facts['hasScript']
+                json_data['hasScenesJson'] = facts['hasScenesJson']
+                json_data['scenesCount'] = facts['scenesCount']
+                json_data['imagesCount'] = facts['imagesCount']
+                json_data['previewImageUrl'] = facts['previewImageUrl']
+                json_data['hasTts'] = facts.get('hasTts', False)
+                json_data['ttsCount'] = facts.get('ttsCount', 0)
+                json_data['hasVideo'] = facts.get('hasVideo', False)
+                # status: 항상 객체로 저장 (문자열로 덮어쓰면 isPinned 손실 → 즐겨찾기/보관 안 됨)
+                current_status = json_data.get('status')
+
+                # [DEBUG] Persistence Check logic
+                mem_pinned = getattr(project.status, 'isPinned', False) if project.status else False
+                disk_pinned = current_status.get('isPinned', False) if isinstance(current_status, dict) else False
+                logger.info(f"[RECONCILE] Persistence check {project_id}: disk_status_type={type(current_status)}, disk_pinned={disk_pinned}, mem_pinned={mem_pinned}, target_archived={status_value=='archived'}")
+
+                if isinstance(current_status, dict):
+                    # 기존 값 유지 + archived 업데이트 + isPinned 명시적 보장
+                    # (메모리상에 isPinned가 있으면 그것을 우선, 없으면 디스크 값 유지 - 단, 언핀 동작을 고려해야 함)
+                    # reconcile은 보통 facts(파일상태) 보정이 목적이므로, 사용자 설정(isPinned)은 disk 값을 신뢰하되, 
+                    # project 객체가 최신이라면 project객체 값을 써야 함.
+                    # 여기서는 **current_status로 디스크 값을 깔고, project.status에 있는 값이 '명확하다면' 덮어쓰기?
+                    # 하지만 project.status는 보통 disk에서 로드됨.
+                    pass
+                    json_data['status'] = { **current_status, 'archived': bool(current_status.get('archived', status_value == 'archived')) }
+                else:
+                    is_pinned = getattr(project.status, 'isPinned', False) if project.status else False
+                    json_data['status'] = {
+                        'script': getattr(project.status, 'script', 'pending') if project.status else 'pending',
+                        'images': getattr(project.status, 'images', 'pending') if project.status else 'pending',
+                        'tts': getattr(project.status, 'tts', 'pending') if project.status else 'pending',
+                        'render': getattr(project.status, 'render', 'pending') if project.status else 'pending',
+                        'archived': status_value == 'archived',
+                        'isPinned': is_pinned,
+                        'lastOpenedAt': getattr(project.status, 'lastOpenedAt', None) if project.status else None,
+                    }
+                # title 필드 확정 (없으면 topic을 title로 저장) - 항상 보장
+                if 'title' not in json_data or not json_data.get('title') or json_data.get('title', '').strip() == '':
+                    title_value = json_data.get('topic') or json_data.get('name', '')
+                    if title_value:
+                        json_data['title'] = title_value
+                        print(f"META_TITLE_SET projectId={project_id} title={title_value}")
+                if archived_at:
+                    json_data['archivedAt'] = archived_at
+                json_data['updatedAt'] = now
+
+            # 저장 (임시 파일 + os.replace)
+            pm.update_project_json(project_id, _apply_meta)
             
             print(f"META_WRITE_SUCCESS projectId={project_id} imagesCount={facts['imagesCount']} previewImageUrl={facts['previewImageUrl']}")
+            project_index.invalidate(project_id)
             
             # 저장 후 재읽기 검증
-            with open(json_path, 'r', encoding='utf-8') as f:
-                reloaded = json.load(f)
+            reloaded = json_backend.load_path(json_path)
             print(f"META_AFTER_WRITE projectId={project_id} title={reloaded.get('title') or reloaded.get('topic')} status={reloaded.get('status')} imagesCount={reloaded.get('imagesCount')} previewImageUrl={reloaded.get('previewImageUrl')}")
             
             logger.info(f"[RECONCILE] Meta updated for {project_id}: scenesCount={facts['scenesCount']}, imagesCount={facts['imagesCount']}, previewImageUrl={facts['previewImageUrl']}")
@@ -1519,14 +1602,12 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
     try:
         # needs_update가 True면 이미 json_data가 업데이트되었으므로 다시 읽기
         if needs_update:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                json_data_final = json.load(f)
+            json_data_final = json_backend.load_path(json_path)
         else:
             # needs_update가 False면 현재 json_data 사용
             json_data_final = json_data if 'json_data' in locals() else {}
             if not json_data_final:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    json_data_final = json.load(f)
+                json_data_final = json_backend.load_path(json_path)
         
         project_title = json_data_final.get('title') or json_data_final.get('topic') or json_data_final.get('name', '')
         
@@ -1535,38 +1616,7 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
             project_title = json_data_final.get('topic') or json_data_final.get('name', '')
             json_data_final['title'] = project_title
             json_data_final['updatedAt'] = updated_at
-            try:
-                with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                    json.dump(json_data_final, f, indent=2, ensure_ascii=False)
-            except (UnicodeEncodeError, UnicodeDecodeError) as e:
-                logger.error(f"Unicode error writing project.json (title set) for {project_id}: {e}")
-                # 이모지 제거 후 재시도
-                import re
-                emoji_pattern = re.compile("["
-                    "\U0001F600-\U0001F64F"
-                    "\U0001F300-\U0001F5FF"
-                    "\U0001F680-\U0001F6FF"
-                    "\U0001F700-\U0001F77F"
-                    "\U0001F780-\U0001F7FF"
-                    "\U0001F800-\U0001F8FF"
-                    "\U0001F900-\U0001F9FF"
-                    "\U0001FA00-\U0001FA6F"
-                    "\U0001FA70-\U0001FAFF"
-                    "\u2600-\u26FF"
-                    "\u2700-\u27BF"
-                    "]+", flags=re.UNICODE)
-                def remove_emoji_from_dict(d):
-                    if isinstance(d, dict):
-                        return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                    elif isinstance(d, list):
-                        return [remove_emoji_from_dict(item) for item in d]
-                    elif isinstance(d, str):
-                        return emoji_pattern.sub('', d)
-                    return d
-                json_data_final_no_emoji = remove_emoji_from_dict(json_data_final)
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data_final_no_emoji, f, indent=2, ensure_ascii=False)
-                logger.info(f"project.json saved without emoji (title set) for {project_id}")
+            pm.update_project_json(project_id, lambda d: d.update(title=project_title, updatedAt=updated_at))
             print(f"TITLE_SET projectId={project_id} title={project_title}")
         
         # title이 여전히 비어있으면 project 객체에서 읽기
@@ -1576,38 +1626,7 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
                 # project.json에도 저장
                 json_data_final['title'] = project_title
                 json_data_final['updatedAt'] = updated_at
-                try:
-                    with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                        json.dump(json_data_final, f, indent=2, ensure_ascii=False)
-                except (UnicodeEncodeError, UnicodeDecodeError) as e:
-                    logger.error(f"Unicode error writing project.json (title from project) for {project_id}: {e}")
-                    # 이모지 제거 후 재시도
-                    import re
-                    emoji_pattern = re.compile("["
-                        "\U0001F600-\U0001F64F"
-                        "\U0001F300-\U0001F5FF"
-                        "\U0001F680-\U0001F6FF"
-                        "\U0001F700-\U0001F77F"
-                        "\U0001F780-\U0001F7FF"
-                        "\U0001F800-\U0001F8FF"
-                        "\U0001F900-\U0001F9FF"
-                        "\U0001FA00-\U0001FA6F"
-                        "\U0001FA70-\U0001FAFF"
-                        "\u2600-\u26FF"
-                        "\u2700-\u27BF"
-                        "]+", flags=re.UNICODE)
-                    def remove_emoji_from_dict(d):
-                        if isinstance(d, dict):
-                            return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                        elif isinstance(d, list):
-                            return [remove_emoji_from_dict(item) for item in d]
-                        elif isinstance(d, str):
-                            return emoji_pattern.sub('', d)
-                        return d
-                    json_data_final_no_emoji = remove_emoji_from_dict(json_data_final)
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump(json_data_final_no_emoji, f, indent=2, ensure_ascii=False)
-                    logger.info(f"project.json saved without emoji (title from project) for {project_id}")
+                pm.update_project_json(project_id, lambda d: d.update(title=project_title, updatedAt=updated_at))
                 print(f"TITLE_SET_FROM_PROJECT projectId={project_id} title={project_title}")
         
         # TITLE.txt 업데이트 (항상 최신 제목 유지)
@@ -1641,9 +1660,78 @@ def reconcile_and_persist_meta(project_id: str, force: bool = False) -> Dict[str
     }
 
 
-def _calculate_project_metadata(project: Project, project_id: str) -> Dict[str, Any]:
+# 카탈로그 payload에서 빼는 큰 필드 (목록 응답 시 project.json에서 읽음)
+LISTING_DISK_FIELDS = ('scenes', 'script')
+
+
+def _build_project_index_entry(project_id: str, project_dir: Path) -> Dict[str, Any]:
+    """메타 인덱스 엔트리 생성 (읽기 전용 - project.json/TITLE.txt를 쓰지 않음)"""
+    json_path = project_dir / "project.json"
+    if not json_path.exists():
+        return None
+    json_data = json_backend.load_path(json_path)
+    # 목록/통계는 헤더와 씬 일부 필드만 사용 -> Scene 변환 없이 지연 로딩 뷰로 처리
+    project = ProjectView(json_data)
+    facts = compute_project_facts(project_id, project=project, project_path=project_dir)
+    metadata = _calculate_project_metadata(project, project_id, project_path=project_dir)
+
+    is_archived = bool(getattr(project.status, 'archived', False)) if project.status else False
+    is_pinned = bool(getattr(project.status, 'isPinned', False)) if project.status else False
+    meta = {
+        'id': project_id,
+        'title': json_data.get('title') or json_data.get('topic') or json_data.get('name', ''),
+        'status': 'archived' if is_archived else 'active',
+        'createdAt': project.createdAt,
+        'updatedAt': project.updatedAt,
+        'archivedAt': json_data.get('archivedAt') if is_archived else None,
+        'hasScript': facts['hasScript'],
+        'hasScenesJson': facts['hasScenesJson'],
+        'scenesCount': facts['scenesCount'],
+        'imagesCount': facts['imagesCount'],
+        'previewImageUrl': facts['previewImageUrl'],
+        'hasTts': facts.get('hasTts', False),
+        'ttsCount': facts.get('ttsCount', 0),
+        'hasVideo': facts.get('hasVideo', False),
+        'isPinned': is_pinned,
+    }
+    # 카탈로그 payload: 헤더 + 메타 필드 (KPI/필터와 동일 기준으로 덮어쓰기)
+    # 씬/대본은 넣지 않음 -> fields 없는 목록 요청만 _load_listed_project로 project.json에서 읽음
+    project_dict = project.header.to_dict()
+    for key in LISTING_DISK_FIELDS:
+        project_dict.pop(key, None)
+    project_dict.update({
+        'title': meta['title'] or project_dict.get('topic') or project_dict.get('name', ''),
+        'hasScript': meta['hasScript'],
+        'hasScenesJson': meta['hasScenesJson'],
+        'scenesCount': meta['scenesCount'],
+        'imagesCount': meta['imagesCount'],
+        'previewImageUrl': meta['previewImageUrl'],
+        'status': meta['status'],
+        'archived': is_archived,
+        'archivedAt': meta['archivedAt'],
+        'isPinned': is_pinned,
+        'pinned': is_pinned,
+    })
+    return {'meta': meta, 'project': project_dict, 'metadata': metadata}
+
+
+def _load_listed_project(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """fields 없는 목록 응답용 전체 프로젝트 딕셔너리 (project.json의 씬/대본 + 카탈로그 헤더/메타)"""
+    header = entry.get('project') or entry['meta']
+    json_path = pm.get_project_dir(entry['meta']['id']) / "project.json"
+    try:
+        project_dict = ProjectView(json_backend.load_path(json_path)).to_dict()
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"[API] project.json 읽기 실패, 카탈로그 헤더만 반환: {json_path} ({e})")
+        return header
+    project_dict.update(header)
+    return project_dict
+
+
+def _calculate_project_metadata(project: Project, project_id: str, project_path: Path = None) -> Dict[str, Any]:
     """프로젝트 메타데이터 계산 (진행률, 파일 존재 여부 등) - 레거시 호환"""
-    project_path = pm._get_project_path(project_id)
+    if project_path is None:
+        project_path = pm._get_project_path(project_id)
     
     # 파일 존재 여부 확인
     script_path = project_path / "script.txt"
@@ -1658,15 +1746,14 @@ def _calculate_project_metadata(project: Project, project_id: str) -> Dict[str,
     scenes_count = 0
     if has_scenes_json:
         try:
-            with open(scenes_json_path, 'r', encoding='utf-8') as f:
-                scenes_data = json.load(f)
-                if isinstance(scenes_data, list):
-                    scenes_count = len(scenes_data)
-                elif isinstance(scenes_data, dict) and 'scenes' in scenes_data:
-                    scenes_count = len(scenes_data['scenes'])
-                # scenes.json이 비어있거나 유효하지 않으면 0
-                if scenes_count == 0:
-                    logger.warning(f"[METADATA] scenes.json exists but is empty or invalid for {project_id}")
+            scenes_data = json_backend.load_path(scenes_json_path)
+            if isinstance(scenes_data, list):
+                scenes_count = len(scenes_data)
+            elif isinstance(scenes_data, dict) and 'scenes' in scenes_data:
+                scenes_count = len(scenes_data['scenes'])
+            # scenes.json이 비어있거나 유효하지 않으면 0
+            if scenes_count == 0:
+                logger.warning(f"[METADATA] scenes.json exists but is empty or invalid for {project_id}")
         except Exception as e:
             logger.warning(f"Failed to read scenes.json for scenesCount: {e}")
             scenes_count = 0
@@ -1698,21 +1785,19 @@ def _calculate_project_metadata(project: Project, project_id: str) -> Dict[str,
     
     # 3) 씬 객체의 image_path에서 실제 파일 존재 여부 확인
     scenes_with_valid_images = []
-    if project.scenes:
-        for s in project.scenes:
-            image_path = getattr(s, 'image_path', None) if hasattr(s, 'image_path') else None
-            if image_path and image_path.strip():
-                if image_path.startswith('http'):
-                    # URL인 경우 카운트에 포함 (외부 이미지)
-                    scenes_with_valid_images.append(s)
-                else:
-                    # 상대 경로인 경우 실제 파일 존재 여부 확인
-                    full_path = project_path / image_path
-                    if full_path.exists() and full_path.is_file():
-                        scenes_with_valid_images.append(s)
-                        # all_image_files에 없으면 추가 (중복 방지)
-                        if full_path not in all_image_files:
-                            all_image_files.append(full_path)
+    for image_path in dict.fromkeys(project.scene_values('image_path')):
+        if image_path and image_path.strip():
+            if image_path.startswith('http'):
+                # URL인 경우 카운트에 포함 (외부 이미지)
+                scenes_with_valid_images.append(image_path)
+            else:
+                # 상대 경로인 경우 실제 파일 존재 여부 확인
+                full_path = project_path / image_path
+                if full_path.exists() and full_path.is_file():
+                    scenes_with_valid_images.append(image_path)
+                    # all_image_files에 없으면 추가 (중복 방지)
+                    if full_path not in all_image_files:
+                        all_image_files.append(full_path)
     
     # 실제 파일 개수 계산 (중복 제거)
     unique_image_files = list(set(all_image_files))
@@ -1849,8 +1934,9 @@ def _calculate_project_metadata(project: Project, project_id: str) -> Dict[str,
     
     # 영상 길이 계산 (초)
     duration_seconds = None
-    if project.scenes:
-        total_duration = sum(getattr(s, 'durationSec', 0) or 0 for s in project.scenes)
+    durations = project.scene_values('durationSec')
+    if durations:
+        total_duration = sum(d or 0 for d in durations)
         if total_duration > 0:
             duration_seconds = int(total_duration)
     
@@ -1887,90 +1973,113 @@ def _calculate_project_metadata(project: Project, project_id: str) -> Dict[str,
     }
 
 
+def _bool_arg(name: str) -> Optional[bool]:
+    """쿼리 문자열 boolean 파라미터 (없으면 None, 잘못된 값이면 ValueError)"""
+    value = (request.args.get(name) or '').strip().lower()
+    if not value:
+        return None
+    if value in ('1', 'true', 'yes'):
+        return True
+    if value in ('0', 'false', 'no'):
+        return False
+    raise ValueError(f"{name} must be true or false")
+
+
+def _int_arg(name: str, minimum: int = 0, maximum: Optional[int] = None) -> Optional[int]:
+    """쿼리 문자열 정수 파라미터 (없으면 None, 범위 밖이면 ValueError)"""
+    value = (request.args.get(name) or '').strip()
+    if not value:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if number < minimum or (maximum is not None and number > maximum):
+        raise ValueError(f"{name} must be between {minimum} and {maximum}" if maximum is not None
+                         else f"{name} must be >= {minimum}")
+    return number
+
+
 @app.route('/api/projects', methods=['GET'])
 def list_projects():
-    """모든 프로젝트 나열 (단일 진실 소스: 메타 보정 후 반환)"""
+    """
+    프로젝트 목록 (카탈로그 인덱스 기반 - 프로젝트 폴더 쓰기 없음)
+
+    Query:
+        status: active | archived | all (기본 active)
+        q: 제목 검색 (대소문자 무시 부분 일치)
+        pinned: true | false
+        sort: updatedAt | createdAt | title (기본 updatedAt)
+        order: asc | desc (기본 title은 asc, 그 외 desc)
+        limit, offset: 페이지 (limit 지정 시 응답에 total, nextCursor 포함)
+        cursor: 이전 응답의 nextCursor (키셋 페이지, offset과 함께 쓸 수 없음, limit 생략 시 기본 페이지 크기)
+        fields: 응답 필드 선택 (예: id,title,status,previewImageUrl,counts)
+            카탈로그 컬럼만 사용하므로 project.json/씬 데이터를 읽지 않음
+    """
     request_id = request.headers.get('X-Request-Id', 'N/A')
     print(f"REQ GET {request.path} rid={request_id}")
     
     try:
         # status 필터 파라미터
         status_filter = request.args.get('status', 'active')  # active, archived, all
-        print(f"REQ_PARAMS status={status_filter} rid={request_id}")
-        
-        # 프로젝트 id 목록 enumerate (canonical 규칙 + legacy 제외)
-        project_ids = pm.list_project_ids()
-        projects_list = []
-        
-        logger.info(f"[API] GET /api/projects?status={status_filter} - 총 {len(project_ids)}개 프로젝트 id 발견")
-        print(f"PROJECT_IDS count={len(project_ids)} rid={request_id}")
-        
-        for project_id in project_ids:
-            try:
-                # 메타 보정 및 저장 (단일 진실 소스) - 강제 backfill
-                meta = reconcile_and_persist_meta(project_id, force=True)
-                if not meta:
-                    logger.warning(f"[API] Failed to reconcile meta for {project_id}")
-                    print(f"RECONCILE_FAILED projectId={project_id} rid={request_id}")
-                    continue
-                
-                print(f"RECONCILE_SUCCESS projectId={project_id} imagesCount={meta.get('imagesCount')} previewImageUrl={meta.get('previewImageUrl')} rid={request_id}")
-                
-                # status 필터 적용
-                if status_filter == 'active' and meta['status'] != 'active':
-                    continue
-                elif status_filter == 'archived' and meta['status'] != 'archived':
-                    continue
-                # status_filter == 'all'면 모두 포함
-                
-                # 프로젝트 전체 정보 로드 (선택적, 메타만 필요하면 생략 가능)
-                project = pm.get_project(project_id)
-                if project:
-                    project_dict = project.to_dict()
-                    # 메타 필드로 덮어쓰기 (단일 진실 소스)
-                    # isPinned: meta 우선, 없으면 project_dict.status에서 (reconcile 직후 반영 보장)
-                    status_obj = project_dict.get('status')
-                    is_pinned_val = meta.get('isPinned')
-                    if is_pinned_val is None and isinstance(status_obj, dict):
-                        is_pinned_val = status_obj.get('isPinned', False)
-                    # KPI/필터와 동일 기준: archived, pinned boolean
-                    is_archived = meta['status'] == 'archived'
-                    project_dict.update({
-                        'title': meta.get('title') or project_dict.get('topic') or project_dict.get('name', ''),
-                        'hasScript': meta['hasScript'],
-                        'hasScenesJson': meta['hasScenesJson'],
-                        'scenesCount': meta['scenesCount'],
-                        'imagesCount': meta['imagesCount'],
-                        'previewImageUrl': meta['previewImageUrl'],
-                        'status': meta['status'],
-                        'archived': is_archived,
-                        'archivedAt': meta['archivedAt'],
-                        'isPinned': is_pinned_val if is_pinned_val is not None else False,
-                        'pinned': is_pinned_val if is_pinned_val is not None else False,
-                    })
-                    projects_list.append(project_dict)
-                else:
-                    # project.json이 없어도 메타만 반환 (최소 정보, archived/pinned 정규화)
-                    meta_item = dict(meta)
-                    meta_item['archived'] = meta.get('status') == 'archived'
-                    meta_item['pinned'] = meta.get('isPinned', False)
-                    projects_list.append(meta_item)
-                
-            except Exception as e:
-                logger.error(f"[API] Error processing project {project_id}: {e}")
-                print(f"PROCESS_ERROR projectId={project_id} error={e} rid={request_id}")
-                continue
-        
-        # updatedAt 기준 정렬 (최신순)
-        projects_list.sort(key=lambda p: p.get('updatedAt', ''), reverse=True)
+        search = (request.args.get('q') or '').strip() or None
+        sort = request.args.get('sort', 'updatedAt')
+        order = (request.args.get('order') or ('asc' if sort == 'title' else 'desc')).lower()
+        try:
+            if sort not in SORT_COLUMNS:
+                raise ValueError(f"sort must be one of {', '.join(SORT_COLUMNS)}")
+            if order not in ('asc', 'desc'):
+                raise ValueError("order must be asc or desc")
+            pinned = _bool_arg('pinned')
+            limit = _int_arg('limit', minimum=1, maximum=int(settings.get('projects.catalog.max_page_size', 500)))
+            offset = _int_arg('offset') or 0
+            fields = expand_fields(request.args.get('fields'))
+            after = None
+            cursor = request.args.get('cursor')
+            if cursor:
+                if offset:
+                    raise ValueError("cursor cannot be combined with offset")
+                cursor_sort, cursor_descending, after = decode_cursor(cursor)
+                if (cursor_sort, cursor_descending) != (sort, order == 'desc'):
+                    raise ValueError("cursor does not match sort/order")
+                if limit is None:
+                    limit = int(settings.get('projects.catalog.default_page_size', 50))
+        except ValueError as e:
+            return jsonify({'ok': False, 'error': str(e)}), 400
+        print(f"REQ_PARAMS status={status_filter} q={search} sort={sort} order={order} limit={limit} offset={offset} cursor={bool(after)} fields={fields} rid={request_id}")
+        
+        # 카탈로그 조회 (변경된 프로젝트만 재계산 후 인덱스로 필터/정렬/페이지)
+        # 다음 페이지 존재 여부는 1행 더 읽어서 판단
+        filters = {
+            'status': status_filter, 'search': search, 'pinned': pinned,
+            'sort': sort, 'descending': order == 'desc', 'offset': offset,
+            'limit': None if limit is None else limit + 1, 'after': after, 'payload': fields is None,
+        }
+        if limit is not None:
+            entries, total = project_index.page(**filters)
+        else:
+            entries = project_index.query(**filters)
+            total = len(entries)
+        next_cursor = None
+        if limit is not None and len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(sort, order == 'desc', entries[-1]['key'])
+        if fields is not None:
+            projects_list = [project_fields(entry['meta'], fields) for entry in entries]
+        else:
+            # 씬/대본은 카탈로그에 없으므로 이 페이지의 프로젝트만 project.json에서 읽어 합침
+            projects_list = [_load_listed_project(entry) for entry in entries]
         
-        logger.info(f"[API] GET /api/projects - {len(projects_list)}개 프로젝트 반환 완료 (필터: {status_filter})")
+        logger.info(f"[API] GET /api/projects - {len(projects_list)}/{total}개 프로젝트 반환 완료 (필터: {status_filter})")
         print(f"RESP_SUCCESS count={len(projects_list)} status={status_filter} rid={request_id}")
         
-        return jsonify({
+        response = {
             'ok': True,
             'projects': projects_list
-        }), 200
+        }
+        if limit is not None:
+            response.update({'total': total, 'limit': limit, 'offset': offset, 'nextCursor': next_cursor})
+        return jsonify(response), 200
     except Exception as e:
         print(f"RESP_ERROR error={e} rid={request_id}")
         logger.error(f"프로젝트 목록 조회 실패: {e}")
@@ -1981,52 +2090,25 @@ def list_projects():
 
 @app.route('/api/projects/stats', methods=['GET'])
 def get_project_stats():
-    """프로젝트 통계 (KPI)"""
+    """프로젝트 통계 (KPI) - 카탈로그 집계 (변경된 프로젝트만 재계산)"""
     try:
-        projects = pm.list_projects()
-        
-        total_projects = len(projects)
-        active_projects = 0
-        archived_projects = 0
-        completed_projects = 0
-        scenes_counts = []
-        durations = []
-        
-        for project in projects:
-            metadata = _calculate_project_metadata(project, project.id)
-            
-            if metadata['status'] == 'archived':
-                archived_projects += 1
-            else:
-                active_projects += 1
-            
-            if metadata['hasFinalVideo']:
-                completed_projects += 1
-            
-            if metadata['scenesCount'] > 0:
-                scenes_counts.append(metadata['scenesCount'])
-            
-            if metadata['durationSeconds']:
-                durations.append(metadata['durationSeconds'])
-        
-        # 평균 계산
-        avg_scenes_count = round(sum(scenes_counts) / len(scenes_counts), 1) if scenes_counts else 0
-        avg_duration_seconds = int(sum(durations) / len(durations)) if durations else None
-        
-        return jsonify({
-            'ok': True,
-            'totalProjects': total_projects,
-            'activeProjects': active_projects,
-            'archivedProjects': archived_projects,
-            'completedProjects': completed_projects,
-            'avgScenesCount': avg_scenes_count,
-            'avgDurationSeconds': avg_duration_seconds
-        }), 200
+        return jsonify({'ok': True, **project_index.stats()}), 200
     except Exception as e:
         logger.error(f"프로젝트 통계 조회 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
+@app.route('/api/projects/catalog/rebuild', methods=['POST'])
+def rebuild_project_catalog():
+    """프로젝트 카탈로그를 비우고 디스크에서 다시 구축"""
+    try:
+        count = project_index.build(rebuild=True)
+        return jsonify({'ok': True, 'count': count}), 200
+    except Exception as e:
+        logger.error(f"카탈로그 재구축 실패: {e}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
+
 # ============================================
 # UTILS / AI ENDPOINTS
 # ============================================
@@ -2186,6 +2268,8 @@ def save_scene(project_id):
             return jsonify({'ok': True, 'projectId': project.id, 'updatedAt': project.updatedAt}), 200
         else:
             return jsonify({'ok': False, 'error': 'Failed to save project'}), 500
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         logger.error(f"씬 저장 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -2195,6 +2279,74 @@ def save_scene(project_id):
 # GENERATION ENDPOINTS (PR-3)
 # ============================================
 
+def _build_image_prompt(base_prompt: str, style_id: str = None, characters: list = None):
+    """이미지 프롬프트 합성 (스타일 + 캐릭터 + 씬) -> (raw_prompt, final_prompt)"""
+    final_prompt_parts = []
+    
+    # 1. Style Layer
+    if style_id:
+        style_desc = get_style_prompt(style_id)
+        if style_desc:
+            final_prompt_parts.append(f"Art Style: {style_desc}.")
+    
+    # 2. Character Layer
+    if characters:
+        char_block = format_characters_prompt(characters)
+        if char_block:
+            final_prompt_parts.append(char_block)
+            final_prompt_parts.append("Maintain consistent character appearances as described above.")
+    
+    # 3. Scene Layer
+    final_prompt_parts.append(f"\n[Scene Description]\n{base_prompt}")
+    
+    raw_prompt = "\n".join(final_prompt_parts)
+    return raw_prompt, clamp_prompt_server(raw_prompt, base_prompt)
+
+
+def _image_size_for_aspect(aspect_ratio: str) -> str:
+    """화면비 -> DALL-E 3 이미지 크기"""
+    if aspect_ratio == '16:9':
+        return "1792x1024"
+    if aspect_ratio == '9:16':
+        return "1024x1792"
+    return "1024x1024"  # Default square
+
+
+def _assign_scene_image(project: Project, scene_id, sequence, relative_path: str) -> bool:
+    """씬 image_path 갱신 (scene_id 우선, 없으면 sequence로 찾기) - 갱신 여부 반환"""
+    if not project.scenes:
+        return False
+    # scene_id로 씬 찾기
+    for scene in project.scenes:
+        if str(scene.id) == str(scene_id):
+            scene.image_path = relative_path
+            logger.info(f"Updated scene {scene_id} image_path: {relative_path}")
+            return True
+    
+    # scene_id로 찾지 못한 경우 sequence로 찾기 (fallback)
+    for idx, scene in enumerate(project.scenes):
+        if (scene.sequence if hasattr(scene, 'sequence') else idx + 1) == sequence:
+            scene.image_path = relative_path
+            logger.info(f"Updated scene at sequence {sequence} image_path: {relative_path}")
+            return True
+    return False
+
+
+def _save_scene_image(images_dir: Path, sequence, img_data: bytes) -> str:
+    """이미지 파일 저장 -> 파일명"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"scene_{sequence}_{timestamp}.png"
+    file_path = images_dir / filename
+    # 일괄 생성 시 같은 초에 같은 sequence가 겹치지 않도록
+    if file_path.exists():
+        filename = f"scene_{sequence}_{timestamp}_{uuid4().hex[:6]}.png"
+        file_path = images_dir / filename
+    
+    with open(file_path, 'wb') as f:
+        f.write(img_data)
+    return filename
+
+
 @app.route('/api/projects/<project_id>/generate/image', methods=['POST'])
 def generate_image(project_id):
     """이미지 생성 (DALL-E 3) - Enhanced"""
@@ -2218,10 +2370,11 @@ def generate_image(project_id):
         if not project:
             return jsonify({'ok': False, 'error': 'Project not found'}), 404
             
-        # OpenAI API Key Check
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            return jsonify({'ok': False, 'error': 'OPENAI_API_KEY not found'}), 500
+        # 공급자 (OpenAI 클라이언트 재사용, API Key Check 포함)
+        try:
+            provider = get_image_provider(data.get('provider'))
+        except ValueError as e:
+            return jsonify({'ok': False, 'error': str(e)}), 500
             
         # Assets 디렉토리 준비
         project_dir = pm.get_project_dir(project_id)
@@ -2229,97 +2382,34 @@ def generate_image(project_id):
         images_dir.mkdir(parents=True, exist_ok=True)
         
         # Prompt Synthesis
-        final_prompt_parts = []
-        
-        # 1. Style Layer
-        used_style_name = "None"
-        if style_id:
-            style_desc = get_style_prompt(style_id)
-            if style_desc:
-                final_prompt_parts.append(f"Art Style: {style_desc}.")
-                used_style_name = style_id
-        
-        # 2. Character Layer
-        if characters:
-            char_block = format_characters_prompt(characters)
-            if char_block:
-                final_prompt_parts.append(char_block)
-                final_prompt_parts.append("Maintain consistent character appearances as described above.")
-        
-        # 3. Scene Layer
-        final_prompt_parts.append(f"\n[Scene Description]\n{base_prompt}")
-        
-        raw_prompt = "\n".join(final_prompt_parts)
-        final_prompt = clamp_prompt_server(raw_prompt, base_prompt)
+        raw_prompt, final_prompt = _build_image_prompt(base_prompt, style_id, characters)
         logger.info(f"[IMAGE] Generating scene {scene_index}")
         logger.info(f"[PROMPT_DEBUG_SERVER] sceneId={scene_id} rawLen={len(raw_prompt)} sendLen={len(final_prompt)} rawHead={raw_prompt[:120]} rawTail={raw_prompt[-120:]} send={final_prompt[:200]}")
 
-        # DALL-E 3 호출
-        client = openai.OpenAI(api_key=api_key)
-
         # Aspect Ratio Handling
-        size = "1024x1024"  # Default square
-        if aspect_ratio == '16:9':
-            size = "1792x1024"
-        elif aspect_ratio == '9:16':
-            size = "1024x1792"
-        elif aspect_ratio == '1:1':
-            size = "1024x1024"
+        size = _image_size_for_aspect(aspect_ratio)
 
         logger.info(f"Generating image for scene {scene_index}: {final_prompt[:100]}... (Size: {size})")
 
         try:
-            response = client.images.generate(
-                model="dall-e-3",
-                prompt=final_prompt,
-                size=size,
-                quality="standard",
-                n=1,
-            )
-            
-            image_url = response.data[0].url
-            
-            # 이미지 다운로드 및 저장
-            img_data = requests.get(image_url).content
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"scene_{sequence}_{timestamp}.png"
-            file_path = images_dir / filename
-            
-            with open(file_path, 'wb') as f:
-                f.write(img_data)
+            # DALL-E 3 호출 + 이미지 다운로드 (일괄 생성과 같은 속도 제한/429 재시도 적용)
+            img_data = generate_with_retry(provider, final_prompt, size, get_rate_limiter(),
+                                           max_retries=int(settings.get('image.max_retries', 4) or 4))
+            filename = _save_scene_image(images_dir, sequence, img_data)
                 
             # 상대 경로 (프로젝트 기준 상대 경로)
             relative_path = f"assets/images/{filename}"
             # frontend에서 접근 가능한 URL
             relative_url = f"/api/projects/{project_id}/files/assets/images/{filename}"
             
-            # 씬 객체의 image_path 업데이트
-            scene_updated = False
-            if project.scenes:
-                # scene_id로 씬 찾기
-                for scene in project.scenes:
-                    if str(scene.id) == str(scene_id):
-                        scene.image_path = relative_path
-                        scene_updated = True
-                        logger.info(f"Updated scene {scene_id} image_path: {relative_path}")
-                        break
-                
-                # scene_id로 찾지 못한 경우 sequence로 찾기 (fallback)
-                if not scene_updated:
-                    for idx, scene in enumerate(project.scenes):
-                        if (scene.sequence if hasattr(scene, 'sequence') else idx + 1) == sequence:
-                            scene.image_path = relative_path
-                            scene_updated = True
-                            logger.info(f"Updated scene at sequence {sequence} image_path: {relative_path}")
-                            break
-            
-            # 프로젝트 저장 (씬 업데이트 반영)
-            if scene_updated:
+            # 씬 객체의 image_path 업데이트 후 프로젝트 저장 (생성 중 다른 저장이 있었을 수 있으므로 최신 프로젝트에 반영)
+            def _apply_image(latest):
+                if not _assign_scene_image(latest, scene_id, sequence, relative_path):
+                    return False
                 # updatedAt 갱신
-                project.updatedAt = datetime.now().astimezone().isoformat()
-                pm.save_project(project)
+                latest.updatedAt = datetime.now().astimezone().isoformat()
                 logger.info(f"Project saved with updated scene image_path and updatedAt")
+            pm.modify_project(project_id, _apply_image)
             
             logger.info(f"Image generated and saved: {filename}")
             
@@ -2329,7 +2419,7 @@ def generate_image(project_id):
                 'sceneIndex': scene_index
             }), 200
 
-        except openai.OpenAIError as e:
+        except (openai.OpenAIError, RateLimitedError) as e:
             logger.error(f"OpenAI API Error: {e} | sceneId={scene_id} rawLen={len(raw_prompt)} sendLen={len(final_prompt)}")
             err_str = str(e)
             if "too long" in err_str.lower():
@@ -2342,31 +2432,235 @@ def generate_image(project_id):
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
-def _synthesize_openai_tts(text: str, voice: str, model: str = "gpt-4o-mini-tts") -> bytes:
+@app.route('/api/projects/<project_id>/generate/images', methods=['POST'])
+def generate_images_batch(project_id):
+    """씬 이미지 일괄 생성 (동시 실행 + 속도 제한 + 429 재시도, project.json 1회 저장)
+
+    요청 body:
+        items: [{sceneId, prompt, sequence}, ...]
+        styleId, aspectRatio, characters: 단건 API와 동일 (전체 공통)
+        provider: openai | fake (기본 settings image.provider, fake는 테스트/image.allow_fake_provider 전용)
+        concurrency: 동시 요청 수 (기본 settings image.concurrency, 최대 image.max_concurrency)
+        stream: true(기본)면 NDJSON 스트리밍 (씬별 결과 줄 + 마지막 done 줄)
+
+    스트리밍 중 클라이언트 연결이 끊겨도 남은 씬은 끝까지 생성해 저장
+    """
+    data = request.get_json() or {}
+    items = data.get('items') or []
+    if not isinstance(items, list) or not items:
+        return jsonify({'ok': False, 'error': 'items is required'}), 400
+    for item in items:
+        if not isinstance(item, dict) or not item.get('sceneId') or not item.get('prompt'):
+            return jsonify({'ok': False, 'error': 'each item requires sceneId and prompt'}), 400
+    
+    if not pm.get_project(project_id):
+        return jsonify({'ok': False, 'error': 'Project not found'}), 404
+    
+    requested_provider = str(data.get('provider') or '').strip().lower()
+    if requested_provider == 'fake' and not (app.testing or settings.get('image.allow_fake_provider', False)):
+        return jsonify({'ok': False, 'error': 'fake provider is only available in tests'}), 400
+    try:
+        provider = get_image_provider(requested_provider or None)
+    except ValueError as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    
+    style_id = data.get('styleId')
+    characters = data.get('characters', [])
+    size = _image_size_for_aspect(data.get('aspectRatio', '16:9'))
+    try:
+        concurrency = int(data.get('concurrency') or settings.get('image.concurrency', 4) or 4)
+    except (TypeError, ValueError):
+        return jsonify({'ok': False, 'error': 'concurrency must be an integer'}), 400
+    max_concurrency = int(settings.get('image.max_concurrency', 8) or 8)
+    concurrency = max(1, min(concurrency, max_concurrency))
+    max_retries = int(settings.get('image.max_retries', 4) or 4)
+    bucket = get_rate_limiter()
+    
+    project_dir = pm.get_project_dir(project_id)
+    images_dir = project_dir / 'assets' / 'images'
+    images_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _generate_one(item):
+        scene_id = item['sceneId']
+        sequence = item.get('sequence', 0)
+        _, final_prompt = _build_image_prompt(item['prompt'], style_id, characters)
+        img_data = generate_with_retry(provider, final_prompt, size, bucket, max_retries=max_retries)
+        filename = _save_scene_image(images_dir, sequence, img_data)
+        return {
+            'ok': True,
+            'sceneId': scene_id,
+            'sequence': sequence,
+            'imagePath': f"assets/images/{filename}",
+            'imageUrl': f"/api/projects/{project_id}/files/assets/images/{filename}",
+        }
+    
+    def _save_results(results):
+        """성공 결과를 최신 project.json에 반영 후 1회 저장 - 저장 여부"""
+        succeeded = [r for r in results if r.get('ok')]
+        updated = []
+        if succeeded:
+            def _apply_images(project):
+                updated.extend(r for r in succeeded
+                               if _assign_scene_image(project, r['sceneId'], r['sequence'], r['imagePath']))
+                if not updated:
+                    return False
+                project.updatedAt = datetime.now().astimezone().isoformat()
+
+            pm.modify_project(project_id, _apply_images)
+        logger.info(f"[IMAGE_BATCH] project={project_id} total={len(items)} ok={len(succeeded)} saved={bool(updated)}")
+        return bool(updated)
+    
+    def _run():
+        results = []
+        batch = run_image_batch(items, _generate_one, concurrency=concurrency)
+        try:
+            for result in batch:
+                results.append(result)
+                yield dict(result, type='scene', done=len(results), total=len(items))
+        finally:
+            # 클라이언트 연결 끊김(GeneratorExit)이어도 남은 씬을 마저 받아 저장
+            results.extend(batch)
+            saved = _save_results(results)
+        
+        succeeded = sum(1 for r in results if r.get('ok'))
+        yield {
+            'type': 'done',
+            'ok': succeeded == len(items),
+            'total': len(items),
+            'succeeded': succeeded,
+            'failed': len(items) - succeeded,
+            'saved': saved,
+        }
+    
+    if data.get('stream', True):
+        def _ndjson():
+            events = _run()
+            try:
+                for event in events:
+                    yield json.dumps(event, ensure_ascii=False) + "\n"
+            finally:
+                events.close()
+        return Response(stream_with_context(_ndjson()), mimetype='application/x-ndjson')
+    
+    events = list(_run())
+    summary = events[-1]
+    return jsonify(dict(summary, results=events[:-1])), 200
+
+
+_openai_client = None
+_openai_client_key = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client():
+    """OpenAI 클라이언트 재사용 (API 키가 바뀌면 재생성)"""
+    global _openai_client, _openai_client_key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY is not configured")
-
-    client = openai.OpenAI(api_key=api_key)
-    response = client.audio.speech.create(
+    with _openai_client_lock:
+        if _openai_client is None or _openai_client_key != api_key:
+            _openai_client = openai.OpenAI(api_key=api_key)
+            _openai_client_key = api_key
+        return _openai_client
+
+
+def _synthesize_openai_tts(text: str, voice: str, output_path: Path, model: str = "gpt-4o-mini-tts",
+                           part_path: Path = None) -> int:
+    """OpenAI TTS 스트리밍 합성 -> output_path (청크 단위 기록, 완료 시 원자적 이름 변경)"""
+    client = _get_openai_client()
+    with client.audio.speech.with_streaming_response.create(
         model=model,
         voice=voice,
         input=text,
-    )
+    ) as response:
+        return write_stream(response.iter_bytes(64 * 1024), output_path, part_path=part_path)
+
+
+def _scene_narration(project: Project, scene: Scene) -> str:
+    """TTS 입력 텍스트 (씬 나레이션 우선, 없으면 프로젝트 정보로 fallback)"""
+    narration_sources = [
+        ('narration_ko', scene.narration_ko),
+        ('narration_en', scene.narration_en),
+        ('scene_text', getattr(scene, 'text', None)),
+        ('image_prompt_en', scene.image_prompt_en),
+        ('scene_title', scene.title),
+        ('project_script', project.script),
+        ('project_blueprint_core', project.blueprint.get('coreMessage') if project.blueprint else None),
+        ('project_topic', project.topic),
+    ]
+    for key, value in narration_sources:
+        if value and isinstance(value, str) and value.strip():
+            logger.debug(f"[TTS] narration fallback='{key}' len={len(value.strip())}")
+            return value.strip()
+    return ""
+
+
+def _synthesize_scene_audio(project_id: str, project_dir: Path, scene_id: str, narration: str,
+                            voice: str, format_value: str):
+    """씬 오디오 합성 + 저장 + 길이 측정 -> (project_audio_path, duration)"""
+    project_audio_dir = project_dir / "assets" / "audio"
+    project_audio_dir.mkdir(parents=True, exist_ok=True)
+
+    project_audio_path = project_audio_dir / f"{scene_id}.{format_value}"
+
+    partial_key = (project_id, project_audio_path.name)
+    partial = [None]
+
+    def _synthesize(path: Path):
+        # 합성 중에도 오디오 API가 부분 파일을 제공할 수 있도록 등록
+        part_path = part_path_for(path)
+        partial[0] = register_partial(partial_key, part_path, project_audio_path)
+        _synthesize_openai_tts(narration, voice, path, part_path=part_path)
+
+    # 같은 나레이션/음성은 TTS 캐시에서 하드링크로 재사용 (API 호출 생략)
+    try:
+        duration, _ = synthesize_cached(
+            project_audio_path, narration, _synthesize,
+            lambda path: get_audio_duration(str(path)),
+            provider='openai', model="gpt-4o-mini-tts", voice=voice
+        )
+    except Exception:
+        if partial[0]:
+            finish_partial(partial_key, partial[0], failed=True)
+        raise
+    if partial[0]:
+        finish_partial(partial_key, partial[0])
+    return project_audio_path, duration
 
-    data = None
-    if isinstance(response, (bytes, bytearray)):
-        data = response
-    elif hasattr(response, "read"):
-        data = response.read()
-    elif hasattr(response, "audio"):
-        data = response.audio
-    elif hasattr(response, "content"):
-        data = response.content
 
-    if data is None:
-        raise RuntimeError("OpenAI TTS response missing audio payload")
-    return data
+def _apply_tts_success(project_id: str, project_dir: Path, scene: Scene, project_audio_path: Path,
+                       duration: float, trace_id: str):
+    """TTS 성공 결과를 씬에 반영"""
+    scene.audio_path = str(project_audio_path.relative_to(project_dir).as_posix())
+    scene.ttsStatus = 'success'
+    scene.ttsAudioUrl = f"/api/projects/{project_id}/files/assets/audio/{project_audio_path.name}"
+    scene.ttsTraceId = trace_id
+    scene.ttsError = None
+    scene.ttsUpdatedAt = datetime.now().astimezone().isoformat()
+    scene.durationSec = duration
+
+
+def _apply_tts_failure(scene: Scene, error_msg: str, trace_id: str):
+    """TTS 실패 결과를 씬에 반영"""
+    scene.ttsStatus = 'failed'
+    scene.ttsError = error_msg
+    scene.ttsTraceId = trace_id
+
+
+def _update_scene(project_id: str, scene_id: str, apply) -> bool:
+    """최신 project.json의 씬에 apply(scene)를 반영해 저장 (오래 걸린 작업 결과용) - 반영 여부"""
+    applied = []
+
+    def _mutate(project):
+        scene = next((s for s in project.scenes if s.id == scene_id), None)
+        if scene is None:
+            return False
+        apply(scene)
+        applied.append(scene)
+
+    pm.modify_project(project_id, _mutate)
+    return bool(applied)
 
 
 @app.route('/api/projects/<project_id>/generate/tts', methods=['POST'])
@@ -2424,28 +2718,11 @@ def generate_tts_endpoint(project_id):
         }), 404
 
     scene = project.scenes[scene_idx]
-    narration_sources = [
-        ('narration_ko', scene.narration_ko),
-        ('narration_en', scene.narration_en),
-        ('scene_text', getattr(scene, 'text', None)),
-        ('image_prompt_en', scene.image_prompt_en),
-        ('scene_title', scene.title),
-        ('project_script', project.script),
-        ('project_blueprint_core', project.blueprint.get('coreMessage') if project.blueprint else None),
-        ('project_topic', project.topic),
-    ]
-    narration = ""
-    for key, value in narration_sources:
-        if value and isinstance(value, str) and value.strip():
-            narration = value.strip()
-            logger.debug(f"[TTS] narration fallback='{key}' len={len(narration)}")
-            break
+    narration = _scene_narration(project, scene)
 
     if not narration:
-        scene.ttsStatus = 'failed'
-        scene.ttsError = 'Scene narration is empty'
-        scene.ttsTraceId = trace_id
-        pm.save_project(project)
+        _apply_tts_failure(scene, 'Scene narration is empty', trace_id)
+        _update_scene(project_id, scene_id, lambda s: _apply_tts_failure(s, 'Scene narration is empty', trace_id))
         return jsonify({
             'sceneId': scene_id,
             'status': 'failed',
@@ -2455,34 +2732,15 @@ def generate_tts_endpoint(project_id):
         }), 400
 
     project_dir = pm.get_project_dir(project_id)
-    project_audio_dir = project_dir / "assets" / "audio"
-    project_audio_dir.mkdir(parents=True, exist_ok=True)
-
-    tts_dir = STORAGE_ROOT / project_id / "tts"
-    tts_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{scene_id}.{format_value}"
-    storage_audio_path = tts_dir / filename
-    project_audio_path = project_audio_dir / filename
 
     try:
-        audio_bytes = _synthesize_openai_tts(narration, voice)
-        with open(project_audio_path, 'wb') as out_file:
-            out_file.write(audio_bytes)
-        shutil.copy2(project_audio_path, storage_audio_path)
-
-        duration = get_audio_duration(str(project_audio_path))
-        if duration is None:
-            raise RuntimeError("Failed to measure audio duration")
-
-        scene.audio_path = str(project_audio_path.relative_to(project_dir).as_posix())
-        scene.ttsStatus = 'success'
-        scene.ttsAudioUrl = f"/api/projects/{project_id}/files/assets/audio/{filename}"
-        scene.ttsTraceId = trace_id
-        scene.ttsError = None
-        scene.ttsUpdatedAt = datetime.now().astimezone().isoformat()
-        scene.durationSec = duration
-        project.scenes[scene_idx] = scene
-        pm.save_project(project)
+        project_audio_path, duration = _synthesize_scene_audio(
+            project_id, project_dir, scene_id, narration, voice, format_value
+        )
+        _apply_tts_success(project_id, project_dir, scene, project_audio_path, duration, trace_id)
+        _update_scene(project_id, scene_id, lambda s: _apply_tts_success(
+            project_id, project_dir, s, project_audio_path, duration, trace_id
+        ))
 
         logger.info(f"[TTS] success traceId={trace_id} scene={scene_id} (duration={duration:.2f}s)")
         return jsonify({
@@ -2498,10 +2756,8 @@ def generate_tts_endpoint(project_id):
     except Exception as exc:
         error_type = type(exc).__name__
         error_msg = str(exc) or 'TTS generation failed'
-        scene.ttsStatus = 'failed'
-        scene.ttsError = error_msg
-        scene.ttsTraceId = trace_id
-        pm.save_project(project)
+        _apply_tts_failure(scene, error_msg, trace_id)
+        _update_scene(project_id, scene_id, lambda s: _apply_tts_failure(s, error_msg, trace_id))
         logger.error(f"[TTS] traceId={trace_id} project={project_id} scene={scene_id} voice={voice} format={format_value} speed={speed} error={error_msg}")
         logger.error(traceback.format_exc())
         return jsonify({
@@ -2513,200 +2769,256 @@ def generate_tts_endpoint(project_id):
         }), 500
 
 
+@app.route('/api/projects/<project_id>/generate/tts/batch', methods=['POST'])
+def generate_tts_batch_endpoint(project_id):
+    """여러 씬 TTS 일괄 생성 (동시 합성/길이 측정, project.json 1회 저장)
+
+    요청 body:
+        sceneIds: 대상 씬 id 목록 (없으면 전체 씬)
+        voice, format, speed: 단건 API와 동일
+        concurrency: 동시 합성 수 (기본 settings tts.concurrency, 최대 tts.max_concurrency)
+    응답: 씬별 결과(results) + 성공/실패 개수 (일부 실패 시 ok=false)
+    """
+    batch_trace_id = str(uuid4())
+    data = request.get_json() or {}
+    voice = data.get('voice', 'alloy')
+    format_value = (data.get('format') or 'mp3').lower()
+    try:
+        speed = max(0.7, min(1.3, float(data.get('speed', 1.0))))
+    except (TypeError, ValueError):
+        speed = 1.0
+    try:
+        concurrency = int(data.get('concurrency') or settings.get('tts.concurrency', 4) or 4)
+    except (TypeError, ValueError):
+        return jsonify({'ok': False, 'error': 'concurrency must be an integer', 'traceId': batch_trace_id}), 400
+    max_concurrency = int(settings.get('tts.max_concurrency', 8) or 8)
+    concurrency = max(1, min(concurrency, max_concurrency))
+
+    if format_value not in ('mp3', 'wav'):
+        return jsonify({'ok': False, 'error': 'format must be mp3 or wav', 'traceId': batch_trace_id}), 400
+
+    project = pm.get_project(project_id)
+    if not project:
+        return jsonify({'ok': False, 'error': 'Project not found', 'traceId': batch_trace_id}), 404
+
+    scene_ids = data.get('sceneIds')
+    if scene_ids:
+        scene_by_id = {s.id: s for s in project.scenes}
+        missing = [sid for sid in scene_ids if sid not in scene_by_id]
+        if missing:
+            return jsonify({'ok': False, 'error': f'Scenes not found: {missing}', 'traceId': batch_trace_id}), 404
+        targets = [scene_by_id[sid] for sid in dict.fromkeys(scene_ids)]
+    else:
+        targets = list(project.scenes)
+    if not targets:
+        return jsonify({'ok': False, 'error': 'No scenes to synthesize', 'traceId': batch_trace_id}), 400
+
+    logger.info(f"[TTS_BATCH] traceId={batch_trace_id} project={project_id} scenes={len(targets)} concurrency={concurrency}")
+    project_dir = pm.get_project_dir(project_id)
+
+    def _synthesize(scene):
+        trace_id = str(uuid4())
+        narration = _scene_narration(project, scene)
+        if not narration:
+            return {'sceneId': scene.id, 'status': 'failed', 'error': 'Scene narration is empty',
+                    'type': 'BadRequest', 'traceId': trace_id}
+        try:
+            audio_path, duration = _synthesize_scene_audio(
+                project_id, project_dir, scene.id, narration, voice, format_value
+            )
+            return {'sceneId': scene.id, 'status': 'success', 'audioFile': audio_path,
+                    'durationSec': duration, 'traceId': trace_id}
+        except Exception as exc:
+            logger.error(f"[TTS_BATCH] traceId={trace_id} scene={scene.id} error={exc}")
+            return {'sceneId': scene.id, 'status': 'failed', 'error': str(exc) or 'TTS generation failed',
+                    'type': type(exc).__name__, 'traceId': trace_id}
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(targets)), thread_name_prefix="tts-batch") as executor:
+        outcomes = list(executor.map(_synthesize, targets))
+
+    # 최신 project.json에 모든 결과 반영 후 1회 저장 (잠금 안에서 다시 읽으므로 합성 중 다른 저장과 충돌 없음)
+    def _apply_outcomes(latest):
+        latest_by_id = {s.id: s for s in latest.scenes}
+        for outcome in outcomes:
+            scene = latest_by_id.get(outcome['sceneId'])
+            if scene is None:
+                continue
+            if outcome['status'] == 'success':
+                _apply_tts_success(project_id, project_dir, scene, outcome['audioFile'],
+                                   outcome['durationSec'], outcome['traceId'])
+            else:
+                _apply_tts_failure(scene, outcome['error'], outcome['traceId'])
+    pm.modify_project(project_id, _apply_outcomes)
+
+    results = []
+    for outcome in outcomes:
+        result = {k: v for k, v in outcome.items() if k != 'audioFile'}
+        if outcome['status'] == 'success':
+            result.update({
+                'audioUrl': f"/api/projects/{project_id}/files/assets/audio/{outcome['audioFile'].name}",
+                'audioPath': outcome['audioFile'].relative_to(project_dir).as_posix(),
+                'speed': speed,
+            })
+        results.append(result)
+
+    succeeded = sum(1 for r in results if r['status'] == 'success')
+    logger.info(f"[TTS_BATCH] traceId={batch_trace_id} done ok={succeeded} failed={len(results) - succeeded}")
+    return jsonify({
+        'ok': succeeded == len(results),
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'results': results,
+        'traceId': batch_trace_id
+    }), 200
+
+
+def _start_render(project_id: str, kind: str):
+    """렌더 요청 공통 처리 (render_preview/render_final)
+
+    요청 body:
+        engine: segments | single_pass (기본 settings render.engine)
+        subtitles: 자막 번인 여부 (final 전용, 기본 프로젝트 subtitles.enabled)
+        async: 기본 true (settings render.async) - 작업 큐에 등록 후 202 + jobId 즉시 반환,
+               /api/render/jobs/<jobId>로 진행률 폴링. false면 요청 스레드에서 동기 렌더 후 200
+        trimSilence: 씬 오디오 앞뒤 무음 정리 후 렌더 (기본 settings render.trim_silence.enabled)
+    """
+    project = pm.get_project(project_id)
+    if not project:
+        return jsonify({'ok': False, 'error': 'Project not found'}), 404
+    
+    # 씬에 image_path와 audio_path가 있는지 확인
+    valid_scenes = [s for s in project.scenes if s.image_path and s.audio_path]
+    if not valid_scenes:
+        return jsonify({'ok': False, 'error': 'No scenes with both image and audio'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    try:
+        engine = resolve_render_engine(data)
+    except ValueError as e:
+        return jsonify({'ok': False, 'error': str(e)}), 400
+    
+    project_dir = pm.get_project_dir(project_id)
+    srt_path = resolve_subtitles_path(project, project_dir, data) if kind == 'final' else None
+    trim_silence = resolve_trim_silence(data)
+    
+    if bool(data.get('async', settings.get('render.async', True))):
+        job = render_jobs.submit(project_id, kind, engine=engine, srt_path=srt_path, trim_silence=trim_silence)
+        return jsonify({'ok': True, 'jobId': job['id'], 'job': job}), 202
+    
+    renders_dir = project_dir / 'renders'
+    renders_dir.mkdir(parents=True, exist_ok=True)
+    output_name, temp_prefix, concat_list_name, profile_name = RENDER_TARGETS[kind]
+    output_video = renders_dir / output_name
+    
+    # 씬별 임시 비디오 병렬 생성 후 순서대로 concat (또는 단일 패스)
+    try:
+        render_project_video(project, project_dir, output_video, temp_prefix, concat_list_name,
+                             engine=engine, srt_path=srt_path, profile=get_encode_profile(profile_name),
+                             trim_silence=trim_silence)
+    except ValueError as e:
+        return jsonify({'ok': False, 'error': str(e)}), 400
+    except SegmentRenderError as e:
+        logger.error(f"씬 렌더링 실패: {e.scene_id}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    except RuntimeError as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    
+    if not output_video.exists():
+        error = 'Preview video not created' if kind == 'preview' else 'Video creation failed'
+        return jsonify({'ok': False, 'error': error}), 500
+    
+    return jsonify({'ok': True, 'videoPath': f'renders/{output_name}'}), 200
+
+
 @app.route('/api/projects/<project_id>/render/preview', methods=['POST'])
 def render_preview(project_id):
     """미리보기 렌더링 (모든 씬 병합) - PR-4"""
     try:
-        # 프로젝트 로드
-        project = pm.get_project(project_id)
-        if not project:
-            return jsonify({'ok': False, 'error': 'Project not found'}), 404
-        
-        # 씬에 image_path와 audio_path가 있는지 확인
-        valid_scenes = [s for s in project.scenes if s.image_path and s.audio_path]
-        if not valid_scenes:
-            return jsonify({'ok': False, 'error': 'No scenes with both image and audio'}), 400
-        
-        project_dir = pm.get_project_dir(project_id)
-        renders_dir = project_dir / 'renders'
-        renders_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_video = renders_dir / 'preview.mp4'
-        
-        # 각 씬별로 임시 비디오 생성 후 concat
-        import subprocess
-        from pathlib import Path
-        from src.common.settings import settings
-        
-        temp_videos = []
-        concat_file_path = renders_dir / 'concat_list.txt'
-        
-        try:
-            for idx, scene in enumerate(valid_scenes):
-                image_file = project_dir / scene.image_path
-                audio_file = project_dir / scene.audio_path
-                
-                # 파일 존재 확인
-                if not image_file.exists() or not audio_file.exists():
-                    logger.warning(f"씬 파일 없음: {scene.id}")
-                    continue
-                
-                # 임시 비디오 파일
-                temp_video = renders_dir / f'temp_scene_{idx}.mp4'
-                temp_videos.append(temp_video)
-                
-                # render_video_simple 호출
-                success = render_video_simple(
-                    image_path=str(image_file),
-                    audio_path=str(audio_file),
-                    output_path=str(temp_video),
-                    width=int(project.settings.video.width) if hasattr(project, 'settings') else 1280,
-                    height=int(project.settings.video.height) if hasattr(project, 'settings') else 720,
-                    fps=int(project.settings.video.fps) if hasattr(project, 'settings') else 30
-                )
-                
-                if not success or not temp_video.exists():
-                    logger.error(f"씬 렌더링 실패: {scene.id}")
-                    return jsonify({'ok': False, 'error': f'Failed to render scene {scene.id}'}), 500
-                
-                logger.info(f"씬 렌더링 완료: {scene.id}")
-            
-            if not temp_videos:
-                return jsonify({'ok': False, 'error': 'No scenes to render'}), 400
-            
-            # 비디오 concat
-            if len(temp_videos) == 1:
-                # 단일 비디오면 복사
-                import shutil
-                shutil.copy(str(temp_videos[0]), str(output_video))
-            else:
-                # 다중 비디오 concat
-                with open(concat_file_path, 'w', encoding='utf-8') as f:
-                    for temp_video in temp_videos:
-                        f.write(f"file '{temp_video.name}'\n")
-                
-                ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
-                concat_cmd = [
-                    ffmpeg_path,
-                    '-y',
-                    '-f', 'concat',
-                    '-safe', '0',
-                    '-i', str(concat_file_path),
-                    '-c', 'copy',
-                    str(output_video)
-                ]
-                
-                result = subprocess.run(
-                    concat_cmd,
-                    capture_output=True,
-                    timeout=300
-                )
-                
-                if result.returncode != 0:
-                    logger.error(f"Concat 실패: {result.stderr.decode()}")
-                    return jsonify({'ok': False, 'error': 'Failed to concat videos'}), 500
-            
-            # 임시 파일 정리
-            for temp_video in temp_videos:
-                if temp_video.exists():
-                    temp_video.unlink()
-            
-            if concat_file_path.exists():
-                concat_file_path.unlink()
-            
-            if not output_video.exists():
-                return jsonify({'ok': False, 'error': 'Preview video not created'}), 500
-            
+        response = _start_render(project_id, 'preview')
+        if response[1] == 200:
             logger.info(f"미리보기 렌더링 완료: {project_id}")
-            
-            return jsonify({
-                'ok': True,
-                'videoPath': 'renders/preview.mp4'
-            }), 200
-            
-        except Exception as e:
-            # 임시 파일 정리
-            for temp_video in temp_videos:
-                if temp_video.exists():
-                    try:
-                        temp_video.unlink()
-                    except:
-                        pass
-            raise e
-        
+        return response
     except Exception as e:
         logger.error(f"미리보기 렌더링 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
+@app.route('/api/render/jobs/<job_id>', methods=['GET'])
+def get_render_job(job_id):
+    """비동기 렌더 작업 상태/진행률 조회"""
+    job = render_jobs.get(job_id)
+    if not job:
+        return jsonify({'ok': False, 'error': 'Render job not found'}), 404
+    return jsonify({'ok': True, 'job': job}), 200
+
+
+@app.route('/api/projects/<project_id>/render/jobs', methods=['GET'])
+def list_render_jobs(project_id):
+    """프로젝트의 비동기 렌더 작업 목록 (최신순)"""
+    return jsonify({'ok': True, 'jobs': render_jobs.list(project_id)}), 200
+
+
+def _scene_silence_timeline(audio_path: str, trim_silence: bool):
+    """씬 오디오 무음 분석 (trim_silence면 렌더와 같은 구간으로 앞뒤 무음을 잘라낸 타임라인 기준)"""
+    analysis = analyze_silence(audio_path)
+    if analysis is None or not trim_silence:
+        return analysis
+    pad, threshold_db, min_silence = get_trim_params()
+    edges = analyze_silence(audio_path, threshold_db=threshold_db, min_silence=min_silence)
+    bounds = edge_trim_bounds(edges, pad) if edges is not None else None
+    if bounds is None:
+        return analysis
+    return analysis.clip(*bounds)
+
+
 @app.route('/api/projects/<project_id>/generate/srt', methods=['POST'])
 def generate_srt_endpoint(project_id):
-    """SRT 자막 생성 - PR-5"""
+    """SRT 자막 생성 - PR-5
+
+    요청 body:
+        trimSilence: 앞뒤 무음을 잘라 렌더할 영상 기준 타이밍 (기본 settings render.trim_silence.enabled)
+    """
     try:
         # 프로젝트 로드
         project = pm.get_project(project_id)
         if not project:
             return jsonify({'ok': False, 'error': 'Project not found'}), 404
+        trim_silence = resolve_trim_silence(request.get_json(silent=True) or {})
         
         # 씬에서 나레이션과 duration이 있는지 확인
         valid_scenes = [s for s in project.scenes if s.narration_ko and s.durationSec]
         if not valid_scenes:
             return jsonify({'ok': False, 'error': 'No scenes with narration and duration'}), 400
         
-        # SRT 콘텐츠 생성
-        srt_lines = []
+        # 씬별 cue 계산 (씬 오디오의 쉼 위치 기준, 분석 불가 시 글자 수 가중 분배)
+        project_dir = pm.get_project_dir(project_id)
+        cues = []
         cumulative_time = 0.0
         
-        for idx, scene in enumerate(valid_scenes):
-            narration = scene.narration_ko.strip()
-            duration = scene.durationSec
-            
-            if not narration:
+        for scene in project.scenes:
+            if not scene.durationSec:
                 continue
-            
+            narration = (scene.narration_ko or '').strip()
             # 문장 분할 (한문장씩 또는 마침표 기준)
-            sentences = split_sentences_ko(narration, max_length=100)
-            
-            if not sentences:
-                continue
-            
-            # 각 문장을 균등하게 분배
-            sentence_duration = duration / len(sentences)
-            
-            for sent_idx, sentence in enumerate(sentences):
-                start_time = cumulative_time + (sent_idx * sentence_duration)
-                end_time = cumulative_time + ((sent_idx + 1) * sentence_duration)
-                
-                # 마지막 문장은 정확히 씬 끝시간으로
-                if sent_idx == len(sentences) - 1:
-                    end_time = cumulative_time + duration
-                
-                # SRT 인덱스 (전체 문장 번호)
-                srt_idx = len(srt_lines) // 4 + 1  # 임시 계산, 아래서 재계산
-                srt_lines.append(str(srt_idx))
-                srt_lines.append(f"{format_timestamp(start_time)} --> {format_timestamp(end_time)}")
-                srt_lines.append(sentence)
-                srt_lines.append("")  # 빈 줄
-            
-            cumulative_time += duration
-        
-        # 최종 SRT 인덱스 재계산
-        final_srt = []
-        srt_idx = 1
-        i = 0
-        while i < len(srt_lines):
-            if srt_lines[i] and srt_lines[i][0].isdigit():
-                # 이전 인덱스를 새 인덱스로 변경
-                final_srt.append(str(srt_idx))
-                srt_idx += 1
-            else:
-                final_srt.append(srt_lines[i])
-            i += 1
-        
-        srt_content = "\n".join(final_srt)
+            sentences = split_sentences_ko(narration, max_length=100) if narration else []
+            analysis = None
+            # 무음 정리 렌더는 나레이션 없는 씬도 잘린 길이를 차지하므로 함께 분석
+            if (sentences or trim_silence) and scene.audio_path and (project_dir / scene.audio_path).exists():
+                analysis = _scene_silence_timeline(str(project_dir / scene.audio_path), trim_silence)
+            # 씬 길이: 무음 정리 시 잘린 오디오 길이, 아니면 durationSec (원본 오디오 길이)
+            scene_duration = analysis.duration if (trim_silence and analysis) else scene.durationSec
+            cues.extend(time_sentences(
+                sentences, scene_duration, offset=cumulative_time,
+                pauses=analysis.pauses() if analysis else None,
+                speech_span=analysis.speech_bounds() if analysis else None,
+            ))
+            # 나레이션 없는 씬도 영상 시간은 차지하므로 누적
+            cumulative_time += scene_duration
+        
+        srt_content = cues_to_srt(cues)
         
         # 파일 저장
-        project_dir = pm.get_project_dir(project_id)
         subtitles_dir = project_dir / 'assets' / 'subtitles'
         subtitles_dir.mkdir(parents=True, exist_ok=True)
         srt_path = subtitles_dir / 'subtitles.srt'
@@ -2730,6 +3042,8 @@ def generate_srt_endpoint(project_id):
             'srtPath': 'assets/subtitles/subtitles.srt'
         }), 200
         
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         import traceback
         tb_str = traceback.format_exc()
@@ -2750,13 +3064,19 @@ def generate_srt_endpoint(project_id):
 
 @app.route('/api/projects/<project_id>/settings/bgm', methods=['PATCH'])
 def update_bgm_settings(project_id):
-    """BGM 설정 업데이트 - PR-5"""
+    """BGM 설정 업데이트 - PR-5
+
+    body에 revision이 있으면 디스크 revision과 다를 때 409
+    """
     try:
         data = request.get_json() or {}
         
         project = pm.get_project(project_id)
         if not project:
             return jsonify({'ok': False, 'error': 'Project not found'}), 404
+        conflict = _check_revision(project_id, data, project)
+        if conflict:
+            return conflict
         
         # BGM 설정 업데이트
         if 'enabled' in data:
@@ -2775,6 +3095,8 @@ def update_bgm_settings(project_id):
             'project': project.to_dict()
         }), 200
         
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         logger.error(f"BGM 설정 업데이트 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -2822,6 +3144,8 @@ def upload_bgm(project_id):
             'bgmPath': f'assets/bgm/{bgm_filename}'
         }), 200
         
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         logger.error(f"BGM 업로드 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -2831,100 +3155,10 @@ def upload_bgm(project_id):
 def render_final(project_id):
     """최종 렌더링 (BGM + 자막 포함) - PR-5"""
     try:
-        import subprocess
-        from pathlib import Path
-        from src.common.settings import settings as src_settings
-        
-        project = pm.get_project(project_id)
-        if not project:
-            return jsonify({'ok': False, 'error': 'Project not found'}), 404
-        
-        # 렌더 가능한 씬 확인
-        valid_scenes = [s for s in project.scenes if s.image_path and s.audio_path]
-        if not valid_scenes:
-            return jsonify({'ok': False, 'error': 'No scenes with both image and audio'}), 400
-        
-        project_dir = pm.get_project_dir(project_id)
-        renders_dir = project_dir / 'renders'
-        renders_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_video = renders_dir / 'final.mp4'
-        
-        # 1단계: 각 씬별 임시 비디오 생성
-        temp_videos = []
-        concat_file_path = renders_dir / 'concat_list_final.txt'
-        
-        try:
-            for idx, scene in enumerate(valid_scenes):
-                image_file = project_dir / scene.image_path
-                audio_file = project_dir / scene.audio_path
-                
-                if not image_file.exists() or not audio_file.exists():
-                    logger.warning(f"씬 파일 없음: {scene.id}")
-                    continue
-                
-                temp_video = renders_dir / f'temp_final_scene_{idx}.mp4'
-                temp_videos.append(temp_video)
-                
-                success = render_video_simple(
-                    image_path=str(image_file),
-                    audio_path=str(audio_file),
-                    output_path=str(temp_video),
-                    width=int(project.settings.video.width),
-                    height=int(project.settings.video.height),
-                    fps=int(project.settings.video.fps)
-                )
-                
-                if not success or not temp_video.exists():
-                    logger.error(f"씬 렌더링 실패: {scene.id}")
-                    return jsonify({'ok': False, 'error': f'Failed to render scene {scene.id}'}), 500
-            
-            if not temp_videos:
-                return jsonify({'ok': False, 'error': 'No scenes to render'}), 400
-            
-            # 2단계: 비디오 concat
-            if len(temp_videos) == 1:
-                import shutil
-                shutil.copy(str(temp_videos[0]), str(output_video))
-            else:
-                with open(concat_file_path, 'w', encoding='utf-8') as f:
-                    for temp_video in temp_videos:
-                        f.write(f"file '{temp_video.name}'\n")
-                
-                ffmpeg_path = src_settings.get('FFMPEG_PATH', 'ffmpeg')
-                concat_cmd = [
-                    ffmpeg_path, '-y', '-f', 'concat', '-safe', '0',
-                    '-i', str(concat_file_path), '-c', 'copy', str(output_video)
-                ]
-                
-                result = subprocess.run(concat_cmd, capture_output=True, timeout=300)
-                if result.returncode != 0:
-                    logger.error(f"Concat 실패: {result.stderr.decode()}")
-                    return jsonify({'ok': False, 'error': 'Failed to concat videos'}), 500
-            
-            # 임시 파일 정리
-            for temp_video in temp_videos:
-                if temp_video.exists():
-                    temp_video.unlink()
-            if concat_file_path.exists():
-                concat_file_path.unlink()
-            
-            if not output_video.exists():
-                return jsonify({'ok': False, 'error': 'Video creation failed'}), 500
-            
+        response = _start_render(project_id, 'final')
+        if response[1] == 200:
             logger.info(f"최종 렌더링 완료: {project_id}")
-            
-            return jsonify({'ok': True, 'videoPath': 'renders/final.mp4'}), 200
-            
-        except Exception as e:
-            for temp_video in temp_videos:
-                if temp_video.exists():
-                    try:
-                       temp_video.unlink()
-                    except:
-                        pass
-            raise e
-        
+        return response
     except Exception as e:
         logger.error(f"최종 렌더링 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -3056,6 +3290,8 @@ def generate_thumbnail(project_id):
         
         return jsonify({'ok': True, 'thumbnailPath': 'assets/thumbnails/thumbnail.png'}), 200
         
+    except ProjectConflictError as e:
+        return _conflict_response(e)
     except Exception as e:
         logger.error(f"썸네일 생성 실패: {e}")
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -3306,6 +3542,12 @@ def server_error(error):
     }), 500
 
 
+@app.errorhandler(ProjectConflictError)
+def project_conflict(error):
+    """다른 요청이 먼저 저장한 프로젝트를 덮어쓰려 함 -> 409"""
+    return _conflict_response(error)
+
+
 @app.errorhandler(Exception)
 def handle_exception(e):
     """모든 예외를 JSON으로 반환 (HTML 에러 페이지 방지)"""
@@ -3347,6 +3589,19 @@ def after_request(response):
     return response
 
 
+# 메타 인덱스 초기 구축 (모든 함수 정의 이후) + 폴더 감시 시작
+try:
+    _migrate_storage_tts()
+except Exception as migrate_error:
+    logger.error(f"[TTS_MIGRATE] failed: {migrate_error}")
+
+try:
+    project_index.build()
+    project_index.set_watcher_driven(project_watcher.start() is not None)
+except Exception as index_error:
+    logger.error(f"[INDEX] initial build failed: {index_error}")
+
+
 if __name__ == '__main__':
     try:
         logger.info("Flask 서버 시작 (포트 5000)")
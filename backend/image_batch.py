@@ -0,0 +1,225 @@
+"""씬 이미지 일괄 생성 (동시 실행 + 토큰 버킷 속도 제한 + 429 재시도)"""
+import hashlib
+import io
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from src.common.logger import logger
+from src.common.settings import settings
+
+
+class RateLimitedError(Exception):
+    """공급자 429 응답 (retry_after: 서버가 알려준 대기 시간, 초)"""
+
+    def __init__(self, message: str = "rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (스레드 안전)
+
+    - rate_per_sec 속도로 토큰 충전, 최대 capacity개까지 누적(버스트)
+    - pause(seconds): 429 수신 시 모든 작업자가 함께 대기하도록 충전 중단
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        self.rate = max(1e-6, float(rate_per_sec))
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰 1개 획득 (없으면 대기, timeout 초과 시 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = max(self._paused_until - now, (1.0 - self._tokens) / self.rate, 0.01)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """seconds 동안 토큰 지급 중단 (버킷 비움)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class OpenAIImageProvider:
+    """DALL-E 이미지 공급자 (클라이언트/HTTP 세션 재사용)"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str = "dall-e-3", quality: str = "standard"):
+        import openai
+        import requests
+        self._openai = openai
+        self.client = openai.OpenAI(api_key=api_key)
+        self.session = requests.Session()
+        self.model = model
+        self.quality = quality
+
+    def generate(self, prompt: str, size: str) -> bytes:
+        """이미지 생성 후 PNG 바이트 반환 (429는 RateLimitedError)"""
+        try:
+            response = self.client.images.generate(
+                model=self.model,
+                prompt=prompt,
+                size=size,
+                quality=self.quality,
+                n=1,
+            )
+        except self._openai.RateLimitError as e:
+            retry_after = None
+            try:
+                retry_after = float(e.response.headers.get('retry-after'))
+            except (AttributeError, TypeError, ValueError):
+                pass
+            raise RateLimitedError(str(e), retry_after) from e
+
+        image_url = response.data[0].url
+        resp = self.session.get(image_url, timeout=60)
+        if resp.status_code == 429:
+            raise RateLimitedError("image download rate limited")
+        resp.raise_for_status()
+        return resp.content
+
+
+class FakeImageProvider:
+    """오프라인 테스트용 공급자 (프롬프트 해시 색상의 단색 PNG)
+
+    Args:
+        latency: 호출당 지연 (초)
+        rate_limit_every: N번째 호출마다 429 발생 (0이면 없음)
+        fail_prompts: 이 문자열이 포함된 프롬프트는 실패
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.05, rate_limit_every: int = 0, fail_prompts: Optional[List[str]] = None):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.fail_prompts = fail_prompts or []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, size: str) -> bytes:
+        with self._lock:
+            self.calls += 1
+            call_no = self.calls
+        time.sleep(self.latency)
+        if self.rate_limit_every and call_no % self.rate_limit_every == 0:
+            raise RateLimitedError("fake rate limit", retry_after=0.05)
+        if any(marker in prompt for marker in self.fail_prompts):
+            raise RuntimeError("fake provider failure")
+
+        from PIL import Image
+        width, height = (int(v) // 8 for v in size.split('x'))
+        digest = hashlib.md5(prompt.encode('utf-8')).digest()
+        buf = io.BytesIO()
+        Image.new('RGB', (width, height), color=(digest[0], digest[1], digest[2])).save(buf, format='PNG')
+        return buf.getvalue()
+
+
+_provider_lock = threading.Lock()
+_openai_provider: Optional[OpenAIImageProvider] = None
+_openai_provider_key: Optional[str] = None
+_rate_limiter: Optional[TokenBucket] = None
+
+
+def get_image_provider(name: Optional[str] = None):
+    """이미지 공급자 조회 (name > settings image.provider > openai)
+
+    openai 공급자는 API 키가 바뀌지 않는 한 프로세스 내에서 재사용
+    """
+    global _openai_provider, _openai_provider_key
+    name = (name or settings.get('image.provider', 'openai') or 'openai').lower()
+    if name == 'fake':
+        return FakeImageProvider(latency=float(settings.get('image.fake_latency', 0.05)))
+    if name != 'openai':
+        raise ValueError(f"Unknown image provider: {name}")
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError('OPENAI_API_KEY not found')
+    with _provider_lock:
+        if _openai_provider is None or _openai_provider_key != api_key:
+            _openai_provider = OpenAIImageProvider(api_key, model=settings.get('image.model', 'dall-e-3'))
+            _openai_provider_key = api_key
+        return _openai_provider
+
+
+def get_rate_limiter() -> TokenBucket:
+    """프로세스 공용 이미지 생성 속도 제한기 (여러 일괄 요청이 같은 한도를 공유)"""
+    global _rate_limiter
+    with _provider_lock:
+        if _rate_limiter is None:
+            per_minute = float(settings.get('image.rate_per_minute', 15) or 15)
+            burst = float(settings.get('image.burst', 3) or 3)
+            _rate_limiter = TokenBucket(per_minute / 60.0, burst)
+        return _rate_limiter
+
+
+def generate_with_retry(provider, prompt: str, size: str, bucket: TokenBucket,
+                        max_retries: int = 4, base_delay: float = 2.0) -> bytes:
+    """속도 제한 하에서 생성, 429는 지수 백오프(+지터)로 재시도
+
+    429 수신 시 버킷 전체를 멈춰 다른 작업자도 함께 물러나도록 함
+    """
+    attempt = 0
+    while True:
+        bucket.acquire()
+        try:
+            return provider.generate(prompt, size)
+        except RateLimitedError as e:
+            if attempt >= max_retries:
+                raise
+            delay = e.retry_after if e.retry_after is not None else base_delay * (2 ** attempt)
+            delay += random.uniform(0, delay * 0.25)
+            logger.warning(f"[IMAGE_BATCH] rate limited, retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            bucket.pause(delay)
+            attempt += 1
+
+
+def run_image_batch(
+    items: List[Dict[str, Any]],
+    generate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    concurrency: int = 4
+) -> Iterator[Dict[str, Any]]:
+    """
+    항목별 generate(item)을 동시 실행하고 완료 순서대로 결과 반환
+
+    generate는 결과 dict를 반환하며, 예외는 {'ok': False, 'error': ...} 결과로 변환
+    """
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items))),
+                            thread_name_prefix="image-batch") as executor:
+        futures = {executor.submit(generate, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                logger.error(f"[IMAGE_BATCH] sceneId={item.get('sceneId')} failed: {e}")
+                yield {'ok': False, 'sceneId': item.get('sceneId'), 'sequence': item.get('sequence'), 'error': str(e)}
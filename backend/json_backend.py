@@ -0,0 +1,170 @@
+"""JSON 인코딩/디코딩 백엔드 (orjson 설치 시 빠른 경로, 없으면 표준 json)
+
+- 파일: dumps()/load_path()는 bytes 기준 (project.json, scenes.json 등)
+- 응답: FastJSONProvider (Flask jsonify 인코딩, 기본 provider와 같은 정렬/default 규칙)
+- 설정: storage.json.backend (auto | orjson | json), storage.json.compact (디스크 저장 시 들여쓰기 생략),
+  storage.json.check_non_finite (NaN/Infinity 검사, 기본 끔)
+
+orjson이 처리하지 못하는 값(64비트 초과 정수, 잘못된 서로게이트 문자 등)은 표준 json으로 다시 시도
+orjson은 NaN/Infinity를 null로 기록함. 씬 시간 값은 모델(backend.models)에서 들어올 때/저장할 때 None으로 정리하므로
+인코딩마다 전체를 다시 훑지 않음. check_non_finite를 켜면 null이 나온 경우에만 원본을 검사해 표준 json 사용
+"""
+import json
+import math
+from pathlib import Path
+from typing import Any, Optional, Union
+from src.common.logger import logger
+from src.common.settings import settings
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json만 사용
+    orjson = None
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # Flask 2.2 미만
+    DefaultJSONProvider = None
+
+
+_warned_missing = False
+
+
+def use_orjson() -> bool:
+    """현재 설정에서 orjson 경로 사용 여부"""
+    global _warned_missing
+    backend = str(settings.get('storage.json.backend', 'auto')).lower()
+    if backend == 'json':
+        return False
+    if orjson is None:
+        if backend == 'orjson' and not _warned_missing:
+            _warned_missing = True
+            logger.warning("storage.json.backend=orjson 이지만 orjson이 설치되지 않음 -> 표준 json 사용")
+        return False
+    return True
+
+
+def backend_name() -> str:
+    return 'orjson' if use_orjson() else 'json'
+
+
+def is_compact() -> bool:
+    """디스크 저장 시 압축 형식 사용 여부 (기본: indent=2)"""
+    return bool(settings.get('storage.json.compact', False))
+
+
+def check_non_finite() -> bool:
+    """orjson 출력의 NaN/Infinity 손실 검사 여부 (storage.json.check_non_finite, 기본 끔)"""
+    return bool(settings.get('storage.json.check_non_finite', False))
+
+
+def has_non_finite(data: Any) -> bool:
+    """dict/list/tuple 안에 NaN/Infinity float가 있는지"""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
+
+def _orjson_lossy(data: Any, encoded: bytes) -> bool:
+    """orjson 출력이 표준 json과 달라지는지 (검사를 켠 경우, null이 있을 때만 원본의 비유한 float 확인)"""
+    return check_non_finite() and b'null' in encoded and has_non_finite(data)
+
+
+def dumps(data: Any, compact: Optional[bool] = None) -> bytes:
+    """
+    UTF-8 JSON 바이트 (ensure_ascii=False, 기본 indent=2)
+
+    Raises:
+        TypeError, ValueError, UnicodeEncodeError: 표준 json도 인코딩하지 못할 때
+    """
+    if compact is None:
+        compact = is_compact()
+    if use_orjson():
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            encoded = None
+        if encoded is not None and not _orjson_lossy(data, encoded):
+            return encoded
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    JSON 파싱 (bytes/str)
+
+    Raises:
+        json.JSONDecodeError: 잘못된 JSON
+    """
+    if use_orjson():
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, BOM 등 표준 json만 받아들이는 입력
+            pass
+    return json.loads(data)
+
+
+def load_path(path: Union[str, Path]) -> Any:
+    """JSON 파일 읽기 (open + json.load와 같은 예외)"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+if DefaultJSONProvider is not None:
+    class FastJSONProvider(DefaultJSONProvider):
+        """Flask 응답 JSON 인코딩 (orjson 경로, 실패 시 기본 provider)
+
+        키 정렬과 default 변환(date -> HTTP 날짜, dataclass -> asdict 등)은 기본 provider와 같게 유지
+        """
+
+        def _orjson_dumps(self, obj: Any, indent: bool) -> bytes:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option)
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if use_orjson() and set(kwargs) <= {'indent', 'separators'}:
+                try:
+                    encoded = self._orjson_dumps(obj, bool(kwargs.get('indent')))
+                except orjson.JSONEncodeError:
+                    encoded = None
+                if encoded is not None and not _orjson_lossy(obj, encoded):
+                    return encoded.decode('utf-8')
+            return super().dumps(obj, **kwargs)
+
+        def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return loads(s)
+
+        def response(self, *args: Any, **kwargs: Any):
+            if not use_orjson():
+                return super().response(*args, **kwargs)
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            try:
+                body = self._orjson_dumps(obj, indent)
+            except orjson.JSONEncodeError:
+                return super().response(*args, **kwargs)
+            if _orjson_lossy(obj, body):
+                return super().response(*args, **kwargs)
+            return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+else:
+    FastJSONProvider = None
@@ -1,14 +1,77 @@
 """프로젝트 데이터 모델 및 스키마"""
-from dataclasses import dataclass, asdict, field, is_dataclass
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Callable, Tuple
+import copy
 import json
+import math
+
+
+def slotted(cls):
+    """
+    dataclass에 __slots__ 적용 (@dataclass 위에 붙임)
+
+    dataclass(slots=True)는 Python 3.10+ 전용이라 같은 방식으로 클래스를 다시 생성.
+    인스턴스 __dict__가 없어 씬 수백 개짜리 프로젝트의 메모리와 속성 접근 비용이 줄어듦
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # 기본값 클래스 속성은 slot 디스크립터와 충돌 (기본값은 __init__에 이미 들어 있음)
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# dataclass 클래스 -> (필드 이름 튜플, 필드 값 튜플을 돌려주는 getter)
+_FIELD_TABLES: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]] = {}
+
+# 복사 없이 그대로 쓰는 값 타입
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _field_table(cls: type) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    table = _FIELD_TABLES.get(cls)
+    if table is None:
+        names = tuple(f.name for f in fields(cls))
+        if len(names) == 1:
+            single = attrgetter(names[0])
+            getter = lambda obj: (single(obj),)
+        else:
+            getter = attrgetter(*names)
+        table = _FIELD_TABLES[cls] = (names, getter)
+    return table
+
+
+def _encode_value(value: Any) -> Any:
+    """asdict()와 같은 규칙으로 값 변환 (원자 값은 그대로, 컨테이너만 새로 생성)"""
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    if isinstance(value, dict):
+        return {k: _encode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        return encode_dataclass(value)
+    return copy.deepcopy(value)
+
+
+def encode_dataclass(obj: Any) -> Dict[str, Any]:
+    """dataclass 인스턴스 -> 딕셔너리 (asdict()와 같은 결과, 필드 표 캐시 사용)"""
+    names, getter = _field_table(type(obj))
+    return {
+        name: value if type(value) in _ATOMIC_TYPES else _encode_value(value)
+        for name, value in zip(names, getter(obj))
+    }
 
 
 def to_dict_safe(obj: Any) -> Any:
     """
     안전한 객체를 딕셔너리로 변환하는 유틸 함수
-    - dataclass 인스턴스면 asdict()
+    - dataclass 인스턴스면 encode_dataclass() (asdict()와 같은 결과)
     - dict면 그대로 반환
     - pydantic이면 model_dump() 또는 dict()
     - 그 외는 __dict__ 또는 str fallback
@@ -19,7 +82,7 @@ def to_dict_safe(obj: Any) -> Any:
     # dataclass 인스턴스 확인
     if is_dataclass(obj):
         try:
-            return asdict(obj)
+            return encode_dataclass(obj)
         except (TypeError, ValueError) as e:
             # asdict 실패 시 __dict__ 사용
             if hasattr(obj, '__dict__'):
@@ -52,6 +115,7 @@ def to_dict_safe(obj: Any) -> Any:
     return {"value": str(obj)}
 
 
+@slotted
 @dataclass
 class Character:
     """캐릭터 정의"""
@@ -62,6 +126,7 @@ class Character:
     role: str = ""
 
 
+@slotted
 @dataclass
 class Scene:
     """씬 정의"""
@@ -91,6 +156,110 @@ class Scene:
 
 
 
+_SCENE_FIELDS = frozenset(Scene.__dataclass_fields__)
+_CHARACTER_FIELDS = frozenset(Character.__dataclass_fields__)
+
+
+# 필드 -> 기본값 (default_factory 필드는 _SCENE_FACTORIES에서 매번 새로 생성)
+_SCENE_DEFAULTS = {
+    f.name: (f.default if f.default is not MISSING else None)
+    for f in fields(Scene)
+}
+_SCENE_FACTORIES = {f.name: f.default_factory for f in fields(Scene) if f.default_factory is not MISSING}
+
+# scene_kwargs와 같은 호환 키 매핑 (필드 값이 비어 있으면 순서대로 대체)
+_SCENE_ALIASES = {
+    'narration_ko': ('text',),
+    'durationSec': ('duration',),
+    'image_prompt_en': ('imagePrompt', 'prompt'),
+}
+
+
+# 오디오 길이에서 오는 시간 필드 (NaN/Infinity는 JSON에 기록할 수 없으므로 None으로 정리)
+_SCENE_TIME_FIELDS = ('durationSec', 'startTime', 'endTime')
+
+
+def finite_or_none(value: Any) -> Any:
+    """NaN/Infinity float -> None (그 외 값은 그대로)"""
+    if type(value) is float and not math.isfinite(value):
+        return None
+    return value
+
+
+def _clean_scene_times(sd: Dict[str, Any]) -> Dict[str, Any]:
+    """씬 딕셔너리의 시간 필드에서 비유한 float 제거 (제자리 수정)"""
+    for name in _SCENE_TIME_FIELDS:
+        if name in sd:
+            sd[name] = finite_or_none(sd[name])
+    return sd
+
+
+def _scene_defaults() -> Dict[str, Any]:
+    """Scene 기본값 딕셔너리 (필드 순서 유지)"""
+    defaults = dict(_SCENE_DEFAULTS)
+    for name, factory in _SCENE_FACTORIES.items():
+        defaults[name] = factory()
+    return defaults
+
+
+def scene_value(data: Dict[str, Any], name: str) -> Any:
+    """씬 딕셔너리에서 Scene 필드 값 하나 읽기 (호환 키 매핑 + 기본값, 딕셔너리 복사 없음)"""
+    value = data.get(name)
+    for alias in _SCENE_ALIASES.get(name, ()):
+        if alias in data and not value:
+            value = data[alias]
+    if value is None and name not in data:
+        factory = _SCENE_FACTORIES.get(name)
+        return factory() if factory else _SCENE_DEFAULTS.get(name)
+    if name in _SCENE_TIME_FIELDS:
+        return finite_or_none(value)
+    return value
+
+
+def scene_dict_aliases(sd: Any) -> Any:
+    """씬 딕셔너리에 프론트 호환 키 추가 (text/imagePrompt/prompt)"""
+    # provide legacy `text` key expected by frontend
+    if isinstance(sd, dict):
+        sd['text'] = sd.get('narration_ko') or sd.get('narration_en') or ''
+        sd['imagePrompt'] = sd.get('image_prompt_en') or ''
+        sd['prompt'] = sd.get('image_prompt_en') or ''
+    return sd
+
+
+def scene_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """씬 딕셔너리 -> Scene 생성 인자 (프론트 호환 키 매핑 + 모르는 필드 제거, 한 번에 처리)"""
+    # Filter out unknown fields to avoid TypeError on Scene(**kwargs)
+    kwargs = {k: v for k, v in data.items() if k in _SCENE_FIELDS}
+    # accept legacy `text`, frontend camelCase `duration`/`imagePrompt` and `prompt` alias
+    for name, aliases in _SCENE_ALIASES.items():
+        for alias in aliases:
+            if alias in data and not kwargs.get(name):
+                kwargs[name] = data[alias]
+    return _clean_scene_times(kwargs)
+
+
+def scene_from_dict(data: Dict[str, Any]) -> Scene:
+    """씬 딕셔너리 -> Scene"""
+    return Scene(**scene_kwargs(data))
+
+
+_SCENE_NAMES, _SCENE_GETTER = _field_table(Scene)
+
+
+def scene_to_dict(scene: Any) -> Any:
+    """Scene -> 저장/응답용 딕셔너리 (프론트 호환 키 포함)"""
+    if type(scene) is not Scene:
+        sd = to_dict_safe(scene)
+        return scene_dict_aliases(_clean_scene_times(sd) if isinstance(sd, dict) else sd)
+    sd = {
+        name: value if type(value) in _ATOMIC_TYPES else _encode_value(value)
+        for name, value in zip(_SCENE_NAMES, _SCENE_GETTER(scene))
+    }
+    # 저장 직전 정리 (API에서 scene.durationSec 등을 직접 대입한 경우)
+    return scene_dict_aliases(_clean_scene_times(sd))
+
+
+@slotted
 @dataclass
 class Thumbnail:
     """썸네일 설정"""
@@ -99,6 +268,7 @@ class Thumbnail:
     path: Optional[str] = None
 
 
+@slotted
 @dataclass
 class VideoSettings:
     """비디오 렌더링 설정"""
@@ -107,6 +277,7 @@ class VideoSettings:
     height: int = 720
 
 
+@slotted
 @dataclass
 class TTSSettings:
     """TTS 설정"""
@@ -114,6 +285,7 @@ class TTSSettings:
     format: str = "mp3"
 
 
+@slotted
 @dataclass
 class BGMSettings:
     """BGM 설정"""
@@ -122,6 +294,7 @@ class BGMSettings:
     volume: float = 0.15
 
 
+@slotted
 @dataclass
 class Settings:
     """전체 설정"""
@@ -131,6 +304,7 @@ class Settings:
     subtitles: Dict[str, Any] = field(default_factory=lambda: {"enabled": False})
 
 
+@slotted
 @dataclass
 class Status:
     """파이프라인 상태"""
@@ -143,6 +317,7 @@ class Status:
     lastOpenedAt: Optional[str] = None  # 마지막 열람 시간
 
 
+@slotted
 @dataclass
 class LastRun:
     """마지막 실행 정보"""
@@ -150,6 +325,7 @@ class LastRun:
     error: Optional[str] = None
 
 
+@slotted
 @dataclass
 class Project:
     """프로젝트 (project.json의 루트)"""
@@ -167,20 +343,13 @@ class Project:
     settings: Settings = field(default_factory=Settings)
     status: Status = field(default_factory=Status)
     lastRun: LastRun = field(default_factory=LastRun)
+    revision: Optional[int] = None  # project.json 저장 횟수 (낙관적 동시성, None이면 검사 생략)
     
     def to_dict(self) -> Dict[str, Any]:
         """프로젝트를 딕셔너리로 변환"""
         # include a friendly `name` field for frontend compatibility
         # include snake_case aliases and a `text` alias for scenes for frontend compatibility
-        scenes_list = []
-        for s in self.scenes:
-            sd = to_dict_safe(s)
-            # provide legacy `text` key expected by frontend
-            if isinstance(sd, dict):
-                sd['text'] = sd.get('narration_ko') or sd.get('narration_en') or ''
-                sd['imagePrompt'] = sd.get('image_prompt_en') or ''
-                sd['prompt'] = sd.get('image_prompt_en') or ''
-            scenes_list.append(sd)
+        scenes_list = [scene_to_dict(s) for s in self.scenes]
 
         # 모든 중첩 객체를 안전하게 변환
         status_dict = to_dict_safe(self.status)
@@ -224,13 +393,13 @@ class Project:
             'settings': to_dict_safe(self.settings),
             'status': status_dict,
             'lastRun': to_dict_safe(self.lastRun),
+            'revision': self.revision,
         }
     
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Project':
         """딕셔너리에서 프로젝트 생성"""
         characters = []
-        allowed_keys = {'id', 'name', 'desc_ko', 'desc_en', 'role'}
         for c in data.get('characters', []):
             c_copy = dict(c)
             if 'descriptionKo' in c_copy:
@@ -243,40 +412,10 @@ class Project:
                 del c_copy['description']
 
             # Remove fields not understood by Character dataclass (e.g., userInput, imageDataUrl)
-            filtered = {k: v for k, v in c_copy.items() if k in allowed_keys}
+            filtered = {k: v for k, v in c_copy.items() if k in _CHARACTER_FIELDS}
             characters.append(Character(**filtered))
             
-        scenes = []
-        for s in data.get('scenes', []):
-            # accept legacy `text` key and map to `narration_ko`
-            s_copy = dict(s)
-            if 'text' in s_copy:
-                text_value = s_copy['text']
-                if not s_copy.get('narration_ko'):
-                    s_copy['narration_ko'] = text_value
-                s_copy['text'] = text_value
-            
-            # map frontend camelCase to backend snake_case
-            if 'duration' in s_copy:
-                if not s_copy.get('durationSec'):
-                    s_copy['durationSec'] = s_copy.get('duration')
-                del s_copy['duration']
-            
-            if 'imagePrompt' in s_copy:
-                if not s_copy.get('image_prompt_en'):
-                    s_copy['image_prompt_en'] = s_copy.get('imagePrompt')
-                del s_copy['imagePrompt']
-
-            # Remove 'prompt' alias if present (frontend compat)
-            if 'prompt' in s_copy:
-                if not s_copy.get('image_prompt_en'):
-                    s_copy['image_prompt_en'] = s_copy.get('prompt')
-                del s_copy['prompt']
-
-            # Filter out unknown fields to avoid TypeError on Scene(**s_copy)
-            valid_fields = {f.name for f in Scene.__dataclass_fields__.values()}
-            s_filtered = {k: v for k, v in s_copy.items() if k in valid_fields}
-            scenes.append(Scene(**s_filtered))
+        scenes = [scene_from_dict(s) for s in data.get('scenes', [])]
         thumbnail_data = data.get('thumbnail', {})
         thumbnail = Thumbnail(**thumbnail_data) if thumbnail_data else Thumbnail()
         
@@ -317,4 +456,65 @@ class Project:
             settings=settings,
             status=status,
             lastRun=lastrun,
+            revision=data.get('revision'),
         )
+
+    def scene_values(self, name: str) -> List[Any]:
+        """모든 씬의 특정 필드 값 목록"""
+        return [getattr(scene, name, None) for scene in self.scenes]
+
+
+class ProjectView:
+    """project.json 지연 로딩 뷰 (목록/통계/메타 보정용)
+
+    헤더(id/제목/상태/설정/캐릭터 등)는 생성 시 Project로 변환하고,
+    씬은 scenes 접근 시에만 Scene으로 변환 (scene_values/to_dict는 원본 딕셔너리로 처리)
+    그 외 속성은 헤더 Project로 위임
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.raw = data
+        self.header = Project.from_dict({k: v for k, v in data.items() if k != 'scenes'})
+        self._scenes: Optional[List[Scene]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.header, name)
+
+    @property
+    def scenes(self) -> List[Scene]:
+        if self._scenes is None:
+            self._scenes = [scene_from_dict(s) for s in self.raw.get('scenes', [])]
+        return self._scenes
+
+    @property
+    def scene_count(self) -> int:
+        if self._scenes is not None:
+            return len(self._scenes)
+        return len(self.raw.get('scenes') or [])
+
+    def scene_values(self, name: str) -> List[Any]:
+        """모든 씬의 특정 필드 값 목록 (Scene 변환 없음)"""
+        if self._scenes is not None:
+            return [getattr(scene, name, None) for scene in self._scenes]
+        return [scene_value(s, name) for s in self.raw.get('scenes', [])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Project.to_dict()와 같은 결과 (씬은 Scene 변환 없이 기본값 + 원본 값으로 구성)"""
+        if self._scenes is not None:
+            return self.to_project().to_dict()
+        data = self.header.to_dict()
+        scenes_list = []
+        for s in self.raw.get('scenes', []):
+            kwargs = scene_kwargs(s)
+            if 'id' not in kwargs:
+                raise TypeError("Scene.__init__() missing 1 required positional argument: 'id'")
+            sd = _scene_defaults()
+            sd.update(kwargs)
+            scenes_list.append(scene_dict_aliases(sd))
+        data['scenes'] = scenes_list
+        return data
+
+    def to_project(self) -> Project:
+        """전체 Project로 변환 (씬 포함)"""
+        self.header.scenes = self.scenes
+        return self.header
@@ -0,0 +1,343 @@
+"""프로젝트 카탈로그 (SQLite WAL, 대시보드 목록/통계용)
+
+프로젝트 헤더 필드와 파생 메타(개수/미리보기/상태 등)를 한 테이블에 보관해
+목록 필터/정렬/페이지/제목 검색을 인덱스로 처리합니다.
+payload에는 헤더 + 파생 메타만 두고 씬/대본은 저장하지 않습니다 (필요한 응답만 project.json에서 읽음).
+디스크(project.json + 에셋 폴더)가 단일 진실 소스이고 카탈로그는 언제든 다시 만들 수 있는 캐시입니다.
+(ProjectMetaIndex가 쓰기/감시자 통지 시 갱신, 폴더 stat 서명으로 서버 재시작 후 변경분만 재계산)
+"""
+import base64
+import binascii
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from src.common.logger import logger
+from . import json_backend
+
+
+SCHEMA_VERSION = 2  # 2: payload에서 씬/대본 제외
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    title_key TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'active',
+    pinned INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL DEFAULT '',
+    archived_at TEXT,
+    has_script INTEGER NOT NULL DEFAULT 0,
+    has_scenes_json INTEGER NOT NULL DEFAULT 0,
+    scenes_count INTEGER NOT NULL DEFAULT 0,
+    images_count INTEGER NOT NULL DEFAULT 0,
+    preview_image_url TEXT,
+    has_tts INTEGER NOT NULL DEFAULT 0,
+    tts_count INTEGER NOT NULL DEFAULT 0,
+    has_video INTEGER NOT NULL DEFAULT 0,
+    has_final_video INTEGER NOT NULL DEFAULT 0,
+    duration_seconds INTEGER,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_status_updated ON projects(status, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_projects_status_created ON projects(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_projects_status_title ON projects(status, title_key, id);
+CREATE INDEX IF NOT EXISTS idx_projects_updated ON projects(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_projects_created ON projects(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_projects_title ON projects(title_key, id);
+"""
+
+# API 정렬 키 -> 컬럼
+SORT_COLUMNS = {
+    'updatedAt': 'updated_at',
+    'createdAt': 'created_at',
+    'title': 'title_key',
+}
+
+# meta 키 -> 컬럼 (목록 응답/필드 선택용)
+META_COLUMNS = (
+    ('id', 'id'),
+    ('title', 'title'),
+    ('status', 'status'),
+    ('createdAt', 'created_at'),
+    ('updatedAt', 'updated_at'),
+    ('archivedAt', 'archived_at'),
+    ('hasScript', 'has_script'),
+    ('hasScenesJson', 'has_scenes_json'),
+    ('scenesCount', 'scenes_count'),
+    ('imagesCount', 'images_count'),
+    ('previewImageUrl', 'preview_image_url'),
+    ('hasTts', 'has_tts'),
+    ('ttsCount', 'tts_count'),
+    ('hasVideo', 'has_video'),
+    ('isPinned', 'pinned'),
+)
+_BOOL_COLUMNS = frozenset({'has_script', 'has_scenes_json', 'has_tts', 'has_video', 'pinned'})
+_META_SELECT = ', '.join(column for _, column in META_COLUMNS)
+
+
+# fields= 선택 가능 키 (카탈로그 컬럼만으로 구성 - 씬/payload를 읽지 않음)
+# archived/pinned는 목록 응답과 같은 boolean 별칭, counts는 개수 필드 묶음
+PROJECTION_ALIASES = {
+    'counts': ('scenesCount', 'imagesCount', 'ttsCount'),
+}
+PROJECTION_FIELDS = frozenset(key for key, _ in META_COLUMNS) | {'archived', 'pinned'}
+
+
+def expand_fields(spec: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    fields= 값 -> 필드 튜플 (없으면 None, 중복 제거 + 순서 유지)
+
+    Raises:
+        ValueError: 알 수 없는 필드
+    """
+    if spec is None or not spec.strip():
+        return None
+    result = []
+    for name in (part.strip() for part in spec.split(',')):
+        if not name:
+            continue
+        expanded = PROJECTION_ALIASES.get(name, (name,))
+        for field_name in expanded:
+            if field_name not in PROJECTION_FIELDS:
+                raise ValueError(f"unknown field: {name}")
+            if field_name not in result:
+                result.append(field_name)
+    return tuple(result) or None
+
+
+def project_fields(meta: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """카탈로그 meta에서 선택한 필드만 추출"""
+    result = {}
+    for name in fields:
+        if name == 'archived':
+            result[name] = meta['status'] == 'archived'
+        elif name == 'pinned':
+            result[name] = meta['isPinned']
+        else:
+            result[name] = meta[name]
+    return result
+
+
+def encode_cursor(sort: str, descending: bool, key: Tuple[Any, str]) -> str:
+    """키셋 커서 (정렬 키 + 방향 + 마지막 행의 (정렬 값, id)) -> URL 안전 문자열"""
+    raw = json.dumps([sort, 'desc' if descending else 'asc', key[0], key[1]], ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, bool, Tuple[Any, str]]:
+    """
+    encode_cursor() 역변환 -> (sort, descending, (정렬 값, id))
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort, order, value, project_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise ValueError("invalid cursor")
+    if sort not in SORT_COLUMNS or order not in ('asc', 'desc') or not isinstance(project_id, str):
+        raise ValueError("invalid cursor")
+    return sort, order == 'desc', (value, project_id)
+
+
+def encode_signature(signature: Tuple) -> str:
+    """project_stat_signature() 튜플 -> 저장용 문자열"""
+    return json.dumps(signature, separators=(',', ':'))
+
+
+def title_key(title: Any) -> str:
+    """제목 정렬/검색 키 (대소문자 무시)"""
+    return str(title or '').casefold()
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+class ProjectCatalog:
+    """프로젝트 카탈로그 테이블 (스레드 공용 연결 1개 + 잠금)
+
+    db_path가 ':memory:'면 프로세스 내 임시 카탈로그 (재시작 시 전체 재계산)
+    payload(헤더 + 파생 메타 딕셔너리, 씬/대본 제외)는 메모리에 두지 않고 조회한 행만 파싱
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = str(db_path)
+        self._lock = threading.RLock()
+        self._conn = self._open()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # 캐시이므로 스키마가 바뀌면 버리고 다시 만듦
+            conn.execute("DROP TABLE IF EXISTS projects")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            return self._connect()
+        except sqlite3.DatabaseError as e:
+            if self.db_path == ':memory:':
+                raise
+            logger.warning(f"[CATALOG] {self.db_path} 열기 실패, 새로 생성: {e}")
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    Path(self.db_path + suffix).unlink()
+                except OSError:
+                    pass
+            return self._connect()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def upsert(self, project_id: str, folder: str, signature: Tuple, entry: Dict[str, Any]):
+        """프로젝트 1개 기록 (entry: _build_project_index_entry 결과 {'meta','project','metadata'})"""
+        meta = entry['meta']
+        metadata = entry.get('metadata') or {}
+        row = {column: meta.get(key) for key, column in META_COLUMNS}
+        row.update({
+            'id': project_id,
+            'folder': folder,
+            'signature': encode_signature(signature),
+            'title': row['title'] or '',
+            'title_key': title_key(row['title']),
+            'created_at': row['created_at'] or '',
+            'updated_at': row['updated_at'] or '',
+            'scenes_count': row['scenes_count'] or 0,
+            'images_count': row['images_count'] or 0,
+            'tts_count': row['tts_count'] or 0,
+            'has_final_video': bool(metadata.get('hasFinalVideo')),
+            'duration_seconds': metadata.get('durationSeconds'),
+            'payload': json_backend.dumps(entry.get('project') or {}, compact=True),
+        })
+        for column in _BOOL_COLUMNS:
+            row[column] = bool(row[column])
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{c}' for c in row)
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO projects ({columns}) VALUES ({placeholders})", row)
+
+    def delete(self, project_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+
+    def delete_many(self, project_ids: Iterable[str]):
+        project_ids = list(project_ids)
+        with self._lock:
+            self._conn.executemany("DELETE FROM projects WHERE id = ?", [(pid,) for pid in project_ids])
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM projects")
+
+    def signatures(self) -> Dict[str, Tuple[str, str]]:
+        """id -> (폴더 이름, 저장된 서명 문자열) (재시작 시 변경분 판별용)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, folder, signature FROM projects").fetchall()
+        return {row['id']: (row['folder'], row['signature']) for row in rows}
+
+    def _where(self, status: str = 'all', search: Optional[str] = None,
+               pinned: Optional[bool] = None) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if status in ('active', 'archived'):
+            clauses.append("status = ?")
+            params.append(status)
+        if pinned is not None:
+            clauses.append("pinned = ?")
+            params.append(int(bool(pinned)))
+        if search:
+            clauses.append("title_key LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(title_key(search)))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, status: str = 'all', search: Optional[str] = None, pinned: Optional[bool] = None,
+              sort: str = 'updatedAt', descending: bool = True,
+              limit: Optional[int] = None, offset: int = 0,
+              after: Optional[Tuple[Any, str]] = None, payload: bool = True) -> List[Dict[str, Any]]:
+        """
+        필터/정렬/페이지 조회
+
+        Args:
+            after: 키셋 페이지 시작점 (이전 페이지 마지막 행의 key, 이 행 다음부터)
+            payload: False면 컬럼만 조회 (payload 파싱 생략)
+
+        Returns:
+            [{'meta': {...}, 'key': (정렬 값, id), 'project': {...}}]
+            (project는 payload=True일 때만, 헤더 + 파생 메타 - 씬/대본 없음)
+        """
+        column = SORT_COLUMNS.get(sort)
+        if column is None:
+            raise ValueError(f"unknown sort key: {sort}")
+        where, params = self._where(status, search, pinned)
+        direction = "DESC" if descending else "ASC"
+        if after is not None:
+            keyset = f"({column}, id) {'<' if descending else '>'} (?, ?)"
+            where = f"{where} AND {keyset}" if where else f" WHERE {keyset}"
+            params += [after[0], after[1]]
+        payload_select = ", payload" if payload else ""
+        sql = (f"SELECT {_META_SELECT}, {column} AS sort_value{payload_select} FROM projects{where} "
+               f"ORDER BY {column} {direction}, id {direction} LIMIT ? OFFSET ?")
+        params += [-1 if limit is None else int(limit), int(offset or 0)]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        entries = [{'meta': self._row_meta(row), 'key': (row['sort_value'], row['id'])} for row in rows]
+        if payload:
+            for entry, row in zip(entries, rows):
+                entry['project'] = json_backend.loads(row['payload'])
+        return entries
+
+    def count(self, status: str = 'all', search: Optional[str] = None, pinned: Optional[bool] = None) -> int:
+        where, params = self._where(status, search, pinned)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM projects{where}", params).fetchone()[0]
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_META_SELECT}, payload FROM projects WHERE id = ?", (project_id,)).fetchone()
+        if row is None:
+            return None
+        return {'meta': self._row_meta(row), 'project': json_backend.loads(row['payload'])}
+
+    def stats(self) -> Dict[str, Any]:
+        """대시보드 KPI 집계"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS total,"
+                " COALESCE(SUM(status = 'archived'), 0) AS archived,"
+                " COALESCE(SUM(has_final_video), 0) AS completed,"
+                " AVG(CASE WHEN scenes_count > 0 THEN scenes_count END) AS avg_scenes,"
+                " AVG(CASE WHEN duration_seconds > 0 THEN duration_seconds END) AS avg_duration"
+                " FROM projects"
+            ).fetchone()
+        return {
+            'totalProjects': row['total'],
+            'activeProjects': row['total'] - row['archived'],
+            'archivedProjects': row['archived'],
+            'completedProjects': row['completed'],
+            'avgScenesCount': round(row['avg_scenes'], 1) if row['avg_scenes'] is not None else 0,
+            'avgDurationSeconds': int(row['avg_duration']) if row['avg_duration'] is not None else None,
+        }
+
+    @staticmethod
+    def _row_meta(row: sqlite3.Row) -> Dict[str, Any]:
+        meta = {}
+        for key, column in META_COLUMNS:
+            value = row[column]
+            meta[key] = bool(value) if column in _BOOL_COLUMNS else value
+        return meta
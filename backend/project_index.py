@@ -0,0 +1,214 @@
+"""프로젝트 메타데이터 인덱스 (대시보드 목록용, 엔트리는 ProjectCatalog SQLite 테이블에 보관)"""
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from src.common.logger import logger
+from .project_catalog import ProjectCatalog, encode_signature
+
+
+# 재검증 시 stat 하는 경로 (프로젝트 폴더 기준 상대 경로)
+# 파일 추가/삭제는 디렉토리 mtime, 내용 변경은 파일 mtime/size로 감지
+WATCHED_PATHS = (
+    "",
+    "project.json",
+    "script.txt",
+    "scenes.json",
+    "assets/images",
+    "assets/images/scenes",
+    "assets/audio",
+    "renders",
+)
+
+
+def project_stat_signature(project_dir: Path) -> Tuple:
+    """프로젝트 폴더의 변경 감지용 서명 (mtime_ns, size) 튜플"""
+    sig = []
+    for rel in WATCHED_PATHS:
+        try:
+            st = (project_dir / rel).stat() if rel else project_dir.stat()
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+class ProjectMetaIndex:
+    """프로세스 전역 프로젝트 메타 인덱스
+
+    - 서버 시작 시 build()로 1회 구축 (카탈로그에 저장된 서명이 같은 프로젝트는 재계산 생략)
+    - ProjectManager 쓰기(생성/저장/삭제) 시 invalidate()로 해당 프로젝트만 무효화
+    - 조회 시 디렉토리/파일 mtime 서명으로 저비용 재검증 (변경된 프로젝트만 재계산)
+    - 감시자(ProjectWatcher) 연결 시 stat 재검증 생략, 통지된 프로젝트만 재계산
+    - 조회 경로는 프로젝트 폴더에 아무것도 쓰지 않음 (카탈로그만 갱신)
+    - 목록/통계는 카탈로그 인덱스로 필터/정렬/페이지 처리
+    """
+
+    def __init__(self, pm, build_entry: Callable[[str, Path], Optional[Dict[str, Any]]],
+                 catalog: Optional[ProjectCatalog] = None):
+        """
+        Args:
+            pm: ProjectManager
+            build_entry: (project_id, project_dir) -> {'meta': {...}, 'project': {...}, 'metadata': {...}} 또는 None
+            catalog: 엔트리 저장소 (None이면 메모리 카탈로그)
+        """
+        self.pm = pm
+        self._build_entry = build_entry
+        self.catalog = catalog if catalog is not None else ProjectCatalog(':memory:')
+        # project_id -> {'dir', 'signature'} (재검증용, 엔트리 내용은 카탈로그)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._folder_ids: Dict[str, str] = {}
+        self._dirty: set = set()
+        self._root_sig = None
+        self._watcher_driven = False
+        self._lock = threading.RLock()
+
+    def _root_signature(self):
+        try:
+            st = self.pm.projects_root.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _refresh_entry(self, project_id: str, project_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        if project_dir is None:
+            project_dir = self.pm.get_project_dir(project_id)
+        signature = project_stat_signature(project_dir)
+        try:
+            built = self._build_entry(project_id, project_dir)
+        except Exception as e:
+            logger.warning(f"[INDEX] Failed to build entry for {project_id}: {e}")
+            built = None
+        if not built:
+            self._drop_entry(project_id)
+            return None
+        self.catalog.upsert(project_id, project_dir.name, signature, built)
+        self._remember(project_id, project_dir, signature)
+        return built
+
+    def _remember(self, project_id: str, project_dir: Path, signature: Tuple):
+        self._entries[project_id] = {'dir': project_dir, 'signature': signature}
+        self._folder_ids[project_dir.name] = project_id
+
+    def _drop_entry(self, project_id: str):
+        entry = self._entries.pop(project_id, None)
+        if entry and entry.get('dir') is not None:
+            self._folder_ids.pop(entry['dir'].name, None)
+        self.catalog.delete(project_id)
+
+    def build(self, rebuild: bool = False) -> int:
+        """
+        전체 인덱스 구축 (서버 시작 시 1회)
+
+        Args:
+            rebuild: True면 카탈로그를 비우고 모든 프로젝트를 디스크에서 다시 계산
+        """
+        with self._lock:
+            self._entries.clear()
+            self._folder_ids.clear()
+            self._dirty.clear()
+            self._root_sig = self._root_signature()
+            if rebuild:
+                self.catalog.clear()
+            stored = self.catalog.signatures()
+            reused = 0
+            for project_id in self.pm.list_project_ids():
+                project_dir = self.pm.get_project_dir(project_id)
+                signature = project_stat_signature(project_dir)
+                if stored.pop(project_id, None) == (project_dir.name, encode_signature(signature)):
+                    self._remember(project_id, project_dir, signature)
+                    reused += 1
+                else:
+                    self._refresh_entry(project_id, project_dir)
+            # 디스크에서 사라진 프로젝트
+            self.catalog.delete_many(stored)
+            logger.info(f"[INDEX] built: {len(self._entries)} projects ({reused} unchanged in catalog)")
+            return len(self._entries)
+
+    def invalidate(self, project_id: str):
+        """쓰기 후 호출: 다음 조회 시 해당 프로젝트만 재계산"""
+        with self._lock:
+            self._dirty.add(project_id)
+
+    def invalidate_path(self, project_dir: Path):
+        """감시자 콜백: 변경된 프로젝트 폴더 경로로 무효화
+
+        인덱스에 없는 폴더(신규/이름변경)면 다음 조회 시 id 목록 재수집
+        """
+        with self._lock:
+            project_id = self._folder_ids.get(Path(project_dir).name)
+            if project_id is not None:
+                self._dirty.add(project_id)
+            else:
+                self._root_sig = None
+
+    def set_watcher_driven(self, enabled: bool):
+        """감시자 동작 여부 설정 (True면 조회 시 stat 재검증 생략)"""
+        with self._lock:
+            self._watcher_driven = bool(enabled)
+
+    @property
+    def watcher_driven(self) -> bool:
+        return self._watcher_driven
+
+    def _revalidate(self):
+        # projects_root 자체가 바뀌었으면(폴더 추가/삭제/이름변경) id 목록 재수집
+        root_sig = self._root_signature()
+        if root_sig != self._root_sig:
+            self._root_sig = root_sig
+            current_ids = set(self.pm.list_project_ids())
+            for project_id in list(self._entries):
+                if project_id not in current_ids:
+                    self._drop_entry(project_id)
+            for project_id in current_ids:
+                if project_id not in self._entries:
+                    self._dirty.add(project_id)
+                else:
+                    # 폴더 경로가 바뀌었을 수 있음 (migrate/rename)
+                    self._entries[project_id]['dir'] = None
+
+        dirty = self._dirty
+        self._dirty = set()
+        for project_id in dirty:
+            self._refresh_entry(project_id)
+
+        # 감시자가 변경을 통지하므로 전체 stat 재검증 불필요
+        if self._watcher_driven:
+            return
+
+        for project_id, entry in list(self._entries.items()):
+            if project_id in dirty:
+                continue
+            project_dir = entry.get('dir') or self.pm.get_project_dir(project_id)
+            if entry.get('dir') is None or project_stat_signature(project_dir) != entry['signature']:
+                self._refresh_entry(project_id, project_dir)
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """단일 프로젝트 엔트리 조회 (필요 시 재계산)"""
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None or entry.get('dir') is None or project_id in self._dirty:
+                self._dirty.discard(project_id)
+                return self._refresh_entry(project_id)
+            if not self._watcher_driven and project_stat_signature(entry['dir']) != entry['signature']:
+                return self._refresh_entry(project_id, entry['dir'])
+            return self.catalog.get(project_id)
+
+    def query(self, **filters: Any) -> List[Dict[str, Any]]:
+        """카탈로그 필터/정렬/페이지 조회 (변경된 프로젝트만 재계산, 인자는 ProjectCatalog.query)"""
+        with self._lock:
+            self._revalidate()
+            return self.catalog.query(**filters)
+
+    def page(self, **filters: Any) -> Tuple[List[Dict[str, Any]], int]:
+        """query()와 같은 조회 + 필터에 맞는 전체 개수 (재검증 1회)"""
+        with self._lock:
+            self._revalidate()
+            entries = self.catalog.query(**filters)
+            total = self.catalog.count(**{k: filters[k] for k in ('status', 'search', 'pinned') if k in filters})
+            return entries, total
+
+    def stats(self) -> Dict[str, Any]:
+        """대시보드 KPI 집계"""
+        with self._lock:
+            self._revalidate()
+            return self.catalog.stats()
@@ -11,10 +11,15 @@ os.environ['PYTHONIOENCODING'] = 'utf-8'
 import json
 import shutil
 import re
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from .models import Project, Scene, Character
+from typing import Optional, Dict, Any, List, Callable
+from .models import Project, ProjectView, Scene, Character
+from . import json_backend
+from .project_store import (
+    LOCK_FILE_NAME, ProjectConflictError, ProjectLocks, peek_project_id, read_json, revision_of, write_json_atomic
+)
 import uuid
 from src.common.logger import logger
 
@@ -50,6 +55,23 @@ class ProjectManager:
     def __init__(self, projects_root: str = "projects"):
         self.projects_root = Path(projects_root)
         self.projects_root.mkdir(parents=True, exist_ok=True)
+        self._change_listeners: List[Callable[[str], None]] = []
+        self._locks = ProjectLocks()
+        # canonical_project_dir 캐시 (id -> slug 폴더, projects_root mtime으로 재검증)
+        self._dir_cache: Dict[str, Path] = {}
+        self._dir_cache_mtime: Optional[int] = None
+        self._dir_cache_lock = threading.RLock()
+
+    def add_change_listener(self, callback: Callable[[str], None]):
+        """프로젝트 생성/저장/삭제 시 호출될 콜백 등록 (callback(project_id))"""
+        self._change_listeners.append(callback)
+
+    def _notify_change(self, project_id: str):
+        for callback in self._change_listeners:
+            try:
+                callback(project_id)
+            except Exception as e:
+                logger.warning(f"Change listener failed for {project_id}: {e}")
 
     def _is_legacy_dir(self, folder_name: str) -> bool:
         return folder_name.endswith("_legacy") or "_legacy_" in folder_name
@@ -69,31 +91,64 @@ class ProjectManager:
         if not project_id:
             return True
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json_backend.load_path(json_path)
             return data.get('id') == project_id
         except Exception:
             return False
 
+    def _pick_slug_dir(self, project_id: str, slug_dirs: List[Path]) -> Path:
+        """같은 id의 slug 폴더가 여러 개일 때 선택 (project.json id 일치 우선, 그다음 최신 mtime)"""
+        if len(slug_dirs) == 1:
+            return slug_dirs[0]
+        valid_slug_dirs = [d for d in slug_dirs if self._folder_has_project_json(d, project_id)]
+        if valid_slug_dirs:
+            return sorted(valid_slug_dirs, key=lambda p: p.stat().st_mtime, reverse=True)[0]
+        return sorted(slug_dirs, key=lambda p: p.stat().st_mtime, reverse=True)[0]
+
+    def _root_mtime(self) -> Optional[int]:
+        try:
+            return self.projects_root.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _rebuild_dir_cache(self):
+        """projects_root 1회 순회로 id -> slug 폴더 맵 구축"""
+        mtime = self._root_mtime()
+        slug_dirs: Dict[str, List[Path]] = {}
+        for folder in self.projects_root.iterdir():
+            if "__" not in folder.name or self._is_legacy_dir(folder.name) or not folder.is_dir():
+                continue
+            slug_dirs.setdefault(folder.name.split("__", 1)[0], []).append(folder)
+        self._dir_cache = {pid: self._pick_slug_dir(pid, dirs) for pid, dirs in slug_dirs.items()}
+        self._dir_cache_mtime = mtime
+
+    def _remember_project_dir(self, project_id: str, project_dir: Path, root_mtime_before: Optional[int]):
+        """생성 직후 맵에 추가 (생성 전에 캐시가 최신이었으면 바뀐 projects_root mtime도 반영해 재구축 생략)"""
+        with self._dir_cache_lock:
+            if self._dir_cache_mtime is None or self._dir_cache_mtime != root_mtime_before:
+                return
+            self._dir_cache[project_id] = project_dir
+            self._dir_cache_mtime = self._root_mtime()
+
+    def invalidate_dir_cache(self):
+        """id -> 폴더 맵 폐기 (다음 조회 시 재구축)"""
+        with self._dir_cache_lock:
+            self._dir_cache_mtime = None
+
     def canonical_project_dir(self, project_id: str) -> Path:
         """Canonical directory rule:
         1) use project_id__slug folder if exists
         2) otherwise use project_id folder
-        """
-        slug_dirs: List[Path] = []
-        for folder in self.projects_root.iterdir():
-            if not folder.is_dir() or self._is_legacy_dir(folder.name):
-                continue
-            if folder.name.startswith(f"{project_id}__"):
-                slug_dirs.append(folder)
-
-        if slug_dirs:
-            # Prefer slug folder whose project.json id matches the project_id.
-            valid_slug_dirs = [d for d in slug_dirs if self._folder_has_project_json(d, project_id)]
-            if valid_slug_dirs:
-                return sorted(valid_slug_dirs, key=lambda p: p.stat().st_mtime, reverse=True)[0]
-            return sorted(slug_dirs, key=lambda p: p.stat().st_mtime, reverse=True)[0]
 
+        id -> 폴더 맵을 캐시하고 projects_root mtime이 바뀌었을 때만 다시 순회 (조회는 stat 1회)
+        """
+        with self._dir_cache_lock:
+            mtime = self._root_mtime()
+            if mtime is None or mtime != self._dir_cache_mtime:
+                self._rebuild_dir_cache()
+            folder = self._dir_cache.get(project_id)
+        if folder is not None:
+            return folder
         return self.projects_root / project_id
 
     def canonicalProjectDir(self, project_id: str) -> Path:
@@ -203,7 +258,9 @@ class ProjectManager:
         
         # 폴더 생성
         project_dir = self.projects_root / folder_name
+        root_mtime = self._root_mtime()
         self._ensure_project_dirs(project_dir)
+        self._remember_project_dir(project_id, project_dir, root_mtime)
         
         # project.json에 folderName 저장
         project_dict = project.to_dict()
@@ -211,109 +268,106 @@ class ProjectManager:
         project_dict['title'] = topic or '새로운 프로젝트'
         
         json_path = project_dir / "project.json"
-        try:
-            # UTF-8로 명시적으로 저장 (이모지/한글 지원)
-            with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                json.dump(project_dict, f, indent=2, ensure_ascii=False)
-        except (UnicodeEncodeError, UnicodeDecodeError) as e:
-            logger.error(f"Unicode error writing project.json for {project_id}: {e}")
-            # 이모지 제거 후 재시도
-            import re
-            emoji_pattern = re.compile("["
-                "\U0001F600-\U0001F64F"  # emoticons
-                "\U0001F300-\U0001F5FF"  # symbols & pictographs
-                "\U0001F680-\U0001F6FF"  # transport & map
-                "\U0001F700-\U0001F77F"
-                "\U0001F780-\U0001F7FF"
-                "\U0001F800-\U0001F8FF"
-                "\U0001F900-\U0001F9FF"
-                "\U0001FA00-\U0001FA6F"
-                "\U0001FA70-\U0001FAFF"
-                "\u2600-\u26FF"          # misc symbols
-                "\u2700-\u27BF"          # dingbats
-                "]+", flags=re.UNICODE)
-            # 딕셔너리의 모든 문자열 값에서 이모지 제거
-            def remove_emoji_from_dict(d):
-                if isinstance(d, dict):
-                    return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                elif isinstance(d, list):
-                    return [remove_emoji_from_dict(item) for item in d]
-                elif isinstance(d, str):
-                    return emoji_pattern.sub('', d)
-                return d
-            project_dict_no_emoji = remove_emoji_from_dict(project_dict)
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(project_dict_no_emoji, f, indent=2, ensure_ascii=False)
-            logger.info(f"project.json written without emoji for {project_id}")
+        project.revision = 0
+        project_dict['revision'] = 0
+        with self.project_lock(project_id):
+            write_json_atomic(json_path, project_dict)
         
         # TITLE.txt 생성
         self._write_title_txt(project_id, project_dict['title'], now)
+        self._notify_change(project_id)
         
         return project
     
+    def project_lock(self, project_id: str):
+        """프로젝트별 잠금 (with 문으로 읽기-수정-쓰기 구간 직렬화)
+
+        스레드 간 RLock + 프로젝트 폴더 .project.lock 파일 잠금 (render_worker 등 다른 프로세스와 직렬화)
+        """
+        return self._locks.get(project_id, lambda: self._get_project_path(project_id) / LOCK_FILE_NAME)
+
     def _save_project_json(self, project_id: str, project: Project):
-        """project.json 저장"""
+        """project.json 저장 (원자적 교체, revision 검사 후 1 증가)
+
+        Raises:
+            ProjectConflictError: project.revision이 디스크 revision과 다를 때
+        """
         json_path = self._get_project_json_path(project_id)
         data = project.to_dict()
         
-        # folderName 유지 (기존 값이 있으면 유지, 없으면 project_id 사용)
-        if 'folderName' not in data:
-            # 기존 project.json에서 folderName 읽기 시도
-            try:
-                if json_path.exists():
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                        if 'folderName' in existing_data:
-                            data['folderName'] = existing_data['folderName']
-            except:
-                pass
-            
-            # 여전히 없으면 project_id 사용 (기존 프로젝트 호환성)
-            if 'folderName' not in data:
-                data['folderName'] = project_id
-        
         try:
-            with open(json_path, 'w', encoding='utf-8', errors='replace') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except (UnicodeEncodeError, UnicodeDecodeError) as e:
-            logger.error(f"Unicode error in _save_project_json for {project_id}: {e}")
-            # 이모지 제거 후 재시도
-            import re
-            emoji_pattern = re.compile("["
-                "\U0001F600-\U0001F64F"
-                "\U0001F300-\U0001F5FF"
-                "\U0001F680-\U0001F6FF"
-                "\U0001F700-\U0001F77F"
-                "\U0001F780-\U0001F7FF"
-                "\U0001F800-\U0001F8FF"
-                "\U0001F900-\U0001F9FF"
-                "\U0001FA00-\U0001FA6F"
-                "\U0001FA70-\U0001FAFF"
-                "\u2600-\u26FF"
-                "\u2700-\u27BF"
-                "]+", flags=re.UNICODE)
-            def remove_emoji_from_dict(d):
-                if isinstance(d, dict):
-                    return {k: remove_emoji_from_dict(v) for k, v in d.items()}
-                elif isinstance(d, list):
-                    return [remove_emoji_from_dict(item) for item in d]
-                elif isinstance(d, str):
-                    return emoji_pattern.sub('', d)
-                return d
-            data_no_emoji = remove_emoji_from_dict(data)
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data_no_emoji, f, indent=2, ensure_ascii=False)
-            logger.info(f"project.json saved without emoji for {project_id}")
+            with self.project_lock(project_id):
+                try:
+                    existing_data = read_json(json_path) or {}
+                except (OSError, ValueError):
+                    existing_data = {}
+                current = revision_of(existing_data)
+                if project.revision is not None and int(project.revision) != current:
+                    raise ProjectConflictError(project_id, project.revision, current)
+
+                # folderName 유지 (기존 값이 있으면 유지, 없으면 project_id 사용 - 기존 프로젝트 호환성)
+                if 'folderName' not in data:
+                    data['folderName'] = existing_data.get('folderName') or project_id
+                data['revision'] = current + 1
+                write_json_atomic(json_path, data)
+                project.revision = current + 1
+        finally:
+            self._notify_change(project_id)
+
+    def update_project_json(self, project_id: str, mutate: Callable[[Dict[str, Any]], Any]) -> Optional[Dict[str, Any]]:
+        """project.json 딕셔너리를 잠금 안에서 최신 내용으로 읽어 수정 후 저장
+
+        파생 메타(개수/미리보기/제목 등) 보정용 - 모델 데이터를 덮어쓰지 않으므로 revision은 유지
+        mutate가 False를 반환하면 저장하지 않음
+
+        Returns:
+            저장(또는 읽은) 딕셔너리, project.json이 없으면 None
+        """
+        json_path = self._get_project_json_path(project_id)
+        with self.project_lock(project_id):
+            data = read_json(json_path)
+            if data is None:
+                return None
+            if mutate(data) is not False:
+                write_json_atomic(json_path, data)
+        return data
+
+    def modify_project(self, project_id: str, mutate: Callable[[Project], Any]) -> Optional[Project]:
+        """최신 프로젝트를 잠금 안에서 로드 -> mutate(project) -> 저장
+
+        오래 걸리는 작업(이미지/TTS 생성 등) 결과 반영용 - 작업 중 다른 저장이 있어도 충돌 없이 병합
+        mutate가 False를 반환하면 저장하지 않음
+
+        Returns:
+            프로젝트, 없으면 None
+        """
+        with self.project_lock(project_id):
+            project = self.get_project(project_id)
+            if not project:
+                return None
+            if mutate(project) is not False:
+                self._ensure_project_dirs(self.get_project_dir(project_id))
+                self._save_project_json(project_id, project)
+        return project
     
     def get_project(self, project_id: str) -> Optional[Project]:
         """프로젝트 로드"""
         json_path = self._get_project_json_path(project_id)
-        if not json_path.exists():
+        data = read_json(json_path)
+        if data is None:
             return None
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return Project.from_dict(data)
+        project = Project.from_dict(data)
+        project.revision = revision_of(data)
+        return project
+    
+    def get_project_view(self, project_id: str) -> Optional[ProjectView]:
+        """프로젝트 지연 로딩 뷰 (씬은 접근 시 변환 - 목록/통계/메타 보정용)"""
+        data = read_json(self._get_project_json_path(project_id))
+        if data is None:
+            return None
+        view = ProjectView(data)
+        view.header.revision = revision_of(data)
+        return view
     
     def save_project(self, project: Project) -> bool:
         """프로젝트 전체 저장"""
@@ -321,12 +375,18 @@ class ProjectManager:
             self._ensure_project_dirs(self.get_project_dir(project.id))
             self._save_project_json(project.id, project)
             return True
+        except ProjectConflictError:
+            raise
         except Exception as e:
             print(f"Error saving project: {e}")
             return False
     
     def update_project_partial(self, project_id: str, updates: Dict[str, Any]) -> Optional[Project]:
         """프로젝트 부분 업데이트"""
+        with self.project_lock(project_id):
+            return self._update_project_partial_locked(project_id, updates)
+
+    def _update_project_partial_locked(self, project_id: str, updates: Dict[str, Any]) -> Optional[Project]:
         project = self.get_project(project_id)
         if not project:
             return None
@@ -362,6 +422,8 @@ class ProjectManager:
             project_path = self._get_project_path(project_id)
             if project_path.exists():
                 shutil.rmtree(project_path)
+                self.invalidate_dir_cache()
+                self._notify_change(project_id)
                 return True
             return False
         except Exception as e:
@@ -387,9 +449,7 @@ class ProjectManager:
             if not json_path.exists():
                 continue
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                project_id = data.get('id') or self._project_id_from_folder_name(project_dir.name)
+                project_id = peek_project_id(json_path) or self._project_id_from_folder_name(project_dir.name)
                 if project_id:
                     ids.add(project_id)
             except Exception:
@@ -461,8 +521,7 @@ class ProjectManager:
                 if not json_path.exists():
                     continue
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = json_backend.load_path(json_path)
                     project_id = data.get('id')
                 except Exception:
                     project_id = None
@@ -500,6 +559,8 @@ class ProjectManager:
                 detail['renamed'].append({'from': secondary.name, 'to': legacy_path.name})
 
             result['details'].append(detail)
+            self.invalidate_dir_cache()
+            self._notify_change(project_id)
 
         return result
     
@@ -0,0 +1,225 @@
+"""project.json 저장소 (원자적 쓰기 + 프로젝트별 잠금 + revision 충돌 감지)
+
+- 쓰기: 같은 폴더의 임시 파일에 기록 -> fsync -> os.replace (중간에 끊겨도 잘린 JSON이 남지 않음)
+- 잠금: 프로젝트별 RLock + 프로젝트 폴더의 .project.lock 파일 잠금
+  (같은 프로세스의 스레드와 render_worker 등 다른 프로세스의 읽기-수정-쓰기 모두 직렬화)
+- revision: 모델 데이터 저장마다 1 증가, 읽은 revision이 디스크와 다르면 ProjectConflictError
+"""
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from src.common.logger import logger
+from . import json_backend
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# 프로세스 간 잠금 파일 (프로젝트 폴더 안, 내용 없음)
+LOCK_FILE_NAME = '.project.lock'
+
+
+class ProjectConflictError(Exception):
+    """저장하려는 프로젝트가 디스크의 최신 revision보다 오래됨"""
+
+    def __init__(self, project_id: str, expected: Optional[int], actual: int):
+        self.project_id = project_id
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"Project {project_id} was modified concurrently (revision {expected} != {actual})"
+        )
+
+
+_EMOJI_PATTERN = re.compile("["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F700-\U0001F77F"
+    "\U0001F780-\U0001F7FF"
+    "\U0001F800-\U0001F8FF"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F"
+    "\U0001FA70-\U0001FAFF"
+    "\u2600-\u26FF"          # misc symbols
+    "\u2700-\u27BF"          # dingbats
+    "]+", flags=re.UNICODE)
+
+
+def remove_emoji(data: Any) -> Any:
+    """딕셔너리/리스트의 모든 문자열 값에서 이모지 제거"""
+    if isinstance(data, dict):
+        return {k: remove_emoji(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [remove_emoji(item) for item in data]
+    if isinstance(data, str):
+        return _EMOJI_PATTERN.sub('', data)
+    return data
+
+
+def _encode_json(data: Any) -> bytes:
+    """UTF-8 JSON 바이트 (json_backend, 인코딩 불가 문자가 있으면 이모지 제거 후 대체 문자로 재시도)"""
+    try:
+        return json_backend.dumps(data)
+    except (UnicodeEncodeError, UnicodeDecodeError) as e:
+        logger.error(f"Unicode error encoding JSON, retrying without emoji: {e}")
+        if json_backend.is_compact():
+            text = json.dumps(remove_emoji(data), ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(remove_emoji(data), indent=2, ensure_ascii=False)
+        return text.encode('utf-8', errors='replace')
+
+
+def write_json_atomic(path: Path, data: Any):
+    """JSON을 임시 파일에 기록 후 os.replace로 교체 (읽는 쪽은 이전/새 내용 중 하나만 봄)"""
+    path = Path(path)
+    payload = _encode_json(data)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """JSON 읽기 (파일 없으면 None)"""
+    try:
+        return json_backend.load_path(path)
+    except FileNotFoundError:
+        return None
+
+
+# project.json은 to_dict() 순서로 저장되므로 "id"가 첫 키 (들여쓰기/압축 형식 모두) -> 앞부분만 읽어 확인
+_LEADING_ID = re.compile(rb'^\s*\{\s*"id"\s*:\s*"((?:[^"\\]|\\.)*)"\s*[,}]')
+_PEEK_BYTES = 4096
+
+
+def peek_project_id(path: Path) -> Optional[str]:
+    """project.json의 id만 읽기 (첫 키가 id면 앞 4KB만, 아니면 전체 파싱)"""
+    with open(path, 'rb') as f:
+        head = f.read(_PEEK_BYTES)
+    m = _LEADING_ID.match(head)
+    if m:
+        return json.loads(b'"' + m.group(1) + b'"')
+    data = read_json(path) or {}
+    return data.get('id')
+
+
+def revision_of(data: Optional[Dict[str, Any]]) -> int:
+    """project.json 딕셔너리의 revision (없으면 0)"""
+    if not data:
+        return 0
+    try:
+        return int(data.get('revision') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _lock_file(path: Optional[Path]):
+    """잠금 파일 배타 잠금 (대기) - 열린 파일 반환, 폴더가 없거나 열 수 없으면 None"""
+    if path is None or not path.parent.is_dir():
+        return None
+    try:
+        f = open(path, 'a+b')
+    except OSError as e:
+        logger.warning(f"[LOCK] 잠금 파일 열기 실패, 프로세스 내 잠금만 사용: {path} ({e})")
+        return None
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK은 10초 재시도 후 실패 -> 계속 대기
+                    continue
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def _unlock_file(f):
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        f.close()
+
+
+class ProjectLock:
+    """프로젝트 하나의 잠금 (재진입 가능, with 문 사용)
+
+    - 같은 프로세스의 스레드: RLock
+    - 다른 프로세스(render_worker 등): 가장 바깥 획득 시 lock_path()의 파일 잠금 (해제 시 닫음)
+    """
+
+    def __init__(self, lock_path: Optional[Callable[[], Optional[Path]]] = None):
+        self._lock = threading.RLock()
+        self._lock_path = lock_path
+        self._depth = 0
+        self._file = None
+
+    def acquire(self) -> bool:
+        self._lock.acquire()
+        self._depth += 1
+        if self._depth == 1 and self._lock_path is not None:
+            try:
+                self._file = _lock_file(self._lock_path())
+            except BaseException:
+                self._depth -= 1
+                self._lock.release()
+                raise
+        return True
+
+    def release(self):
+        try:
+            if self._depth == 1 and self._file is not None:
+                f, self._file = self._file, None
+                _unlock_file(f)
+        finally:
+            self._depth -= 1
+            self._lock.release()
+
+    def __enter__(self) -> 'ProjectLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class ProjectLocks:
+    """프로젝트 id별 ProjectLock 레지스트리"""
+
+    def __init__(self):
+        self._locks: Dict[str, ProjectLock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, project_id: str, lock_path: Optional[Callable[[], Optional[Path]]] = None) -> ProjectLock:
+        """lock_path: 프로세스 간 잠금 파일 경로 함수 (처음 만들 때만 사용, None이면 프로세스 내 잠금만)"""
+        with self._guard:
+            lock = self._locks.get(project_id)
+            if lock is None:
+                lock = self._locks[project_id] = ProjectLock(lock_path)
+            return lock
@@ -0,0 +1,173 @@
+"""프로젝트 폴더 변경 감시 (메타 인덱스 증분 무효화용)"""
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from src.common.logger import logger
+from backend.project_index import project_stat_signature
+from backend.project_store import LOCK_FILE_NAME
+
+# watchdog은 선택 의존성 (없으면 폴링으로 대체)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+# 내용이 바뀌는 이벤트만 반영 (opened / closed_no_write 등 읽기 전용 접근은 무시:
+# 인덱스가 project.json/scenes.json을 읽을 때마다 다시 dirty 표시되는 것 방지)
+WATCHED_EVENT_TYPES = frozenset(('created', 'deleted', 'modified', 'moved', 'closed'))
+
+# 쓰기 중 임시 파일 접미사 (<이름>.<pid>.<tid>.tmp / .part, 캐시의 .tmp.<확장자> 포함)
+# 최종 파일로 교체되는 이동 이벤트의 dest_path가 따로 보고되므로 임시 파일 자체는 무시
+TRANSIENT_SUFFIXES = ('.tmp', '.part')
+
+
+def is_transient_path(path: Path) -> bool:
+    """잠금 파일/임시 파일 여부 (프로젝트 내용 변경이 아님)"""
+    name = path.name
+    return name == LOCK_FILE_NAME or name.endswith(TRANSIENT_SUFFIXES) or '.tmp.' in name
+
+
+class _ProjectEventHandler(FileSystemEventHandler):
+    """watchdog 이벤트 -> 변경된 프로젝트 폴더 경로"""
+
+    def __init__(self, watcher: 'ProjectWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        event_type = getattr(event, 'event_type', None)
+        if event_type not in WATCHED_EVENT_TYPES:
+            return
+        # 폴더 modified는 하위 파일 생성/삭제마다 함께 오므로 무시 (하위 파일 이벤트로 판단 -
+        # 잠금/임시 파일만 바뀐 경우 폴더 이벤트로 다시 통지되는 것 방지)
+        if event_type == 'modified' and getattr(event, 'is_directory', False):
+            return
+        self.watcher._report_path(getattr(event, 'src_path', None))
+        # 이동/이름변경은 대상 경로도 보고
+        self.watcher._report_path(getattr(event, 'dest_path', None))
+
+
+class ProjectWatcher:
+    """projects/ 루트 감시자
+
+    - watchdog(inotify 등) 사용 가능 시 이벤트 기반, 아니면 폴링 스레드
+    - 변경이 감지된 프로젝트 폴더 경로를 on_change(project_dir)로 전달
+    - 폴링 모드는 프로젝트 폴더별 stat 서명만 비교 (파일 목록 재스캔 없음)
+    """
+
+    def __init__(self, projects_root: Path, on_change: Callable[[Path], None],
+                 mode: str = "auto", poll_interval: float = 2.0):
+        """
+        Args:
+            projects_root: 감시할 projects 루트
+            on_change: 변경된 프로젝트 폴더 경로 콜백
+            mode: auto | watchdog | polling | off
+            poll_interval: 폴링 주기 (초)
+        """
+        self.projects_root = Path(projects_root).resolve()
+        self.on_change = on_change
+        self.mode = mode
+        self.poll_interval = max(0.2, float(poll_interval))
+        self.backend: Optional[str] = None
+        self._observer = None
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._snapshot: Dict[str, Tuple] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.backend is not None
+
+    def start(self) -> Optional[str]:
+        """감시 시작 - 사용된 백엔드 이름 반환 (off면 None)"""
+        if self.running or self.mode == "off":
+            return self.backend
+
+        if self.mode in ("auto", "watchdog") and WATCHDOG_AVAILABLE:
+            try:
+                observer = Observer()
+                observer.schedule(_ProjectEventHandler(self), str(self.projects_root), recursive=True)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+                self.backend = "watchdog"
+            except Exception as e:
+                logger.warning(f"[WATCHER] watchdog start failed, falling back to polling: {e}")
+        elif self.mode == "watchdog":
+            logger.warning("[WATCHER] watchdog not installed, falling back to polling")
+
+        if self.backend is None:
+            self._snapshot = self._scan()
+            self._stop_event.clear()
+            self._poll_thread = threading.Thread(target=self._poll_loop, name="project-watcher", daemon=True)
+            self._poll_thread.start()
+            self.backend = "polling"
+
+        logger.info(f"[WATCHER] started: backend={self.backend} root={self.projects_root}")
+        return self.backend
+
+    def stop(self):
+        """감시 중지"""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+            except Exception as e:
+                logger.warning(f"[WATCHER] observer stop failed: {e}")
+            self._observer = None
+        if self._poll_thread is not None:
+            self._stop_event.set()
+            self._poll_thread.join(timeout=self.poll_interval + 5)
+            self._poll_thread = None
+        self.backend = None
+
+    def _report_path(self, path: Optional[str]):
+        """이벤트 경로를 projects_root 바로 아래 프로젝트 폴더로 변환 후 통지 (잠금/임시 파일 제외)"""
+        if not path or is_transient_path(Path(path)):
+            return
+        try:
+            rel = Path(path).resolve().relative_to(self.projects_root)
+        except (ValueError, OSError):
+            return
+        if not rel.parts:
+            return
+        self._emit(self.projects_root / rel.parts[0])
+
+    def _emit(self, project_dir: Path):
+        try:
+            self.on_change(project_dir)
+        except Exception as e:
+            logger.warning(f"[WATCHER] on_change failed for {project_dir.name}: {e}")
+
+    def _scan(self) -> Dict[str, Tuple]:
+        snapshot = {}
+        try:
+            for folder in self.projects_root.iterdir():
+                if folder.is_dir():
+                    snapshot[folder.name] = project_stat_signature(folder)
+        except OSError as e:
+            logger.warning(f"[WATCHER] scan failed: {e}")
+        return snapshot
+
+    def poll_once(self) -> int:
+        """폴링 1회 - 변경된 프로젝트 폴더 수 반환"""
+        current = self._scan()
+        previous = self._snapshot
+        changed = [name for name, sig in current.items() if previous.get(name) != sig]
+        changed.extend(name for name in previous if name not in current)
+        self._snapshot = current
+        for name in changed:
+            self._emit(self.projects_root / name)
+        return len(changed)
+
+    def _poll_loop(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"[WATCHER] poll failed: {e}")
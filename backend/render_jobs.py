@@ -0,0 +1,323 @@
+"""렌더 작업 (동기 렌더 공용 함수 + 비동기 작업 큐)"""
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+from backend.models import Project
+from src.common.logger import logger
+from src.common.settings import settings
+from src.video.tts import get_audio_duration
+from src.video.render import render_scenes_single_pass, EncodeProfile
+from src.video.render_scheduler import (
+    SegmentJob, render_segments, concat_segments, get_segment_cache, get_render_workers, get_x264_threads
+)
+from src.video.audio_trim import trim_edge_silence, prune_trimmed
+
+
+RENDER_ENGINES = ('segments', 'single_pass')
+
+# 렌더 종류별 (출력 파일, 임시 세그먼트 접두사, concat 목록 파일, 인코딩 프로필)
+RENDER_TARGETS = {
+    'preview': ('preview.mp4', 'temp_scene_', 'concat_list.txt', 'preview'),
+    'final': ('final.mp4', 'temp_final_scene_', 'concat_list_final.txt', 'final'),
+}
+
+JOB_ACTIVE_STATUSES = ('queued', 'running')
+
+
+def resolve_render_engine(data: Dict[str, Any]) -> str:
+    """렌더 엔진 선택 (요청 body 'engine' > settings render.engine > segments)"""
+    engine = (data.get('engine') or settings.get('render.engine', 'segments') or 'segments').strip().lower()
+    if engine not in RENDER_ENGINES:
+        raise ValueError(f"Unknown render engine: {engine} (expected one of {', '.join(RENDER_ENGINES)})")
+    return engine
+
+
+def resolve_trim_silence(data: Dict[str, Any]) -> bool:
+    """앞뒤 무음 정리 여부 (요청 body 'trimSilence' > settings render.trim_silence.enabled)"""
+    return bool(data.get('trimSilence', settings.get('render.trim_silence.enabled', False)))
+
+
+def resolve_subtitles_path(project: Project, project_dir: Path, data: Dict[str, Any]) -> Optional[Path]:
+    """자막 번인 대상 SRT (요청 'subtitles' > 프로젝트 subtitles.enabled, 파일 없으면 None)"""
+    subtitles_setting = project.settings.subtitles if isinstance(project.settings.subtitles, dict) else {}
+    srt_path = project_dir / 'assets' / 'subtitles' / 'subtitles.srt'
+    if bool(data.get('subtitles', subtitles_setting.get('enabled', False))) and srt_path.exists():
+        return srt_path
+    return None
+
+
+def render_project_video(project: Project, project_dir: Path, output_video: Path,
+                         temp_prefix: str, concat_list_name: str,
+                         engine: str = 'segments', srt_path: Path = None,
+                         on_progress: Optional[Callable[[float], None]] = None,
+                         profile: Optional[EncodeProfile] = None,
+                         trim_silence: bool = False,
+                         workers: Optional[int] = None) -> Path:
+    """씬 렌더링 (render_preview/render_final 및 비동기 작업 공용)
+
+    - segments: 씬별 세그먼트 병렬 렌더링 후 씬 순서대로 concat
+      (변경 없는 씬은 renders/segments/ 캐시의 세그먼트를 그대로 concat에 사용)
+    - single_pass: filter_complex 그래프 1개로 한 번에 인코딩 (자막 번인 가능)
+    - profile: 인코딩 프로필 (미리보기는 저해상도/ultrafast, None이면 최종 프로필)
+    - trim_silence: 씬 오디오 앞뒤 무음을 잘라낸 파생 파일(renders/audio_trimmed/)로 렌더
+      (씬 길이는 파생 파일 기준, project.scenes의 durationSec은 원본 오디오 길이 그대로)
+    - workers: 이 렌더가 쓸 동시 인코딩 수 (작업 프로세스별 CPU 몫, None이면 render.workers 기준)
+      single_pass는 libx264 스레드 수를 workers * render.x264_threads로 제한
+
+    Raises:
+        ValueError: 렌더할 씬이 없을 때
+        SegmentRenderError: 씬 세그먼트 렌더링 실패 시
+        RuntimeError: concat / 단일 패스 렌더링 실패 시
+    """
+    renders_dir = output_video.parent
+    jobs = []
+    for idx, scene in enumerate(project.scenes):
+        if not (scene.image_path and scene.audio_path):
+            continue
+        image_file = project_dir / scene.image_path
+        audio_file = project_dir / scene.audio_path
+
+        # 파일 존재 확인
+        if not image_file.exists() or not audio_file.exists():
+            logger.warning(f"씬 파일 없음: {scene.id}")
+            continue
+
+        jobs.append(SegmentJob(
+            index=idx,
+            scene_id=scene.id,
+            image_path=image_file,
+            audio_path=audio_file,
+            output_path=renders_dir / f'{temp_prefix}{len(jobs)}.mp4',
+        ))
+
+    if not jobs:
+        raise ValueError('No scenes to render')
+
+    trimmed_durations = _trim_job_audio(jobs, renders_dir / 'audio_trimmed') if trim_silence else {}
+
+    video_settings = project.settings.video if getattr(project, 'settings', None) else None
+    width = int(video_settings.width) if video_settings else 1280
+    height = int(video_settings.height) if video_settings else 720
+    fps = int(video_settings.fps) if video_settings else 30
+
+    if engine == 'single_pass':
+        scene_by_id = {scene.id: scene for scene in project.scenes}
+        inputs = []
+        for job in jobs:
+            # 씬 길이: 잘린 오디오 길이 > durationSec > 오디오 길이
+            duration = (trimmed_durations.get(job.scene_id) or scene_by_id[job.scene_id].durationSec
+                        or get_audio_duration(str(job.audio_path)))
+            if not duration:
+                raise ValueError(f'Unknown duration for scene {job.scene_id}')
+            inputs.append((str(job.image_path), str(job.audio_path), float(duration)))
+        success = render_scenes_single_pass(
+            inputs,
+            str(output_video),
+            width=width,
+            height=height,
+            fps=fps,
+            srt_path=str(srt_path) if srt_path else None,
+            threads=workers * get_x264_threads() if workers else None,
+            on_progress=on_progress,
+            profile=profile,
+        )
+        if not success:
+            raise RuntimeError('Single-pass render failed')
+        return output_video
+
+    if srt_path:
+        logger.info("segments 엔진은 자막 번인을 지원하지 않음 (single_pass 엔진 사용)")
+
+    concat_file_path = renders_dir / concat_list_name
+    try:
+        segments = render_segments(
+            jobs,
+            width=width,
+            height=height,
+            fps=fps,
+            cache=get_segment_cache(renders_dir),
+            on_progress=on_progress,
+            profile=profile,
+            workers=workers,
+        )
+        concat_segments(segments, output_video, concat_file_path)
+    finally:
+        # 임시 파일 정리 (캐시에 확정된 세그먼트는 이미 이동되어 남지 않음)
+        for job in jobs:
+            if job.output_path.exists():
+                try:
+                    job.output_path.unlink()
+                except OSError:
+                    pass
+        if concat_file_path.exists():
+            concat_file_path.unlink()
+    return output_video
+
+
+def _trim_job_audio(jobs: List[SegmentJob], trimmed_dir: Path) -> Dict[str, float]:
+    """작업 오디오를 앞뒤 무음 정리본으로 교체 (씬별 병렬) - {scene_id: 잘린 길이}"""
+    with ThreadPoolExecutor(max_workers=min(4, len(jobs)), thread_name_prefix="render-trim") as executor:
+        trimmed = list(executor.map(lambda job: trim_edge_silence(job.audio_path, trimmed_dir), jobs))
+    durations = {}
+    for job, (audio_path, duration) in zip(jobs, trimmed):
+        job.audio_path = audio_path
+        if duration:
+            durations[job.scene_id] = round(duration, 3)
+    prune_trimmed(trimmed_dir, keep=[audio_path for audio_path, _ in trimmed])
+    return durations
+
+
+# 작업 프로세스 -> 부모 통지 줄 접두사 (로그 출력과 구분)
+WORKER_MESSAGE_PREFIX = "@@RENDER_JOB "
+
+
+class RenderJobQueue:
+    """비동기 렌더 작업 큐
+
+    - 렌더는 작업마다 별도 프로세스(python -m backend.render_worker)에서 실행
+      (multiprocessing spawn은 __main__(api.py)을 재실행하므로 사용하지 않음)
+    - 동시 실행 프로세스 수는 render.job_workers로 제한, 초과분은 queued 대기
+    - 작업 프로세스마다 세그먼트 인코딩 수를 render 워커 예산 / job_workers로 나눠 지정
+      (프로세스별 풀이 각자 CPU 전체를 쓰지 않도록)
+    - 진행률/결과는 작업 프로세스 stdout 통지 줄을 읽어 기록, 상태 조회 API로 폴링
+    - 같은 프로젝트/종류의 작업이 진행 중이면 새 작업 대신 기존 작업 반환
+    """
+
+    def __init__(self, projects_root: Path, max_workers: Optional[int] = None, max_history: int = 200):
+        self.projects_root = str(Path(projects_root).resolve())
+        self.max_workers = max_workers
+        self.max_history = max_history
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._segment_workers = 1
+
+    def _ensure_started(self):
+        if self._executor is not None:
+            return
+        workers = max(1, self.max_workers or int(settings.get('render.job_workers', 2) or 2))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render-job")
+        self._segment_workers = max(1, get_render_workers() // workers)
+        logger.info(f"[RENDER_JOB] job runner started: workers={workers} segment_workers_per_job={self._segment_workers}")
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _prune(self):
+        """완료된 오래된 작업 기록 정리 (dict는 삽입 순서 유지)"""
+        excess = len(self._jobs) - self.max_history
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, rec in self._jobs.items() if rec['status'] not in JOB_ACTIVE_STATUSES][:excess]:
+            del self._jobs[job_id]
+
+    def submit(self, project_id: str, kind: str, engine: str = 'segments',
+               srt_path: Optional[Path] = None, trim_silence: bool = False) -> Dict[str, Any]:
+        """렌더 작업 등록 -> 작업 기록 반환"""
+        if kind not in RENDER_TARGETS:
+            raise ValueError(f"Unknown render kind: {kind}")
+        with self._lock:
+            self._ensure_started()
+            for record in reversed(list(self._jobs.values())):
+                if (record['projectId'] == project_id and record['kind'] == kind
+                        and record['status'] in JOB_ACTIVE_STATUSES):
+                    return dict(record)
+
+            job_id = f"r_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}"
+            record = {
+                'id': job_id,
+                'projectId': project_id,
+                'kind': kind,
+                'engine': engine,
+                'status': 'queued',
+                'progress': 0.0,
+                'createdAt': datetime.now().isoformat(),
+                'startedAt': None,
+                'finishedAt': None,
+                'videoPath': None,
+                'error': None,
+            }
+            self._jobs[job_id] = record
+            self._prune()
+            self._executor.submit(self._run, job_id, project_id, kind, engine,
+                                  str(srt_path) if srt_path else None, trim_silence)
+            logger.info(f"[RENDER_JOB] queued {job_id} project={project_id} kind={kind} engine={engine}")
+            return dict(record)
+
+    def _run(self, job_id: str, project_id: str, kind: str, engine: str, srt_path: Optional[str],
+             trim_silence: bool = False):
+        """작업 프로세스 실행 + stdout 통지 줄 파싱 (러너 스레드)"""
+        self._update(job_id, status='running', startedAt=datetime.now().isoformat())
+        cmd = [
+            sys.executable, '-m', 'backend.render_worker',
+            '--projects-root', self.projects_root,
+            '--project-id', project_id,
+            '--kind', kind,
+            '--engine', engine,
+            '--workers', str(self._segment_workers),
+        ]
+        if srt_path:
+            cmd += ['--srt', srt_path]
+        if trim_silence:
+            cmd.append('--trim-silence')
+
+        project_root = str(Path(__file__).resolve().parent.parent)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in (project_root, env.get('PYTHONPATH')) if p)
+        env['PYTHONIOENCODING'] = 'utf-8'
+
+        result: Dict[str, Any] = {}
+        try:
+            proc = subprocess.Popen(
+                cmd, cwd=project_root, env=env,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, encoding='utf-8', errors='replace'
+            )
+            tail: List[str] = []
+            for line in proc.stdout:
+                if line.startswith(WORKER_MESSAGE_PREFIX):
+                    try:
+                        message = json.loads(line[len(WORKER_MESSAGE_PREFIX):])
+                    except ValueError:
+                        continue
+                    if 'progress' in message:
+                        self._update(job_id, progress=message['progress'])
+                    if 'status' in message:
+                        result = message
+                else:
+                    tail = (tail + [line.rstrip()])[-20:]
+            proc.wait()
+            if not result:
+                result = {'status': 'failed',
+                          'error': f"render worker exited with code {proc.returncode}: " + " | ".join(tail[-3:])}
+        except Exception as e:
+            result = {'status': 'failed', 'error': str(e)}
+
+        if result.get('status') == 'done':
+            self._update(job_id, status='done', progress=1.0, videoPath=result.get('videoPath'),
+                         finishedAt=datetime.now().isoformat())
+            logger.info(f"[RENDER_JOB] done {job_id}")
+        else:
+            self._update(job_id, status='failed', error=result.get('error'), finishedAt=datetime.now().isoformat())
+            logger.error(f"[RENDER_JOB] failed {job_id}: {result.get('error')}")
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회"""
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record else None
+
+    def list(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """작업 목록 (최신순, project_id 지정 시 해당 프로젝트만)"""
+        with self._lock:
+            return [dict(r) for r in reversed(list(self._jobs.values()))
+                    if project_id is None or r['projectId'] == project_id]
@@ -0,0 +1,70 @@
+"""비동기 렌더 작업 프로세스 진입점 (python -m backend.render_worker)
+
+RenderJobQueue가 작업마다 실행하며, 진행률/결과는 stdout에
+WORKER_MESSAGE_PREFIX + JSON 한 줄로 통지합니다.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from backend.project_manager import ProjectManager
+from backend.render_jobs import (
+    RENDER_TARGETS, RENDER_ENGINES, WORKER_MESSAGE_PREFIX, render_project_video
+)
+from src.video.render import get_encode_profile
+
+
+def _emit(**message):
+    sys.stdout.write(WORKER_MESSAGE_PREFIX + json.dumps(message, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="render worker")
+    parser.add_argument('--projects-root', required=True)
+    parser.add_argument('--project-id', required=True)
+    parser.add_argument('--kind', choices=sorted(RENDER_TARGETS), required=True)
+    parser.add_argument('--engine', choices=RENDER_ENGINES, default='segments')
+    parser.add_argument('--srt', default=None)
+    parser.add_argument('--trim-silence', action='store_true')
+    parser.add_argument('--workers', type=int, default=None, help="동시 세그먼트 인코딩 수 (작업별 CPU 몫)")
+    args = parser.parse_args(argv)
+
+    try:
+        pm = ProjectManager(projects_root=args.projects_root)
+        project = pm.get_project(args.project_id)
+        if not project:
+            raise ValueError('Project not found')
+
+        project_dir = pm.get_project_dir(args.project_id)
+        renders_dir = project_dir / 'renders'
+        renders_dir.mkdir(parents=True, exist_ok=True)
+        output_name, temp_prefix, concat_list_name, profile_name = RENDER_TARGETS[args.kind]
+
+        last_reported = [-1.0]
+
+        def _on_progress(fraction: float):
+            # 1% 단위로만 통지
+            if fraction - last_reported[0] >= 0.01 or fraction >= 1.0:
+                last_reported[0] = fraction
+                _emit(progress=round(fraction, 3))
+
+        render_project_video(
+            project, project_dir, renders_dir / output_name, temp_prefix, concat_list_name,
+            engine=args.engine,
+            srt_path=Path(args.srt) if args.srt else None,
+            on_progress=_on_progress,
+            profile=get_encode_profile(profile_name),
+            trim_silence=args.trim_silence,
+            workers=args.workers,
+        )
+        _emit(status='done', videoPath=f'renders/{output_name}')
+        return 0
+    except Exception as e:
+        _emit(status='failed', error=str(e))
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""프로젝트 모델 벤치마크: slots + 필드 표 인코더/디코더 vs 이전 asdict 방식
+
+사용법:
+    python bench_models.py --scenes 200 --repeat 200
+
+씬 N개짜리 프로젝트 딕셔너리로 from_dict -> to_dict 왕복 시간을 재고,
+이전 방식(씬마다 필드 집합 재생성 + dataclasses.asdict 깊은 복사)과 결과가 같은지,
+씬 객체 메모리(__dict__ 있는 dataclass 대비)를 함께 출력합니다.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, asdict, field, fields, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from backend.models import Project, Scene, scene_dict_aliases
+
+
+def make_project(n_scenes: int) -> dict:
+    """벤치마크용 project.json 딕셔너리 (프론트 호환 키 포함)"""
+    scenes = []
+    for i in range(n_scenes):
+        scenes.append({
+            'id': f'scene_{i:03d}',
+            'title': f'씬 {i}',
+            'narration_ko': f'{i}번째 씬 내레이션입니다. ' * 3,
+            'text': f'{i}번째 씬 내레이션입니다. ' * 3,
+            'image_prompt_en': f'cinematic shot of scene {i}, soft light',
+            'imagePrompt': f'cinematic shot of scene {i}, soft light',
+            'prompt': f'cinematic shot of scene {i}, soft light',
+            'image_path': f'assets/images/scene_{i:03d}.png',
+            'audio_path': f'assets/audio/scene_{i:03d}.mp3',
+            'durationSec': 4.5 + i % 3,
+            'sequence': i,
+            'effects': {'zoom': 1.1, 'pan': 'left'},
+            'ttsStatus': 'done',
+        })
+    return {
+        'id': 'bench_project', 'createdAt': '2025-01-01T00:00:00', 'updatedAt': '2025-01-01T00:00:00',
+        'topic': '벤치마크', 'script': '대본 ' * 200, 'blueprint': {'tone': 'calm'},
+        'characters': [{'id': 'c1', 'name': '화자', 'description': 'narrator'}],
+        'scenes': scenes, 'thumbnail': {'text': '제목'},
+        'settings': {'video': {'fps': 30}, 'subtitles': {'enabled': True}},
+        'status': {'script': 'done'}, 'lastRun': {'timingsMs': {'tts': 1200}}, 'revision': 7,
+    }
+
+
+def legacy_scene_kwargs(s: dict) -> dict:
+    """이전 디코더: 씬 딕셔너리 복사 후 별칭 처리, 씬마다 유효 필드 집합 재생성"""
+    s_copy = dict(s)
+    if 'text' in s_copy and not s_copy.get('narration_ko'):
+        s_copy['narration_ko'] = s_copy['text']
+    if 'duration' in s_copy:
+        if not s_copy.get('durationSec'):
+            s_copy['durationSec'] = s_copy.get('duration')
+        del s_copy['duration']
+    for alias in ('imagePrompt', 'prompt'):
+        if alias in s_copy:
+            if not s_copy.get('image_prompt_en'):
+                s_copy['image_prompt_en'] = s_copy.get(alias)
+            del s_copy[alias]
+    valid_fields = {f.name for f in Scene.__dataclass_fields__.values()}
+    return {k: v for k, v in s_copy.items() if k in valid_fields}
+
+
+def legacy_round_trip(data: dict) -> dict:
+    """이전 방식 왕복 (씬 디코딩 + asdict 인코딩, 헤더 디코딩은 현재 모델과 같은 경로)"""
+    project = Project.from_dict({k: v for k, v in data.items() if k != 'scenes'})
+    project.scenes = [Scene(**legacy_scene_kwargs(s)) for s in data['scenes']]
+    chars = []
+    for c in project.characters:
+        cd = asdict(c)
+        cd['description'] = cd['desc_en'] = cd.get('desc_en') or ''
+        chars.append(cd)
+    return {
+        'id': project.id, 'createdAt': project.createdAt, 'created_at': project.createdAt,
+        'updatedAt': project.updatedAt, 'updated_at': project.updatedAt,
+        'topic': project.topic, 'name': project.topic, 'provider': project.provider,
+        'aspectRatio': project.aspectRatio, 'blueprint': project.blueprint, 'script': project.script,
+        'characters': chars,
+        'scenes': [scene_dict_aliases(asdict(s)) for s in project.scenes],
+        'thumbnail': asdict(project.thumbnail), 'settings': asdict(project.settings),
+        'status': asdict(project.status), 'lastRun': asdict(project.lastRun),
+        'revision': project.revision,
+    }
+
+
+def fast_round_trip(data: dict) -> dict:
+    return Project.from_dict(data).to_dict()
+
+
+def timeit(fn, data: dict, repeat: int) -> float:
+    fn(data)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    return (time.perf_counter() - start) / repeat
+
+
+def scene_memory(cls, data: dict) -> int:
+    """씬 객체 리스트 생성 시 할당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [cls(**legacy_scene_kwargs(s)) for s in data['scenes']]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objs
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenes', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    data = make_project(args.scenes)
+    assert fast_round_trip(data) == legacy_round_trip(data), "wire format mismatch"
+    print(f"scenes={args.scenes}, repeat={args.repeat} (wire format identical)")
+
+    legacy_s = timeit(legacy_round_trip, data, args.repeat)
+    fast_s = timeit(fast_round_trip, data, args.repeat)
+    decode_s = timeit(Project.from_dict, data, args.repeat)
+    project = Project.from_dict(data)
+    encode_s = timeit(lambda _: project.to_dict(), data, args.repeat)
+    print(f"  legacy round trip : {legacy_s * 1000:7.3f} ms")
+    print(f"  slots round trip  : {fast_s * 1000:7.3f} ms  speedup={legacy_s / fast_s:.2f}x")
+    print(f"    from_dict       : {decode_s * 1000:7.3f} ms")
+    print(f"    to_dict         : {encode_s * 1000:7.3f} ms")
+
+    # __dict__ 기반 같은 필드 dataclass와 씬 메모리 비교
+    dict_scene = make_dataclass('DictScene', [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        if f.default is not MISSING or f.default_factory is not MISSING else (f.name, f.type)
+        for f in fields(Scene)
+    ])
+    dict_bytes = scene_memory(dict_scene, data)
+    slot_bytes = scene_memory(Scene, data)
+    print(f"  scene objects     : __dict__ {dict_bytes / 1024:.1f} KiB -> slots {slot_bytes / 1024:.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
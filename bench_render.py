@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""렌더 엔진 벤치마크: 씬별 세그먼트 + concat vs 단일 패스 filter_complex
+
+사용법:
+    python bench_render.py --scenes 12 --duration 4 --repeat 2
+
+합성 이미지(Pillow)와 사인파 오디오(ffmpeg lavfi)로 임시 프로젝트를 만들어
+두 엔진의 wall time과 출력 길이를 비교합니다. (세그먼트 캐시는 사용하지 않음)
+세그먼트 엔진은 첫 세그먼트의 영상/오디오 스트림 길이 차이가 1프레임을 넘으면 실패로 처리합니다.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PIL import Image
+from src.common.settings import settings
+from src.video.render import render_scenes_single_pass
+from src.video.render_scheduler import SegmentJob, render_segments, concat_segments, get_render_workers
+
+
+def make_inputs(work_dir: Path, count: int, duration: float, width: int, height: int):
+    """합성 씬 입력 생성 -> [(이미지, 오디오, 길이)]"""
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    scenes = []
+    for i in range(count):
+        image_path = work_dir / f"scene_{i}.png"
+        audio_path = work_dir / f"scene_{i}.mp3"
+        Image.new('RGB', (width, height), ((i * 37) % 256, (i * 91) % 256, 120)).save(image_path)
+        subprocess.run(
+            [ffmpeg_path, '-y', '-f', 'lavfi', '-i', f'sine=frequency={220 + i * 20}:duration={duration}',
+             '-c:a', 'libmp3lame', str(audio_path)],
+            capture_output=True, check=True
+        )
+        scenes.append((image_path, audio_path, duration))
+    return scenes
+
+
+def probe_duration(path: Path) -> str:
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    stderr = subprocess.run([ffmpeg_path, '-i', str(path)], capture_output=True, text=True).stderr
+    for line in stderr.splitlines():
+        if 'Duration:' in line:
+            return line.split('Duration:')[1].split(',')[0].strip()
+    return '?'
+
+
+def probe_stream_duration(path: Path, stream: str) -> Optional[float]:
+    """스트림 1개(v/a)를 끝까지 디코딩해 마지막 time= 값으로 길이 측정 (컨테이너 Duration은 긴 쪽 기준)"""
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    stderr = subprocess.run(
+        [ffmpeg_path, '-i', str(path), '-map', f'0:{stream}:0', '-f', 'null', '-'],
+        capture_output=True, text=True
+    ).stderr
+    times = re.findall(r'time=(\d+):(\d+):([\d.]+)', stderr)
+    if not times:
+        return None
+    hours, minutes, seconds = times[-1]
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def check_segment_av_sync(segment: Path, fps: int):
+    """세그먼트의 영상/오디오 스트림 길이 차이가 1프레임 이내인지 확인"""
+    video = probe_stream_duration(segment, 'v')
+    audio = probe_stream_duration(segment, 'a')
+    if video is None or audio is None:
+        raise RuntimeError(f"stream duration probe failed: {segment.name}")
+    drift = abs(video - audio)
+    print(f"  segment a/v     : video={video:.3f}s audio={audio:.3f}s drift={drift:.3f}s")
+    if drift > 1.0 / fps:
+        raise RuntimeError(f"segment a/v duration mismatch: {segment.name} drift={drift:.3f}s")
+
+
+def bench_segments(scenes, out_dir: Path, width: int, height: int, fps: int) -> float:
+    jobs = [
+        SegmentJob(index=i, scene_id=f"s{i}", image_path=img, audio_path=aud,
+                   output_path=out_dir / f"temp_scene_{i}.mp4")
+        for i, (img, aud, _) in enumerate(scenes)
+    ]
+    output = out_dir / "segments.mp4"
+    start = time.perf_counter()
+    segments = render_segments(jobs, width=width, height=height, fps=fps, cache=None)
+    concat_segments(segments, output, out_dir / "concat_list.txt")
+    elapsed = time.perf_counter() - start
+    check_segment_av_sync(segments[0], fps)
+    for job in jobs:
+        job.output_path.unlink(missing_ok=True)
+    print(f"  segments+concat : {elapsed:7.2f}s  duration={probe_duration(output)}")
+    return elapsed
+
+
+def bench_single_pass(scenes, out_dir: Path, width: int, height: int, fps: int) -> float:
+    output = out_dir / "single_pass.mp4"
+    start = time.perf_counter()
+    ok = render_scenes_single_pass([(str(i), str(a), d) for i, a, d in scenes], str(output),
+                                   width=width, height=height, fps=fps)
+    elapsed = time.perf_counter() - start
+    if not ok:
+        raise RuntimeError("single-pass render failed")
+    print(f"  single_pass     : {elapsed:7.2f}s  duration={probe_duration(output)}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenes', type=int, default=12)
+    parser.add_argument('--duration', type=float, default=4.0)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_render_") as tmp:
+        work_dir = Path(tmp)
+        scenes = make_inputs(work_dir, args.scenes, args.duration, args.width, args.height)
+        print(f"scenes={args.scenes} x {args.duration}s, {args.width}x{args.height}@{args.fps}, "
+              f"segment workers={get_render_workers()}")
+
+        seg_times, single_times = [], []
+        for run in range(args.repeat):
+            print(f"run {run + 1}/{args.repeat}")
+            seg_times.append(bench_segments(scenes, work_dir, args.width, args.height, args.fps))
+            single_times.append(bench_single_pass(scenes, work_dir, args.width, args.height, args.fps))
+
+        best_seg, best_single = min(seg_times), min(single_times)
+        print(f"best: segments+concat={best_seg:.2f}s single_pass={best_single:.2f}s "
+              f"speedup={best_seg / best_single:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""무음 검출 벤치마크: NumPy 벡터화 RMS vs 순수 파이썬 루프 vs ffmpeg silencedetect
+
+사용법:
+    python bench_silence.py --minutes 60 --format mp3
+
+말소리 대신 길이가 제각각인 사인파 구간과 약한 잡음 쉼으로 합성 오디오를 만들고
+디코딩/분석 시간과 검출한 쉼 개수(정답 대비)를 출력합니다.
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+from src.common.settings import settings
+from src.video.silence import (
+    DEFAULT_SAMPLE_RATE, DEFAULT_THRESHOLD_DB, DEFAULT_WINDOW,
+    analyze_silence, decode_audio, find_silences
+)
+
+
+def make_audio(path: Path, minutes: float, sample_rate: int, seed: int = 0) -> int:
+    """합성 오디오(wav) 생성 -> 정답 쉼 개수"""
+    rng = np.random.default_rng(seed)
+    total = int(minutes * 60 * sample_rate)
+    pieces, length, pauses = [], 0, 0
+    while length < total:
+        speech = int(rng.uniform(1.0, 4.0) * sample_rate)
+        t = np.arange(speech) / sample_rate
+        pieces.append(0.3 * np.sin(2 * np.pi * rng.uniform(120, 300) * t))
+        gap = int(rng.uniform(0.3, 1.0) * sample_rate)
+        pieces.append(rng.normal(0, 0.001, gap))
+        length += speech + gap
+        pauses += 1
+    signal = np.concatenate(pieces)[:total]
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes())
+    return pauses
+
+
+def naive_silences(samples, sample_rate: int, threshold_db: float, window: float):
+    """비교용 순수 파이썬 창 루프 (같은 판정 규칙)"""
+    win = max(1, int(window * sample_rate))
+    hop = max(1, win // 2)
+    data = samples.tolist()
+    silent = []
+    for start in range(0, len(data) - win + 1, hop):
+        energy = sum(x * x for x in data[start:start + win]) / win
+        silent.append(energy < 10 ** (threshold_db / 10))
+    return sum(1 for i, s in enumerate(silent) if s and (i == 0 or not silent[i - 1]))
+
+
+def ffmpeg_silencedetect(path: Path) -> int:
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    stderr = subprocess.run(
+        [ffmpeg_path, '-nostdin', '-i', str(path), '-af',
+         f'silencedetect=noise={DEFAULT_THRESHOLD_DB}dB:d=0.25', '-f', 'null', '-'],
+        capture_output=True, text=True
+    ).stderr
+    return stderr.count('silence_end')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=float, default=60.0)
+    parser.add_argument('--format', choices=('wav', 'mp3'), default='wav')
+    parser.add_argument('--naive-seconds', type=float, default=60.0,
+                        help='순수 파이썬 루프는 앞부분 N초만 측정 후 전체 길이로 환산')
+    args = parser.parse_args()
+    sr = DEFAULT_SAMPLE_RATE
+
+    with tempfile.TemporaryDirectory(prefix="bench_silence_") as tmp:
+        audio_path = Path(tmp) / "speech.wav"
+        expected = make_audio(audio_path, args.minutes, sr)
+        if args.format == 'mp3':
+            mp3_path = audio_path.with_suffix('.mp3')
+            subprocess.run([settings.get('FFMPEG_PATH', 'ffmpeg'), '-y', '-i', str(audio_path),
+                            '-c:a', 'libmp3lame', '-b:a', '64k', str(mp3_path)], capture_output=True, check=True)
+            audio_path = mp3_path
+        print(f"audio={args.minutes:g} min ({args.format}), expected pauses={expected}")
+
+        start = time.perf_counter()
+        samples = decode_audio(str(audio_path), sr)
+        decode_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        silences = find_silences(samples, sr)
+        numpy_s = time.perf_counter() - start
+        print(f"  decode (ffmpeg pipe) : {decode_s:7.3f}s")
+        print(f"  numpy RMS + runs     : {numpy_s:7.3f}s  silences={len(silences)}")
+
+        start = time.perf_counter()
+        analyze_silence(str(audio_path))
+        first_s = time.perf_counter() - start
+        start = time.perf_counter()
+        analyze_silence(str(audio_path))
+        cached_s = time.perf_counter() - start
+        print(f"  analyze_silence      : {first_s:7.3f}s  (cached: {cached_s * 1000:.2f} ms)")
+
+        head = samples[:int(args.naive_seconds * sr)]
+        start = time.perf_counter()
+        naive_silences(head, sr, DEFAULT_THRESHOLD_DB, DEFAULT_WINDOW)
+        naive_s = (time.perf_counter() - start) * (samples.size / max(1, head.size))
+        print(f"  pure python (est.)   : {naive_s:7.3f}s  speedup={naive_s / numpy_s:.0f}x")
+
+        start = time.perf_counter()
+        detected = ffmpeg_silencedetect(audio_path)
+        ffmpeg_s = time.perf_counter() - start
+        print(f"  ffmpeg silencedetect : {ffmpeg_s:7.3f}s  silences={detected}")
+
+
+if __name__ == '__main__':
+    main()
@@ -25,7 +25,7 @@ if load_dotenv is not None:
 
 from src.common.logger import logger
 from src.common.settings import get_outputs_root, get_config_root
-from src.video.tts import generate_tts, get_audio_duration
+from src.video.tts import generate_tts_chunked
 from src.video.srt import generate_srt
 from src.video.render import create_placeholder_image, render_video, render_video_simple
 
@@ -91,23 +91,24 @@ def run_pipeline(
         image_path.parent.mkdir(parents=True, exist_ok=True)
         video_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 3) TTS 생성
+        # 3) TTS 생성 (문장 단위 병렬 합성 후 결합)
         logger.info("\n[2/5] TTS 생성 중...")
-        if not generate_tts(script_text, str(audio_path), voice=voice):
+        tts_result = generate_tts_chunked(script_text, str(audio_path), voice=voice)
+        if tts_result is None:
             logger.error("TTS 생성 실패!")
             return False
 
-        # 4) 오디오 길이 측정
+        # 4) 오디오 길이 (문장별 길이 합)
         logger.info("\n[3/5] 오디오 길이 측정 중...")
-        audio_duration = get_audio_duration(str(audio_path))
-        if audio_duration is None:
-            logger.error("오디오 길이 측정 실패!")
-            return False
+        audio_duration = tts_result.total_duration
+        logger.info(f"오디오 길이: {audio_duration:.2f}초 ({len(tts_result.chunks)}개 문장)")
 
         # 5) SRT 자막 생성
         if enable_subtitles:
             logger.info("\n[4/5] SRT 자막 생성 중...")
-            if not generate_srt(script_text, audio_duration, str(srt_path)):
+            # 문장별 합성 길이로 자막 타이밍 계산
+            if not generate_srt(script_text, audio_duration, str(srt_path),
+                                sentences=tts_result.chunks, durations=tts_result.durations):
                 logger.error("SRT 생성 실패!")
                 return False
 
@@ -0,0 +1,160 @@
+"""씬 오디오 앞뒤 무음 정리 (원본은 그대로 두고 잘라낸 파생 파일을 캐시)"""
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+from ..common.logger import logger
+from ..common.settings import settings
+from .segment_cache import file_sha256
+from .silence import SilenceAnalysis, analyze_silence
+
+
+DEFAULT_TRIM_PAD = 0.08
+DEFAULT_TRIM_THRESHOLD_DB = -40.0
+DEFAULT_TRIM_MIN_SILENCE = 0.05
+
+# 이보다 짧은 무음만 있으면 자르지 않음 (초)
+_MIN_TRIM = 0.02
+
+
+def get_trim_params() -> Tuple[float, float, float]:
+    """(pad, threshold_db, min_silence) - settings render.trim_silence"""
+    try:
+        pad = float(settings.get('render.trim_silence.pad', DEFAULT_TRIM_PAD))
+        threshold_db = float(settings.get('render.trim_silence.threshold_db', DEFAULT_TRIM_THRESHOLD_DB))
+        min_silence = float(settings.get('render.trim_silence.min_silence', DEFAULT_TRIM_MIN_SILENCE))
+    except (TypeError, ValueError):
+        return DEFAULT_TRIM_PAD, DEFAULT_TRIM_THRESHOLD_DB, DEFAULT_TRIM_MIN_SILENCE
+    return max(0.0, pad), threshold_db, max(0.01, min_silence)
+
+
+def edge_trim_bounds(analysis: SilenceAnalysis, pad: float) -> Optional[Tuple[float, float]]:
+    """잘라낼 (start, end) 구간 - 앞뒤 무음이 _MIN_TRIM 미만이면 None (원본 그대로 사용)"""
+    start, end = analysis.trim_bounds(pad)
+    if start < _MIN_TRIM and analysis.duration - end < _MIN_TRIM:
+        return None
+    return start, end
+
+
+def trim_edge_silence(audio_path: Path, cache_dir: Path, pad: Optional[float] = None,
+                      threshold_db: Optional[float] = None,
+                      min_silence: Optional[float] = None) -> Tuple[Path, Optional[float]]:
+    """
+    앞뒤 무음을 잘라낸 파생 오디오 생성 (cache_dir/<sha256>.wav, 원본 불변)
+
+    - 키: 원본 내용 해시 + 자르는 구간 -> 같은 원본은 다시 자르지 않음
+    - 파생 파일은 무손실 PCM wav (세그먼트 인코딩 시 어차피 재인코딩)
+    - 잘린 길이는 파생 파일 옆 <sha256>.json에 기록 (씬 durationSec은 원본 길이 그대로)
+
+    Returns:
+        (사용할 오디오 경로, 길이) - 자를 것이 없거나 분석 실패 시 원본 경로
+        (분석 실패 시 길이 None)
+    """
+    default_pad, default_threshold, default_min = get_trim_params()
+    pad = default_pad if pad is None else pad
+    threshold_db = default_threshold if threshold_db is None else threshold_db
+    min_silence = default_min if min_silence is None else min_silence
+
+    audio_path = Path(audio_path)
+    analysis = analyze_silence(str(audio_path), threshold_db=threshold_db, min_silence=min_silence)
+    if analysis is None:
+        return audio_path, None
+    bounds = edge_trim_bounds(analysis, pad)
+    if bounds is None:
+        return audio_path, analysis.duration
+    start, end = bounds
+
+    source = file_sha256(audio_path)
+    key = hashlib.sha256(json.dumps({
+        'source': source,
+        'start': round(start, 3),
+        'end': round(end, 3),
+    }, sort_keys=True).encode('utf-8')).hexdigest()
+    output_path = Path(cache_dir) / f"{key}.wav"
+    duration = round(end - start, 3)
+    if output_path.exists() and output_path.stat().st_size > 0:
+        os.utime(output_path, None)
+        return output_path, _read_trimmed_duration(output_path, duration)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    cmd = [
+        ffmpeg_path, '-y', '-v', 'error', '-nostdin',
+        '-i', str(audio_path),
+        '-af', f'atrim=start={start:.3f}:end={end:.3f},asetpts=N/SR/TB',
+        '-c:a', 'pcm_s16le', str(temp_path)
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=120)
+        if result.returncode != 0:
+            logger.warning(f"[TRIM] ffmpeg 실패, 원본 사용: {audio_path.name} "
+                           f"({result.stderr.decode(errors='replace')[-200:]})")
+            return audio_path, analysis.duration
+        os.replace(temp_path, output_path)
+        _write_trim_info(output_path, {
+            'source': source,
+            'start': round(start, 3),
+            'end': round(end, 3),
+            'sourceDuration': round(analysis.duration, 3),
+            'duration': duration,
+        })
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    logger.info(f"[TRIM] {audio_path.name}: {analysis.duration:.2f}s -> {duration:.2f}s")
+    return output_path, duration
+
+
+def _trim_info_path(trimmed_path: Path) -> Path:
+    return Path(trimmed_path).with_suffix('.json')
+
+
+def _write_trim_info(trimmed_path: Path, info: dict):
+    """파생 파일 옆에 잘린 구간/길이 기록 (실패해도 렌더는 계속)"""
+    info_path = _trim_info_path(trimmed_path)
+    temp_path = info_path.with_name(f"{info_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.json")
+    try:
+        temp_path.write_text(json.dumps(info, sort_keys=True), encoding='utf-8')
+        os.replace(temp_path, info_path)
+    except OSError as e:
+        logger.warning(f"[TRIM] 길이 기록 실패: {info_path.name} ({e})")
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def _read_trimmed_duration(trimmed_path: Path, default: float) -> float:
+    """파생 파일 옆 기록의 잘린 길이 (기록이 없거나 깨졌으면 default)"""
+    info_path = _trim_info_path(trimmed_path)
+    try:
+        return float(json.loads(info_path.read_text(encoding='utf-8'))['duration'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return default
+
+
+def prune_trimmed(cache_dir: Path, keep: Iterable[Path]) -> int:
+    """현재 렌더에 쓰이지 않는 파생 파일(+ 길이 기록) 삭제 - 삭제 개수 반환"""
+    cache_dir = Path(cache_dir)
+    if not cache_dir.is_dir():
+        return 0
+    keep_stems = {Path(p).stem for p in keep}
+    removed = 0
+    for f in cache_dir.glob('*.wav'):
+        if f.stem in keep_stems or '.tmp' in f.name:
+            continue
+        try:
+            f.unlink()
+            removed += 1
+        except OSError:
+            pass
+    for f in cache_dir.glob('*.json'):
+        if f.stem in keep_stems or '.tmp' in f.name:
+            continue
+        try:
+            f.unlink()
+        except OSError:
+            pass
+    return removed
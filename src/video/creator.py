@@ -15,6 +15,9 @@ from openai import OpenAI
 from src.common.logger import get_logger
 from src.common.utils import slugify, ensure_dir
 from src.video.subtitles import generate_srt, parse_srt_entries
+from src.video.tts import get_audio_duration
+from src.video.tts_cache import synthesize_cached
+from src.video.tts_stream import write_stream
 
 
 logger = get_logger("video.creator")
@@ -64,32 +67,24 @@ class VideoCreator:
 
         logger.info("TTS 시작: model=%s voice=%s", self.tts_model, self.tts_voice)
 
-        try:
+        def _synthesize(path: Path):
             # call OpenAI TTS endpoint (format is handled server-side)
-            resp = self.client.audio.speech.create(
+            # 응답을 메모리에 모으지 않고 청크 단위로 파일에 기록
+            with self.client.audio.speech.with_streaming_response.create(
                 model=self.tts_model,
                 voice=self.tts_voice,
                 input=text,
-            )
-
-            # write response content to file; support common response shapes
-            data = None
-            if isinstance(resp, (bytes, bytearray)):
-                data = resp
-            elif hasattr(resp, "read"):
-                data = resp.read()
-            elif hasattr(resp, "audio"):
-                data = resp.audio
-            elif hasattr(resp, "content"):
-                data = resp.content
-
-            if data is None:
-                raise RuntimeError("알 수 없는 TTS 응답 형식입니다.")
+            ) as resp:
+                write_stream(resp.iter_bytes(64 * 1024), path)
 
-            with open(audio_path, "wb") as f:
-                f.write(data)
-
-            logger.info("TTS 파일 생성: %s", audio_path)
+        try:
+            # 같은 대본/음성은 TTS 캐시에서 재사용
+            _, cache_hit = synthesize_cached(
+                audio_path, text, _synthesize,
+                lambda path: get_audio_duration(str(path)),
+                provider="openai", model=self.tts_model, voice=self.tts_voice
+            )
+            logger.info("TTS 파일 생성: %s (cache=%s)", audio_path, "hit" if cache_hit else "miss")
             return str(audio_path)
         except Exception as e:
             logger.exception("TTS 생성 실패")
@@ -1,11 +1,114 @@
 """FFmpeg 비디오 렌더링 모듈"""
 import subprocess
 import shutil
+import threading
+from collections import deque
+from dataclasses import dataclass, replace, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PIL import Image
 from ..common.logger import logger
 from ..common.settings import settings
+from .tts import get_audio_duration
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    """인코딩 프로필 (width/height/fps가 None이면 프로젝트 설정값 사용)"""
+    name: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[int] = None
+    preset: str = "medium"
+    crf: int = 23
+    tune: Optional[str] = None
+    audio_bitrate: Optional[str] = None
+    # 정지 이미지 모드: 입력은 초당 1프레임만 디코딩/스케일, 출력 fps는 fps 필터로 복제
+    # (복제 프레임은 긴 GOP에서 P-skip으로 인코딩되어 CPU/용량 절감)
+    still_image: bool = True
+    gop_seconds: float = 10.0
+
+    def resolve(self, width: int, height: int, fps: int) -> Tuple[int, int, int]:
+        """프로필 해상도/fps 적용 (None이면 전달값 유지)"""
+        return (self.width or width, self.height or height, self.fps or fps)
+
+    def input_framerate(self, fps: int) -> int:
+        """루프 이미지 입력 프레임레이트"""
+        return 1 if self.still_image else fps
+
+    def video_filter(self, width: int, height: int, fps: int) -> str:
+        """스케일/패드 (+ 정지 이미지 모드면 출력 fps 복제)"""
+        vf = scale_pad_filter(width, height)
+        if self.still_image:
+            vf += f",fps={fps}"
+        return vf
+
+    def video_args(self, fps: Optional[int] = None) -> List[str]:
+        """libx264 인코더 옵션"""
+        args = ["-preset", self.preset, "-crf", str(self.crf)]
+        tune = self.tune or ("stillimage" if self.still_image else None)
+        if tune:
+            args += ["-tune", tune]
+        if self.still_image and fps:
+            args += ["-g", str(max(1, int(fps * self.gop_seconds)))]
+        return args
+
+    def audio_args(self) -> List[str]:
+        return ["-b:a", self.audio_bitrate] if self.audio_bitrate else []
+
+    def cache_params(self) -> Dict[str, Any]:
+        """세그먼트 캐시 키에 포함할 값"""
+        return asdict(self)
+
+
+# 최종 렌더: 프로젝트 해상도/fps, libx264 기본 화질
+FINAL_PROFILE = EncodeProfile(name="final")
+
+# 미리보기: 저해상도 + 낮은 fps + ultrafast + 높은 CRF (정지 이미지 튜닝)
+PREVIEW_PROFILE = EncodeProfile(
+    name="preview",
+    width=640,
+    height=360,
+    fps=10,
+    preset="ultrafast",
+    crf=32,
+    tune="stillimage",
+    audio_bitrate="96k",
+)
+
+ENCODE_PROFILES = {
+    FINAL_PROFILE.name: FINAL_PROFILE,
+    PREVIEW_PROFILE.name: PREVIEW_PROFILE,
+}
+
+
+def get_encode_profile(name: str) -> EncodeProfile:
+    """인코딩 프로필 조회 (settings.yaml render.profiles.<name>으로 필드 덮어쓰기 가능)"""
+    base = ENCODE_PROFILES.get(name, FINAL_PROFILE)
+    overrides = settings.get(f'render.profiles.{name}', {}) or {}
+    if not isinstance(overrides, dict):
+        return base
+    valid = {k: v for k, v in overrides.items() if k in EncodeProfile.__dataclass_fields__ and k != 'name'}
+    return replace(base, **valid) if valid else base
+
+
+def output_length_args(duration: Optional[float]) -> List[str]:
+    """출력 길이 인자: 길이를 알면 -t로 고정, 모르면 -shortest
+
+    1fps 루프 입력은 -shortest만으로는 영상이 오디오와 다른 프레임 경계에서 끊길 수 있음
+    (입력 쪽 -t는 fps 필터가 마지막 입력 프레임 시각에서 멈춰 영상이 짧아짐)
+    """
+    if duration and duration > 0:
+        return ["-t", f"{float(duration):.3f}"]
+    return ["-shortest"]
+
+
+def scale_pad_filter(width: int, height: int) -> str:
+    """비율 유지 축소/확대 + 레터박스 (출력 해상도 고정 -> concat -c copy 가능)"""
+    return (
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+    )
 
 
 def check_ffmpeg() -> bool:
@@ -31,6 +134,71 @@ def check_ffmpeg() -> bool:
     return False
 
 
+def run_ffmpeg_with_progress(
+    cmd: List[str],
+    total_seconds: Optional[float] = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+    timeout: int = 300,
+    cwd: Optional[str] = None
+) -> subprocess.CompletedProcess:
+    """
+    FFmpeg 실행 + `-progress pipe:1` 출력 파싱으로 진행률 통지
+
+    Args:
+        cmd: FFmpeg 커맨드 (cmd[0]은 ffmpeg 실행 파일)
+        total_seconds: 출력 총 길이 (진행률 계산용)
+        on_progress: 진행률 콜백 (0.0 ~ 1.0)
+        timeout: 타임아웃 (초, 초과 시 프로세스 종료 후 TimeoutExpired)
+        cwd: 작업 디렉토리
+
+    Returns:
+        CompletedProcess (stdout 없음, stderr는 마지막 200줄)
+    """
+    full_cmd = [cmd[0], "-progress", "pipe:1", "-nostats"] + list(cmd[1:])
+    proc = subprocess.Popen(
+        full_cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        cwd=cwd
+    )
+
+    # stderr는 별도 스레드에서 비워야 파이프가 가득 차서 멈추지 않음
+    stderr_tail = deque(maxlen=200)
+    stderr_thread = threading.Thread(target=lambda: stderr_tail.extend(proc.stderr), daemon=True)
+    stderr_thread.start()
+
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        for line in proc.stdout:
+            key, _, value = line.strip().partition('=')
+            if not on_progress:
+                continue
+            # out_time_ms도 실제로는 마이크로초 단위 (FFmpeg 구현 특성)
+            if key in ('out_time_us', 'out_time_ms') and value.isdigit() and total_seconds:
+                on_progress(min(1.0, int(value) / 1_000_000 / total_seconds))
+            elif key == 'progress' and value == 'end':
+                on_progress(1.0)
+        proc.wait()
+    finally:
+        timer.cancel()
+        stderr_thread.join(timeout=5)
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(full_cmd, timeout)
+    return subprocess.CompletedProcess(full_cmd, proc.returncode, stdout='', stderr=''.join(stderr_tail))
+
+
 def create_placeholder_image(output_path: str, width: int = 1280, height: int = 720) -> bool:
     """
     플레이스홀더 이미지 생성 (텍스트 없음, 단색 배경)
@@ -66,7 +234,9 @@ def render_video(
     output_path: str,
     width: int = 1280,
     height: int = 720,
-    fps: int = 24
+    fps: int = 24,
+    profile: Optional[EncodeProfile] = None,
+    duration: Optional[float] = None
 ) -> bool:
     """
     FFmpeg를 사용하여 비디오 렌더링
@@ -82,6 +252,8 @@ def render_video(
         width: 비디오 너비
         height: 비디오 높이
         fps: 프레임레이트
+        profile: 인코딩 프로필 (None이면 FINAL_PROFILE - 정지 이미지 모드)
+        duration: 출력 길이 (초, 없으면 오디오 길이 측정 - 측정 실패 시 -shortest)
     
     Returns:
         성공 여부
@@ -145,16 +317,23 @@ def render_video(
         srt_path_unix = srt_path_unix.replace(':', '\\:')
 
         # 자막 필터 추가 (⚠️ Windows에서는 작은따옴표가 문제를 일으킬 수 있어 제거)
+        profile = profile or FINAL_PROFILE
+        width, height, fps = profile.resolve(width, height, fps)
+        duration = duration or get_audio_duration(audio_path)
         cmd = [
             ffmpeg_path,
             "-loop", "1",
+            "-framerate", str(profile.input_framerate(fps)),
             "-i", image_path_unix,
             "-i", audio_path_unix,
             "-c:v", "libx264",
+            *profile.video_args(fps),
             "-c:a", "aac",
-            "-shortest",
+            *profile.audio_args(),
+            *output_length_args(duration),
             "-pix_fmt", "yuv420p",
-            "-vf", f"subtitles={srt_path_unix}",
+            "-vf", f"{profile.video_filter(width, height, fps)},subtitles={srt_path_unix}",
+            "-r", str(fps),
             output_path_unix
         ]
 
@@ -204,7 +383,11 @@ def render_video_simple(
     output_path: str,
     width: int = 1280,
     height: int = 720,
-    fps: int = 24
+    fps: int = 24,
+    threads: Optional[int] = None,
+    profile: Optional[EncodeProfile] = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+    duration: Optional[float] = None
 ) -> bool:
     """
     자막 없이 간단하게 비디오 렌더링 (테스트용)
@@ -216,6 +399,10 @@ def render_video_simple(
         width: 비디오 너비
         height: 비디오 높이
         fps: 프레임레이트
+        threads: libx264 스레드 수 (None이면 ffmpeg 기본값, 병렬 렌더 시 지정)
+        profile: 인코딩 프로필 (None이면 FINAL_PROFILE, 프로필 해상도/fps가 우선)
+        on_progress: 진행률 콜백 (0.0 ~ 1.0, FFmpeg -progress 기반)
+        duration: 출력 길이 (초, 영상 길이 고정 + 진행률 계산용 - 없으면 오디오 길이 측정)
     
     Returns:
         성공 여부
@@ -259,29 +446,43 @@ def render_video_simple(
         audio_path_unix = str(audio_path).replace('\\', '/')
         output_path_unix = str(output_path).replace('\\', '/')
         
+        profile = profile or FINAL_PROFILE
+        width, height, fps = profile.resolve(width, height, fps)
+        duration = duration or get_audio_duration(audio_path)
+        
         cmd = [
             ffmpeg_path,
             "-y",
             "-loop", "1",
+            "-framerate", str(profile.input_framerate(fps)),
             "-i", image_path_unix,
             "-i", audio_path_unix,
+            "-vf", profile.video_filter(width, height, fps),
+            "-r", str(fps),
             "-c:v", "libx264",
+            *profile.video_args(fps),
             "-c:a", "aac",
-            "-shortest",
+            *profile.audio_args(),
+            *output_length_args(duration),
             "-pix_fmt", "yuv420p",
-            output_path_unix
         ]
+        if threads:
+            cmd += ["-threads", str(int(threads))]
+        cmd.append(output_path_unix)
         
         logger.info(f"FFmpeg 명령: {' '.join(cmd)}")
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=300
-        )
+        if on_progress:
+            result = run_ffmpeg_with_progress(cmd, total_seconds=duration, on_progress=on_progress, timeout=300)
+        else:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=300
+            )
         
         if result.returncode == 0:
             # 출력 파일 크기 확인
@@ -306,3 +507,169 @@ def render_video_simple(
     except Exception as e:
         logger.error(f"❌ 간단 렌더링 실패: {str(e)}")
         return False
+
+
+def build_single_pass_filter(
+    durations: List[float],
+    width: int,
+    height: int,
+    fps: int,
+    subtitles_file: Optional[str] = None
+) -> Tuple[str, str, str]:
+    """
+    단일 패스 렌더링용 filter_complex 그래프 생성
+
+    입력 순서: [이미지0, 오디오0, 이미지1, 오디오1, ...]
+
+    Returns:
+        (filter_complex 문자열, 비디오 출력 라벨, 오디오 출력 라벨)
+    """
+    parts = []
+    concat_inputs = []
+    for i, duration in enumerate(durations):
+        v_in, a_in = 2 * i, 2 * i + 1
+        # 이미지: 해상도 맞춤(레터박스) + 씬 길이만큼 자르기
+        parts.append(
+            f"[{v_in}:v]{scale_pad_filter(width, height)},fps={fps},format=yuv420p,"
+            f"trim=duration={duration:.3f},setpts=PTS-STARTPTS[v{i}]"
+        )
+        # 오디오: 포맷 통일 + 짧으면 무음 패딩, 길면 자르기 (영상/음성 길이 일치)
+        parts.append(
+            f"[{a_in}:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo,"
+            f"apad,atrim=duration={duration:.3f},asetpts=PTS-STARTPTS[a{i}]"
+        )
+        concat_inputs.append(f"[v{i}][a{i}]")
+
+    parts.append(f"{''.join(concat_inputs)}concat=n={len(durations)}:v=1:a=1[vcat][aout]")
+    if subtitles_file:
+        parts.append(f"[vcat]subtitles={subtitles_file}[vout]")
+        return ";".join(parts), "[vout]", "[aout]"
+    return ";".join(parts), "[vcat]", "[aout]"
+
+
+def render_scenes_single_pass(
+    scenes: List[Tuple[str, str, float]],
+    output_path: str,
+    width: int = 1280,
+    height: int = 720,
+    fps: int = 30,
+    srt_path: Optional[str] = None,
+    threads: Optional[int] = None,
+    timeout: int = 1800,
+    on_progress: Optional[Callable[[float], None]] = None,
+    profile: Optional[EncodeProfile] = None
+) -> bool:
+    """
+    다중 씬 단일 패스 렌더링 (filter_complex 1회 인코딩)
+
+    씬별 세그먼트 인코딩 + concat 방식과 달리 FFmpeg 프로세스 1개, 인코딩 1회로 최종 영상 생성
+
+    Args:
+        scenes: [(이미지 경로, 오디오 경로, 씬 길이(초)), ...] 씬 순서
+        output_path: 출력 MP4 경로
+        width: 비디오 너비
+        height: 비디오 높이
+        fps: 프레임레이트
+        srt_path: 자막 파일 경로 (있으면 번인)
+        threads: libx264 스레드 수 (None이면 ffmpeg 기본값)
+        timeout: 타임아웃 (초)
+        on_progress: 진행률 콜백 (0.0 ~ 1.0, FFmpeg -progress 기반)
+        profile: 인코딩 프로필 (None이면 FINAL_PROFILE, 프로필 해상도/fps가 우선)
+
+    Returns:
+        성공 여부
+    """
+    try:
+        if not scenes:
+            logger.error("❌ 렌더할 씬 없음")
+            return False
+
+        for image_path, audio_path, duration in scenes:
+            if not Path(image_path).exists():
+                logger.error(f"❌ 이미지 파일 없음: {image_path}")
+                return False
+            if not Path(audio_path).exists():
+                logger.error(f"❌ 오디오 파일 없음: {audio_path}")
+                return False
+            if not duration or duration <= 0:
+                logger.error(f"❌ 씬 길이 없음: {audio_path}")
+                return False
+
+        output_file = Path(output_path).resolve()
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if output_file.exists():
+            output_file.unlink()
+
+        # 자막은 출력 폴더에 ASCII 이름으로 복사 후 상대 경로로 참조 (필터 경로 이스케이프 회피)
+        subtitles_file = None
+        temp_srt_path = None
+        if srt_path:
+            if Path(srt_path).exists():
+                temp_srt_path = output_file.parent / "subs_single_pass_tmp.srt"
+                shutil.copy2(srt_path, temp_srt_path)
+                subtitles_file = temp_srt_path.name
+            else:
+                logger.warning(f"자막 파일 없음, 자막 없이 렌더링: {srt_path}")
+
+        profile = profile or FINAL_PROFILE
+        width, height, fps = profile.resolve(width, height, fps)
+        durations = [float(d) for _, _, d in scenes]
+        filter_graph, v_out, a_out = build_single_pass_filter(durations, width, height, fps, subtitles_file)
+
+        ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+        cmd = [ffmpeg_path, "-y"]
+        for image_path, audio_path, duration in scenes:
+            # 정지 이미지는 씬 길이만큼만 루프 (프레임 생성량 제한)
+            cmd += [
+                "-loop", "1", "-framerate", str(profile.input_framerate(fps)), "-t", f"{float(duration):.3f}",
+                "-i", str(Path(image_path).resolve()).replace('\\', '/'),
+                "-i", str(Path(audio_path).resolve()).replace('\\', '/'),
+            ]
+        cmd += [
+            "-filter_complex", filter_graph,
+            "-map", v_out,
+            "-map", a_out,
+            "-c:v", "libx264",
+            *profile.video_args(fps),
+            "-c:a", "aac",
+            *profile.audio_args(),
+            "-pix_fmt", "yuv420p",
+            "-r", str(fps),
+        ]
+        if threads:
+            cmd += ["-threads", str(int(threads))]
+        cmd.append(str(output_file).replace('\\', '/'))
+
+        logger.info(f"FFmpeg 단일 패스 렌더링 시작: {len(scenes)}개 씬, 총 {sum(durations):.1f}초")
+
+        try:
+            result = run_ffmpeg_with_progress(
+                cmd,
+                total_seconds=sum(durations),
+                on_progress=on_progress,
+                timeout=timeout,
+                cwd=str(output_file.parent)
+            )
+        finally:
+            if temp_srt_path and temp_srt_path.exists():
+                try:
+                    temp_srt_path.unlink()
+                except OSError:
+                    pass
+
+        if result.returncode == 0 and output_file.exists():
+            logger.info(f"✓ 단일 패스 렌더링 완료: {output_path} ({output_file.stat().st_size} bytes)")
+            return True
+
+        logger.error(f"❌ FFmpeg 단일 패스 렌더링 실패 (exit code: {result.returncode})")
+        if result.stderr:
+            tail = "\n".join(result.stderr.splitlines()[-40:])
+            logger.error("stderr (last 40 lines):\n" + tail)
+        return False
+
+    except subprocess.TimeoutExpired:
+        logger.error(f"❌ FFmpeg 단일 패스 렌더링 타임아웃 ({timeout}초 초과)")
+        return False
+    except Exception as e:
+        logger.error(f"❌ 단일 패스 렌더링 실패: {str(e)}")
+        return False
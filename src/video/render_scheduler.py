@@ -0,0 +1,241 @@
+"""씬 세그먼트 병렬 렌더링 스케줄러"""
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+from ..common.logger import logger
+from ..common.settings import settings
+from .render import render_video_simple, EncodeProfile, FINAL_PROFILE
+from .segment_cache import SegmentCache
+from .tts import get_audio_duration
+
+
+DEFAULT_X264_THREADS = 4
+DEFAULT_SEGMENT_CACHE_MB = 2048
+
+# 세그먼트 인코딩 옵션 식별자 (인코딩 옵션 변경 시 version 증가 -> 기존 캐시 무효화)
+SEGMENT_ENCODE_PARAMS = {
+    'version': 2,
+    'vcodec': 'libx264',
+    'acodec': 'aac',
+    'pix_fmt': 'yuv420p',
+}
+
+
+class SegmentRenderError(RuntimeError):
+    """씬 세그먼트 렌더링 실패"""
+
+    def __init__(self, scene_id: str, message: str = ""):
+        self.scene_id = scene_id
+        super().__init__(message or f"Failed to render scene {scene_id}")
+
+
+@dataclass
+class SegmentJob:
+    """씬 하나의 세그먼트 렌더링 작업"""
+    index: int
+    scene_id: str
+    image_path: Path
+    audio_path: Path
+    output_path: Path
+
+
+def get_x264_threads() -> int:
+    """세그먼트 1개당 libx264 스레드 수 (render.x264_threads)"""
+    try:
+        threads = int(settings.get('render.x264_threads', DEFAULT_X264_THREADS))
+    except (TypeError, ValueError):
+        threads = DEFAULT_X264_THREADS
+    return max(1, threads)
+
+
+def get_render_workers(x264_threads: Optional[int] = None) -> int:
+    """동시 세그먼트 인코딩 수 (render.workers, 0이면 CPU 코어 / x264 스레드)"""
+    try:
+        workers = int(settings.get('render.workers', 0))
+    except (TypeError, ValueError):
+        workers = 0
+    if workers > 0:
+        return workers
+    threads = x264_threads or get_x264_threads()
+    return max(1, (os.cpu_count() or 1) // threads)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """프로세스 전역 워커 풀 (동시 렌더 요청이 와도 인코딩 수는 상한 유지)
+
+    workers: 풀 크기 (처음 만들 때만 사용, None이면 get_render_workers() -
+    작업 프로세스는 RenderJobQueue가 나눠 준 몫을 지정)
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, int(workers)) if workers else get_render_workers()
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render-segment")
+            logger.info(f"[RENDER] segment pool: workers={workers} x264_threads={get_x264_threads()}")
+        return _executor
+
+
+def get_segment_cache(renders_dir: Path) -> Optional[SegmentCache]:
+    """프로젝트 세그먼트 캐시 (render.segment_cache.enabled가 false면 None)"""
+    if not settings.get('render.segment_cache.enabled', True):
+        return None
+    try:
+        max_mb = float(settings.get('render.segment_cache.max_mb', DEFAULT_SEGMENT_CACHE_MB))
+        max_entries = int(settings.get('render.segment_cache.max_entries', 0))
+    except (TypeError, ValueError):
+        max_mb, max_entries = DEFAULT_SEGMENT_CACHE_MB, 0
+    return SegmentCache(Path(renders_dir) / 'segments', max_bytes=int(max_mb * 1024 * 1024), max_entries=max_entries)
+
+
+def render_segments(
+    jobs: List[SegmentJob],
+    width: int = 1280,
+    height: int = 720,
+    fps: int = 30,
+    cache: Optional[SegmentCache] = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+    profile: Optional[EncodeProfile] = None,
+    workers: Optional[int] = None
+) -> List[Path]:
+    """
+    씬 세그먼트를 워커 풀에서 병렬 인코딩
+
+    Args:
+        jobs: 세그먼트 작업 목록 (씬 순서)
+        width: 비디오 너비
+        height: 비디오 높이
+        fps: 프레임레이트
+        cache: 세그먼트 캐시 (있으면 적중한 씬은 인코딩 생략, 새 결과는 캐시에 저장)
+        on_progress: 진행률 콜백 (0.0 ~ 1.0, 세그먼트별 FFmpeg -progress를 오디오 길이 가중 합산)
+        profile: 인코딩 프로필 (None이면 FINAL_PROFILE)
+        workers: 워커 풀 크기 (프로세스에서 처음 렌더할 때만 적용, None이면 get_render_workers())
+
+    Returns:
+        jobs와 같은 순서의 세그먼트 경로 목록 (캐시 사용 시 캐시 내 경로)
+
+    Raises:
+        SegmentRenderError: 하나라도 실패 시 (대기 중인 작업은 취소)
+    """
+    if not jobs:
+        return []
+
+    x264_threads = get_x264_threads()
+    profile = profile or FINAL_PROFILE
+    width, height, fps = profile.resolve(width, height, fps)
+    params = dict(SEGMENT_ENCODE_PARAMS, width=width, height=height, fps=fps, profile=profile.cache_params())
+
+    results: List[Optional[Path]] = [None] * len(jobs)
+    keys: List[Optional[str]] = [None] * len(jobs)
+    pending_jobs = []
+    if cache is not None:
+        cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        for pos, job in enumerate(jobs):
+            keys[pos] = cache.make_key(job.image_path, job.audio_path, params)
+            hit = cache.get(keys[pos])
+            if hit is not None:
+                results[pos] = hit
+            else:
+                # 캐시 디렉토리 안에서 인코딩 후 원자적 이동
+                job.output_path = cache.temp_path_for(keys[pos])
+                pending_jobs.append((pos, job))
+        logger.info(f"[RENDER] segment cache: hits={len(jobs) - len(pending_jobs)} misses={len(pending_jobs)}")
+    else:
+        pending_jobs = list(enumerate(jobs))
+
+    # 진행률 가중치: 세그먼트 길이(오디오 길이, 모르면 1초) - 캐시 적중 세그먼트는 완료로 계산
+    durations = [get_audio_duration(str(job.audio_path)) if on_progress else None for job in jobs]
+    weights = [d or 1.0 for d in durations]
+    total_weight = sum(weights)
+    done_fractions = [1.0] * len(jobs)
+    for pos, _ in pending_jobs:
+        done_fractions[pos] = 0.0
+    progress_lock = threading.Lock()
+
+    def _report(pos: Optional[int] = None, fraction: float = 1.0):
+        if not on_progress:
+            return
+        with progress_lock:
+            if pos is not None:
+                done_fractions[pos] = max(done_fractions[pos], fraction)
+            overall = sum(w * f for w, f in zip(weights, done_fractions)) / total_weight
+        try:
+            on_progress(overall)
+        except Exception as e:
+            logger.warning(f"[RENDER] progress callback failed: {e}")
+
+    def _run(pos: int, job: SegmentJob) -> Path:
+        success = render_video_simple(
+            image_path=str(job.image_path),
+            audio_path=str(job.audio_path),
+            output_path=str(job.output_path),
+            width=width,
+            height=height,
+            fps=fps,
+            threads=x264_threads,
+            profile=profile,
+            on_progress=(lambda fraction: _report(pos, fraction)) if on_progress else None,
+            duration=durations[pos],
+        )
+        if not success or not job.output_path.exists():
+            raise SegmentRenderError(job.scene_id)
+        logger.info(f"씬 렌더링 완료: {job.scene_id}")
+        _report(pos, 1.0)
+        return job.output_path
+
+    _report()
+    executor = _get_executor(workers)
+    futures = [(pos, executor.submit(_run, pos, job)) for pos, job in pending_jobs]
+    done, pending = wait([f for _, f in futures], return_when=FIRST_EXCEPTION)
+    for _, future in futures:
+        if future in done and future.exception() is not None:
+            for p in pending:
+                p.cancel()
+            # 이미 실행 중인 작업은 끝날 때까지 대기 (임시 파일 정리 보장)
+            wait(pending)
+            raise future.exception()
+
+    # 완료 순서와 무관하게 원래 씬 순서 유지
+    for pos, future in futures:
+        rendered = future.result()
+        results[pos] = cache.put(keys[pos], rendered) if cache is not None else rendered
+
+    if cache is not None:
+        cache.evict(keep=[k for k in keys if k])
+    return results
+
+
+def concat_segments(segment_paths: List[Path], output_path: Path, list_path: Path, timeout: int = 300) -> None:
+    """
+    세그먼트를 순서대로 이어붙이기 (재인코딩 없음, -c copy)
+
+    Raises:
+        RuntimeError: ffmpeg concat 실패 시
+    """
+    if len(segment_paths) == 1:
+        import shutil
+        shutil.copy(str(segment_paths[0]), str(output_path))
+        return
+
+    with open(list_path, 'w', encoding='utf-8') as f:
+        for segment in segment_paths:
+            # 세그먼트가 캐시 디렉토리 등 다른 위치에 있을 수 있어 절대 경로 사용 (-safe 0)
+            segment_path = str(Path(segment).resolve()).replace('\\', '/').replace("'", "'\\''")
+            f.write(f"file '{segment_path}'\n")
+
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    concat_cmd = [
+        ffmpeg_path, '-y', '-f', 'concat', '-safe', '0',
+        '-i', str(list_path), '-c', 'copy', str(output_path)
+    ]
+    result = subprocess.run(concat_cmd, capture_output=True, timeout=timeout)
+    if result.returncode != 0:
+        logger.error(f"Concat 실패: {result.stderr.decode(errors='replace')}")
+        raise RuntimeError('Failed to concat videos')
@@ -0,0 +1,125 @@
+"""씬 세그먼트 캐시 (콘텐츠 주소 기반, 변경 없는 씬은 재인코딩 생략)"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from ..common.logger import logger
+
+
+# 파일 해시 메모 (경로, mtime_ns, size) -> sha256 (같은 파일 반복 해싱 방지)
+_file_hash_memo: Dict[Tuple[str, int, int], str] = {}
+_file_hash_lock = threading.Lock()
+_FILE_HASH_MEMO_MAX = 4096
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용 sha256 (mtime/size가 같으면 메모된 값 재사용)"""
+    path = Path(path)
+    st = path.stat()
+    memo_key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    with _file_hash_lock:
+        cached = _file_hash_memo.get(memo_key)
+    if cached:
+        return cached
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _file_hash_lock:
+        if len(_file_hash_memo) >= _FILE_HASH_MEMO_MAX:
+            _file_hash_memo.clear()
+        _file_hash_memo[memo_key] = digest
+    return digest
+
+
+class SegmentCache:
+    """
+    렌더된 씬 세그먼트 캐시 (renders/segments/<sha256>.mp4)
+
+    - 키: 이미지 바이트 + 오디오 바이트 + 인코딩 설정(width/height/fps/codec 등)
+    - 조회 시 mtime 갱신 -> LRU 순서
+    - 총 용량(max_bytes) / 개수(max_entries) 초과 시 오래된 것부터 삭제
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 2 * 1024 ** 3, max_entries: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(0, int(max_entries))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(image_path: Path, audio_path: Path, params: Dict[str, Any]) -> str:
+        """세그먼트 캐시 키 (입력 파일 내용 + 인코딩 파라미터)"""
+        h = hashlib.sha256()
+        h.update(file_sha256(image_path).encode('ascii'))
+        h.update(b'\0')
+        h.update(file_sha256(audio_path).encode('ascii'))
+        h.update(b'\0')
+        h.update(json.dumps(params, sort_keys=True, ensure_ascii=True).encode('utf-8'))
+        return h.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp4"
+
+    def temp_path_for(self, key: str) -> Path:
+        """인코딩 중 임시 출력 경로 (완료 후 put()으로 확정)"""
+        return self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.mp4"
+
+    def get(self, key: str) -> Optional[Path]:
+        """캐시 조회 (있으면 LRU 갱신 후 경로 반환)"""
+        path = self.path_for(key)
+        try:
+            if path.stat().st_size <= 0:
+                return None
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, rendered_path: Path) -> Path:
+        """렌더 결과를 캐시에 확정 (같은 볼륨 내 원자적 이동)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        os.replace(str(rendered_path), str(path))
+        return path
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """용량/개수 제한 초과 시 LRU 순으로 삭제 (keep 키는 보존) - 삭제 개수 반환"""
+        if not self.max_bytes and not self.max_entries:
+            return 0
+        keep_names = {f"{k}.mp4" for k in keep}
+        with self._lock:
+            try:
+                files = []
+                for f in self.cache_dir.iterdir():
+                    if f.suffix != '.mp4' or f.name.endswith('.tmp.mp4'):
+                        continue
+                    st = f.stat()
+                    files.append((st.st_mtime, st.st_size, f))
+            except OSError:
+                return 0
+
+            total = sum(size for _, size, _ in files)
+            count = len(files)
+            removed = 0
+            files.sort(key=lambda x: x[0])  # 오래된 것부터
+            for _, size, f in files:
+                over_size = self.max_bytes and total > self.max_bytes
+                over_count = self.max_entries and count > self.max_entries
+                if not (over_size or over_count):
+                    break
+                if f.name in keep_names:
+                    continue
+                try:
+                    f.unlink()
+                except OSError:
+                    continue
+                total -= size
+                count -= 1
+                removed += 1
+            if removed:
+                logger.info(f"[SEGMENT_CACHE] evicted {removed} segments ({self.cache_dir})")
+            return removed
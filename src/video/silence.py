@@ -0,0 +1,199 @@
+"""무음 구간 검출 (FFmpeg 디코딩 + NumPy 벡터화 RMS)
+
+씬 오디오의 말 사이 쉼 위치를 찾아 자막 타이밍, 앞뒤 무음 정리 등에 사용합니다.
+결과는 오디오 내용 해시 + 검출 파라미터 기준으로 프로세스 내 캐시합니다.
+"""
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..common.logger import logger
+from ..common.settings import settings
+from .segment_cache import file_sha256
+
+
+DEFAULT_SAMPLE_RATE = 16000
+DEFAULT_THRESHOLD_DB = -40.0
+DEFAULT_MIN_SILENCE = 0.25
+DEFAULT_WINDOW = 0.02
+
+
+@dataclass
+class SilenceAnalysis:
+    """무음 검출 결과 (초 단위)"""
+    duration: float
+    silences: List[Tuple[float, float]] = field(default_factory=list)
+
+    @property
+    def leading(self) -> float:
+        """앞쪽 무음 길이"""
+        if self.silences and self.silences[0][0] <= 0.0:
+            return self.silences[0][1]
+        return 0.0
+
+    @property
+    def trailing(self) -> float:
+        """뒤쪽 무음 길이"""
+        if self.silences and self.silences[-1][1] >= self.duration:
+            return self.duration - self.silences[-1][0]
+        return 0.0
+
+    def speech_bounds(self) -> Tuple[float, float]:
+        """말소리 구간 (앞뒤 무음 제외 시작, 끝)"""
+        start, end = self.leading, self.duration - self.trailing
+        if end <= start:
+            return 0.0, self.duration
+        return start, end
+
+    def pauses(self) -> List[Tuple[float, float]]:
+        """말 사이 쉼 (앞뒤 무음 제외)"""
+        return [(s, e) for s, e in self.silences if s > 0.0 and e < self.duration]
+
+    def trim_bounds(self, pad: float = 0.0) -> Tuple[float, float]:
+        """앞뒤 무음 정리 구간 (말소리 앞뒤로 pad초씩 남김)"""
+        start, end = self.speech_bounds()
+        return max(0.0, start - pad), min(self.duration, end + pad)
+
+    def clip(self, start: float, end: float) -> "SilenceAnalysis":
+        """start~end 구간만 잘라낸 오디오 기준으로 옮긴 결과"""
+        silences = []
+        for s, e in self.silences:
+            s, e = max(s, start) - start, min(e, end) - start
+            if e > s:
+                silences.append((round(s, 3), round(e, 3)))
+        return SilenceAnalysis(duration=round(end - start, 3), silences=silences)
+
+
+def decode_audio(audio_path: str, sample_rate: int = DEFAULT_SAMPLE_RATE, timeout: int = 600) -> np.ndarray:
+    """
+    오디오를 모노 float32 PCM으로 디코딩 (ffmpeg 파이프, 임시 파일 없음)
+
+    Raises:
+        RuntimeError: ffmpeg 디코딩 실패 시
+    """
+    ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+    cmd = [
+        ffmpeg_path, '-v', 'error', '-nostdin',
+        '-i', str(audio_path),
+        '-ac', '1', '-ar', str(sample_rate),
+        '-f', 'f32le', '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(f"audio decode failed: {result.stderr.decode(errors='replace')[-300:]}")
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+def rms_db(samples: np.ndarray, window: int, hop: int) -> np.ndarray:
+    """창 단위 RMS 에너지 (dBFS, 창 개수와 무관하게 O(N))
+
+    창이 hop의 정수배면 hop 블록 제곱합을 reshape로 한 번에 구해 이웃 블록을 더하고,
+    아니면 제곱 누적합 차분으로 계산
+    """
+    if samples.size < window:
+        window = max(1, samples.size)
+        hop = min(hop, window)
+    if window % hop == 0:
+        per_window = window // hop
+        n_blocks = samples.size // hop
+        blocks = samples[:n_blocks * hop].reshape(n_blocks, hop)
+        block_energy = np.einsum('ij,ij->i', blocks, blocks, dtype=np.float64)
+        energy = np.lib.stride_tricks.sliding_window_view(block_energy, per_window).sum(axis=1) / window
+    else:
+        squares = np.square(samples, dtype=np.float64)
+        cumsum = np.concatenate(([0.0], np.cumsum(squares)))
+        starts = np.arange(0, samples.size - window + 1, hop)
+        energy = (cumsum[starts + window] - cumsum[starts]) / window
+    return 10.0 * np.log10(np.maximum(energy, 1e-12))
+
+
+def find_silences(
+    samples: np.ndarray,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    threshold_db: float = DEFAULT_THRESHOLD_DB,
+    min_silence: float = DEFAULT_MIN_SILENCE,
+    window: float = DEFAULT_WINDOW
+) -> List[Tuple[float, float]]:
+    """
+    PCM 버퍼에서 무음 구간 검출
+
+    Args:
+        samples: 모노 float32 PCM
+        sample_rate: 샘플레이트
+        threshold_db: 이 값 미만 RMS 창을 무음으로 판정
+        min_silence: 최소 무음 길이 (초)
+        window: RMS 창 길이 (초, hop은 창의 절반)
+
+    Returns:
+        [(시작, 끝)] 초 단위 무음 구간
+    """
+    if samples.size == 0:
+        return []
+    duration = samples.size / sample_rate
+    win = max(1, int(window * sample_rate))
+    hop = max(1, win // 2)
+    silent = rms_db(samples, win, hop) < threshold_db
+    if not silent.any():
+        return []
+
+    # 무음 구간 경계 (False->True 시작, True->False 끝)
+    edges = np.diff(np.concatenate(([False], silent, [False])).astype(np.int8))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    starts = run_starts * hop / sample_rate
+    ends = np.minimum(((run_ends - 1) * hop + win) / sample_rate, duration)
+    # 끝까지 이어지는 무음은 오디오 끝으로
+    ends[run_ends == silent.size] = duration
+    keep = (ends - starts) >= min_silence
+    return [(round(float(s), 3), round(float(e), 3)) for s, e in zip(starts[keep], ends[keep])]
+
+
+_cache: "OrderedDict[tuple, SilenceAnalysis]" = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_MAX = 512
+
+
+def analyze_silence(
+    audio_path: str,
+    threshold_db: float = DEFAULT_THRESHOLD_DB,
+    min_silence: float = DEFAULT_MIN_SILENCE,
+    window: float = DEFAULT_WINDOW,
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+) -> Optional[SilenceAnalysis]:
+    """
+    오디오 파일 무음 분석 (내용 해시 + 파라미터 기준 캐시)
+
+    Returns:
+        SilenceAnalysis, 실패 시 None
+    """
+    try:
+        key = (file_sha256(Path(audio_path)), threshold_db, min_silence, window, sample_rate)
+    except OSError as e:
+        logger.error(f"무음 분석 실패 (파일 없음): {audio_path} ({e})")
+        return None
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    try:
+        samples = decode_audio(audio_path, sample_rate)
+    except Exception as e:
+        logger.error(f"무음 분석 실패: {audio_path} ({e})")
+        return None
+    analysis = SilenceAnalysis(
+        duration=samples.size / sample_rate,
+        silences=find_silences(samples, sample_rate, threshold_db, min_silence, window),
+    )
+    with _cache_lock:
+        _cache[key] = analysis
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return analysis
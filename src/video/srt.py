@@ -1,8 +1,9 @@
 """SRT 자막 생성 모듈"""
 import re
-from typing import List
+from typing import List, Optional, Sequence
 from pathlib import Path
 from ..common.logger import logger
+from .timing import Cue, time_sentences
 
 
 def format_timestamp(seconds: float) -> str:
@@ -61,40 +62,32 @@ def split_sentences_ko(text: str, max_length: int = 100) -> List[str]:
     return result
 
 
-def make_srt(sentences: List[str], total_seconds: float) -> str:
+def cues_to_srt(cues: Sequence[Cue]) -> str:
+    """Cue 리스트를 SRT 형식 문자열로 변환 (번호는 1부터 순서대로)"""
+    srt_lines = []
+    for idx, cue in enumerate(cues):
+        srt_lines.append(f"{idx + 1}")
+        srt_lines.append(f"{format_timestamp(cue.start)} --> {format_timestamp(cue.end)}")
+        srt_lines.append(cue.text)
+        srt_lines.append("")  # 빈 줄
+    return "\n".join(srt_lines)
+
+
+def make_srt(sentences: List[str], total_seconds: float, durations: Optional[List[float]] = None) -> str:
     """
-    문장 리스트를 SRT 형식으로 생성 (균등 분배)
+    문장 리스트를 SRT 형식으로 생성
     
     Args:
         sentences: 문장 리스트
         total_seconds: 전체 오디오 길이 (초)
+        durations: 문장별 실제 음성 길이 (없으면 글자 수 가중 분배)
     
     Returns:
         SRT 형식 문자열
     """
     if not sentences:
         return ""
-    
-    srt_lines = []
-    num_sentences = len(sentences)
-    
-    # 각 문장 길이 (균등 분배)
-    sentence_duration = total_seconds / num_sentences
-    
-    for idx, sentence in enumerate(sentences):
-        start_time = idx * sentence_duration
-        end_time = (idx + 1) * sentence_duration
-        
-        # 마지막 문장은 정확히 끝시간으로
-        if idx == num_sentences - 1:
-            end_time = total_seconds
-        
-        srt_lines.append(f"{idx + 1}")
-        srt_lines.append(f"{format_timestamp(start_time)} --> {format_timestamp(end_time)}")
-        srt_lines.append(sentence)
-        srt_lines.append("")  # 빈 줄
-    
-    return "\n".join(srt_lines)
+    return cues_to_srt(time_sentences(sentences, total_seconds, durations))
 
 
 def write_srt(srt_path: str, srt_content: str) -> bool:
@@ -127,7 +120,9 @@ def generate_srt(
     text: str,
     audio_duration: float,
     output_path: str,
-    max_sentence_length: int = 100
+    max_sentence_length: int = 100,
+    sentences: Optional[List[str]] = None,
+    durations: Optional[List[float]] = None
 ) -> bool:
     """
     텍스트에서 SRT 자막 생성
@@ -137,6 +132,8 @@ def generate_srt(
         audio_duration: 오디오 길이 (초)
         output_path: SRT 저장 경로
         max_sentence_length: 최대 문장 길이
+        sentences: 이미 분할된 문장 (분할 합성 결과 등, 없으면 text를 분할)
+        durations: sentences별 실제 음성 길이
     
     Returns:
         성공 여부
@@ -145,11 +142,13 @@ def generate_srt(
         logger.info(f"SRT 생성 시작: {audio_duration:.2f}초")
         
         # 문장 분할
-        sentences = split_sentences_ko(text, max_sentence_length)
-        logger.info(f"문장 수: {len(sentences)}")
+        if sentences is None:
+            sentences = split_sentences_ko(text, max_sentence_length)
+            durations = None
+        logger.info(f"문장 수: {len(sentences)} (timing={'durations' if durations else 'weighted'})")
         
         # SRT 생성
-        srt_content = make_srt(sentences, audio_duration)
+        srt_content = make_srt(sentences, audio_duration, durations)
         
         # 저장
         success = write_srt(output_path, srt_content)
@@ -0,0 +1,140 @@
+"""자막 타이밍 엔진 (문장별 실제 음성 길이 기반 cue 계산)
+
+우선순위:
+    1. 문장별 합성 길이 (generate_tts_chunked 결과 등)
+    2. 오디오 무음 구간 (글자 수 가중 경계를 가까운 쉼에 맞춤, src.video.silence)
+    3. 글자 수 가중 분배 (문장 길이에 비례, 균등 분배보다 실제 발화에 가까움)
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+
+@dataclass
+class Cue:
+    """자막 한 줄 (초 단위)"""
+    start: float
+    end: float
+    text: str
+
+
+# 발화 길이에 기여하지 않는 문자 (공백/문장부호)
+_SILENT_CHARS = re.compile(r'[\s\.,!?。、·…~\-\'"“”‘’()\[\]{}:;]+')
+
+# 문장 끝 부호 뒤 쉼 (글자 수 환산)
+_PAUSE_WEIGHT = 1.5
+
+
+def sentence_weight(sentence: str) -> float:
+    """문장 발화 길이 가중치 (발음되는 글자 수 + 문장부호 쉼)"""
+    spoken = len(_SILENT_CHARS.sub('', sentence))
+    pauses = len(re.findall(r'[.!?。,]', sentence))
+    return max(1.0, spoken + pauses * _PAUSE_WEIGHT)
+
+
+def cues_from_durations(sentences: Sequence[str], durations: Sequence[float], offset: float = 0.0) -> List[Cue]:
+    """문장별 실제 길이로 cue 생성 (순서대로 이어붙임)"""
+    if len(sentences) != len(durations):
+        raise ValueError(f"sentences/durations length mismatch: {len(sentences)} != {len(durations)}")
+    cues = []
+    t = offset
+    for sentence, duration in zip(sentences, durations):
+        end = t + max(0.0, float(duration))
+        cues.append(Cue(t, end, sentence))
+        t = end
+    return cues
+
+
+def cues_from_weights(sentences: Sequence[str], total_seconds: float, offset: float = 0.0) -> List[Cue]:
+    """전체 길이를 글자 수 가중치로 분배해 cue 생성 (마지막 cue는 정확히 끝시간)"""
+    if not sentences:
+        return []
+    weights = [sentence_weight(s) for s in sentences]
+    total_weight = sum(weights)
+    cues = []
+    acc = 0.0
+    for idx, (sentence, weight) in enumerate(zip(sentences, weights)):
+        start = offset + total_seconds * acc / total_weight
+        acc += weight
+        end = offset + total_seconds if idx == len(sentences) - 1 else offset + total_seconds * acc / total_weight
+        cues.append(Cue(start, end, sentence))
+    return cues
+
+
+def snap_to_pauses(cues: List[Cue], pauses: Sequence[Tuple[float, float]], tolerance: float = 0.5) -> List[Cue]:
+    """
+    문장 경계를 가장 가까운 쉼(무음 구간 중앙)으로 이동
+
+    경계마다 인접 두 cue 중 짧은 쪽 길이 x tolerance 이내의 쉼만 사용하며,
+    경계 순서는 유지 (쉼 하나를 두 경계가 공유하지 않음)
+    """
+    if len(cues) < 2 or not pauses:
+        return cues
+    mids = sorted((s + e) / 2.0 for s, e in pauses)
+    boundaries = [c.end for c in cues[:-1]]
+    snapped = []
+    prev = cues[0].start
+    j = 0
+    for k, boundary in enumerate(boundaries):
+        limit = tolerance * min(cues[k].end - cues[k].start, cues[k + 1].end - cues[k + 1].start)
+        best = None
+        while j < len(mids) and mids[j] <= prev:
+            j += 1
+        for m_idx in range(j, len(mids)):
+            if mids[m_idx] > boundary + limit:
+                break
+            if abs(mids[m_idx] - boundary) <= limit and (best is None or abs(mids[m_idx] - boundary) < abs(mids[best] - boundary)):
+                best = m_idx
+        if best is not None:
+            boundary = mids[best]
+            j = best + 1
+        snapped.append(boundary)
+        prev = boundary
+    result = []
+    starts = [cues[0].start] + snapped
+    ends = snapped + [cues[-1].end]
+    for cue, start, end in zip(cues, starts, ends):
+        result.append(Cue(start, end, cue.text))
+    return result
+
+
+def time_sentences(
+    sentences: Sequence[str],
+    total_seconds: float,
+    durations: Optional[Sequence[float]] = None,
+    offset: float = 0.0,
+    pauses: Optional[Sequence[Tuple[float, float]]] = None,
+    speech_span: Optional[Tuple[float, float]] = None
+) -> List[Cue]:
+    """
+    문장 cue 계산 (사용 가능한 가장 정확한 정보 사용)
+
+    Args:
+        sentences: 문장 리스트
+        total_seconds: 오디오 전체 길이 (초)
+        durations: 문장별 실제 길이 (있으면 우선, 합계를 total_seconds에 맞춰 보정)
+        offset: 시작 시각 (여러 씬을 이어붙일 때 씬 시작 시각)
+        pauses: 오디오 내 말 사이 쉼 [(시작, 끝)] (오디오 기준 초)
+        speech_span: 앞뒤 무음을 제외한 말소리 구간 (시작, 끝)
+
+    Returns:
+        Cue 리스트
+    """
+    if not sentences:
+        return []
+    if durations and len(durations) == len(sentences) and sum(durations) > 0:
+        # 결합 시 생기는 미세한 오차는 비율로 흡수
+        scale = total_seconds / sum(durations) if total_seconds else 1.0
+        return cues_from_durations(sentences, [d * scale for d in durations], offset)
+    if pauses is not None or speech_span is not None:
+        # 말소리 구간 안에서 가중 분배 후 경계를 쉼에 맞춤 (첫/끝 cue는 씬 경계까지 확장)
+        speech_start, speech_end = speech_span or (0.0, total_seconds)
+        speech_start = max(0.0, min(speech_start, total_seconds))
+        speech_end = max(speech_start, min(speech_end, total_seconds))
+        if speech_end - speech_start <= 0:
+            return cues_from_weights(sentences, total_seconds, offset)
+        cues = snap_to_pauses(cues_from_weights(sentences, speech_end - speech_start, speech_start), pauses or [])
+        cues[0] = Cue(0.0, cues[0].end, cues[0].text)
+        cues[-1] = Cue(cues[-1].start, total_seconds, cues[-1].text)
+        return [Cue(c.start + offset, c.end + offset, c.text) for c in cues]
+    return cues_from_weights(sentences, total_seconds, offset)
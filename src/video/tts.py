@@ -1,9 +1,25 @@
 """TTS(Text-to-Speech) 생성 모듈"""
 import asyncio
+import os
+import re
 import subprocess
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from ..common.logger import logger
+from ..common.settings import settings
+from .tts_cache import get_tts_cache, synthesize_cached, known_duration
+from .tts_stream import part_path_for
+from .srt import split_sentences_ko
+
+try:
+    import edge_tts
+except ImportError:
+    edge_tts = None
 
 
 async def generate_tts_async(
@@ -24,9 +40,7 @@ async def generate_tts_async(
     Returns:
         성공 여부
     """
-    try:
-        import edge_tts
-    except ImportError:
+    if edge_tts is None:
         logger.error("edge-tts 패키지가 설치되지 않았습니다. pip install edge-tts를 실행하세요.")
         return False
     
@@ -40,9 +54,19 @@ async def generate_tts_async(
         # rate는 문자열이어야 함 (예: "+10%", "-10%", "+0%")
         rate_str = f"+{int((rate - 1.0) * 100)}%" if rate >= 1.0 else f"{int((rate - 1.0) * 100)}%"
         
-        # Edge TTS 실행
+        # Edge TTS 실행 (오디오 청크를 .part 파일에 바로 기록, 완료 시 이름 변경)
         communicate = edge_tts.Communicate(text=text, voice=voice, rate=rate_str)
-        await communicate.save(output_path)
+        part_path = part_path_for(output_file)
+        try:
+            with open(part_path, 'wb') as f:
+                async for chunk in communicate.stream():
+                    if chunk.get("type") == "audio" and chunk.get("data"):
+                        f.write(chunk["data"])
+                        f.flush()
+            os.replace(part_path, output_file)
+        finally:
+            if part_path.exists():
+                part_path.unlink()
         
         logger.info(f"TTS 생성 완료: {output_path}")
         return True
@@ -52,6 +76,110 @@ async def generate_tts_async(
         return False
 
 
+class EdgeTTSEngine:
+    """
+    Edge TTS 엔진 (이벤트 루프 1개를 백그라운드 스레드에서 계속 사용)
+
+    - 동시 합성 수는 세마포어로 제한 (max_concurrency)
+    - 동기 API: synthesize / synthesize_many (다른 스레드에서 호출)
+    - 비동기 API: synthesize_async / synthesize_many_async (엔진 루프 또는 임의 루프에서 await)
+    - 배치 항목: {'text', 'output_path', 'voice'(선택), 'rate'(선택)}
+    """
+
+    def __init__(self, voice: str = "ko-KR-SunHiNeural", max_concurrency: int = 4):
+        self.voice = voice
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name="edge-tts-loop", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                logger.info(f"[TTS_ENGINE] event loop started: concurrency={self.max_concurrency}")
+            return self._loop
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 루프별로 생성 (비동기 API를 다른 루프에서 await하는 경우 대비)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(id(loop))
+        if semaphore is None:
+            semaphore = self._semaphores[id(loop)] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def synthesize_async(self, text: str, output_path: str, voice: Optional[str] = None,
+                               rate: float = 1.0) -> bool:
+        """음성 1건 생성 (비동기) - 성공 여부"""
+        async with self._semaphore():
+            return await generate_tts_async(text, output_path, voice or self.voice, rate)
+
+    async def synthesize_many_async(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """여러 건 동시 생성 (비동기) - items 순서대로 성공 여부"""
+        return list(await asyncio.gather(*(
+            self.synthesize_async(item['text'], str(item['output_path']), item.get('voice'), item.get('rate', 1.0))
+            for item in items
+        )))
+
+    def _submit(self, coro) -> Future:
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("sync TTS API called from the engine loop; await the async API instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def synthesize(self, text: str, output_path: str, voice: Optional[str] = None,
+                   rate: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """음성 1건 생성 (동기) - 성공 여부"""
+        return self._submit(self.synthesize_async(text, output_path, voice, rate)).result(timeout)
+
+    def synthesize_many(self, items: List[Dict[str, Any]], timeout: Optional[float] = None) -> List[bool]:
+        """여러 건 동시 생성 (동기) - items 순서대로 성공 여부"""
+        return self._submit(self.synthesize_many_async(items)).result(timeout)
+
+    def close(self):
+        """루프 종료 (이후 호출 시 새 루프 시작)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._semaphores.clear()
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+_engine: Optional[EdgeTTSEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_tts_engine() -> EdgeTTSEngine:
+    """프로세스 공용 Edge TTS 엔진 (동시 합성 수: tts.concurrency)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            try:
+                concurrency = int(settings.get('tts.concurrency', 4) or 4)
+            except (TypeError, ValueError):
+                concurrency = 4
+            _engine = EdgeTTSEngine(max_concurrency=concurrency)
+        return _engine
+
+
 def generate_tts(
     text: str,
     output_path: str,
@@ -69,19 +197,160 @@ def generate_tts(
     
     Returns:
         성공 여부
+
+    같은 텍스트/음성/속도 조합은 TTS 캐시에서 재사용 (tts.cache)
     """
+    def _synthesize(path: Path):
+        # 호출마다 이벤트 루프를 만들지 않고 공용 엔진의 루프에서 실행
+        if not get_tts_engine().synthesize(text, str(path), voice, rate):
+            raise RuntimeError("Edge TTS synthesis failed")
+
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            generate_tts_async(text, output_path, voice, rate)
-        )
-        return result
+        cache = get_tts_cache()
+        if cache is None:
+            _synthesize(Path(output_path))
+            return True
+        synthesize_cached(Path(output_path), text, _synthesize, get_audio_duration,
+                          provider='edge', voice=voice, speed=rate, cache=cache)
+        return True
     except Exception as e:
         logger.error(f"TTS 동기 래퍼 실패: {str(e)}")
         return False
 
 
+@dataclass
+class ChunkedTTSResult:
+    """문장 단위 분할 합성 결과 (chunks[i]의 길이 = durations[i])"""
+    chunks: List[str] = field(default_factory=list)
+    durations: List[float] = field(default_factory=list)
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.durations)
+
+
+# 출력 확장자 -> ffmpeg muxer (임시 .part 경로로 기록하므로 -f 필요, 확장자명과 다른 것들 명시)
+AUDIO_MUXERS = {
+    'mp3': 'mp3',
+    'wav': 'wav',
+    'm4a': 'ipod',
+    'mp4': 'mp4',
+    'aac': 'adts',
+    'ogg': 'ogg',
+    'oga': 'ogg',
+    'opus': 'ogg',
+    'flac': 'flac',
+    'webm': 'webm',
+}
+
+
+def _concat_audio(chunk_paths: List[Path], output_path: Path, timeout: int = 300):
+    """오디오 조각을 순서대로 이어붙이기 (재인코딩 없음, -c copy)
+
+    Raises:
+        RuntimeError: ffmpeg concat 실패 또는 지원하지 않는 출력 확장자
+    """
+    if len(chunk_paths) == 1:
+        shutil.copy2(chunk_paths[0], output_path)
+        return
+    suffix = output_path.suffix.lstrip('.').lower() or 'mp3'
+    muxer = AUDIO_MUXERS.get(suffix)
+    if muxer is None:
+        raise RuntimeError(f"audio concat: unsupported output format .{suffix}")
+    list_path = output_path.with_name(f"{output_path.name}.concat.txt")
+    with open(list_path, 'w', encoding='utf-8') as f:
+        for chunk_path in chunk_paths:
+            escaped = str(Path(chunk_path).resolve()).replace('\\', '/').replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    part_path = part_path_for(output_path)
+    try:
+        ffmpeg_path = settings.get('FFMPEG_PATH', 'ffmpeg')
+        result = subprocess.run(
+            [ffmpeg_path, '-y', '-f', 'concat', '-safe', '0', '-i', str(list_path),
+             '-c', 'copy', '-f', muxer, str(part_path)],
+            capture_output=True, timeout=timeout
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"audio concat failed: {result.stderr.decode(errors='replace')[-500:]}")
+        os.replace(part_path, output_path)
+    finally:
+        list_path.unlink(missing_ok=True)
+        part_path.unlink(missing_ok=True)
+
+
+def generate_tts_chunked(
+    text: str,
+    output_path: str,
+    voice: str = "ko-KR-SunHiNeural",
+    rate: float = 1.0,
+    max_retries: int = 2,
+    concurrency: Optional[int] = None
+) -> Optional[ChunkedTTSResult]:
+    """
+    긴 대본을 문장 단위로 나눠 병렬 합성 후 이어붙이기 (Edge TTS)
+
+    - split_sentences_ko로 분할, 문장마다 generate_tts (TTS 캐시 적용)
+    - 실패한 문장만 재시도 (max_retries회, 재시도 간 지수 대기)
+    - ffmpeg concat -c copy로 재인코딩 없이 결합
+
+    Args:
+        text: 생성할 텍스트
+        output_path: 저장 경로 (mp3/wav)
+        voice: 음성 선택
+        rate: 재생 속도
+        max_retries: 실패 문장 재시도 횟수
+        concurrency: 동시 합성 수 (None이면 tts.concurrency)
+
+    Returns:
+        문장/길이 목록, 실패 시 None
+    """
+    # 문장부호만 남은 조각(줄바꿈 분리자 등)은 합성하지 않음
+    chunks = [c for c in split_sentences_ko(text) if re.search(r'\w', c)]
+    if not chunks:
+        logger.error("TTS 분할 합성: 텍스트가 비어 있습니다")
+        return None
+
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    suffix = output_file.suffix or '.mp3'
+    chunk_dir = output_file.with_name(f"{output_file.stem}.chunks")
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    chunk_paths = [chunk_dir / f"{i:04d}{suffix}" for i in range(len(chunks))]
+    workers = max(1, int(concurrency or get_tts_engine().max_concurrency))
+
+    try:
+        pending = list(range(len(chunks)))
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(min(8.0, 0.5 * (2 ** (attempt - 1))))
+                logger.warning(f"TTS 분할 합성: 실패 {len(pending)}개 재시도 ({attempt}/{max_retries})")
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending)), thread_name_prefix="tts-chunk") as executor:
+                ok = list(executor.map(lambda i: generate_tts(chunks[i], str(chunk_paths[i]), voice, rate), pending))
+            pending = [i for i, success in zip(pending, ok) if not success]
+            if not pending:
+                break
+        if pending:
+            logger.error(f"TTS 분할 합성 실패: {len(pending)}/{len(chunks)}개 문장")
+            return None
+
+        durations = []
+        for chunk_path in chunk_paths:
+            duration = get_audio_duration(str(chunk_path))
+            if duration is None:
+                logger.error(f"TTS 분할 합성: 길이 측정 실패 {chunk_path.name}")
+                return None
+            durations.append(duration)
+
+        _concat_audio(chunk_paths, output_file)
+        logger.info(f"TTS 분할 합성 완료: {len(chunks)}개 문장, {sum(durations):.2f}초")
+        return ChunkedTTSResult(chunks=chunks, durations=durations)
+    except Exception as e:
+        logger.error(f"TTS 분할 합성 실패: {str(e)}")
+        return None
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+
+
 def get_audio_duration(audio_path: str) -> Optional[float]:
     """
     오디오 파일 길이 측정 (mutagen 사용)
@@ -92,6 +361,10 @@ def get_audio_duration(audio_path: str) -> Optional[float]:
     Returns:
         초 단위 길이, 실패 시 None
     """
+    cached = known_duration(Path(audio_path))
+    if cached is not None:
+        return cached
+
     try:
         from mutagen.mp3 import MP3
         from mutagen.wave import WAVE
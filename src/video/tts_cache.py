@@ -0,0 +1,384 @@
+"""TTS 오디오 캐시 (콘텐츠 주소 기반, 프로젝트/씬 간 공유)
+
+같은 (공급자, 모델, 음성, 속도, 포맷, 정규화 텍스트) 조합은 API를 다시 호출하지 않고
+캐시 파일을 assets/audio/로 하드링크(다른 볼륨이면 복사)해서 재사용합니다.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from ..common.logger import logger
+from ..common.settings import settings
+
+
+DEFAULT_TTS_CACHE_DIR = Path(__file__).parent.parent.parent / "storage" / "tts_cache"
+DEFAULT_TTS_CACHE_MB = 1024
+
+# 캐시에서 나간 파일의 길이 메모 (st_dev, st_ino, st_size) -> 초
+# 하드링크는 inode를 공유하므로 assets/audio/ 쪽 경로로 조회해도 적중
+_duration_memo: Dict[Tuple[int, int, int], float] = {}
+_duration_lock = threading.Lock()
+_DURATION_MEMO_MAX = 8192
+
+# 재시작 후에도 재파싱하지 않도록 오디오 옆에 두는 길이 사이드카 (<파일명>.duration.json)
+# inode/크기/mtime이 기록 시점과 같을 때만 사용 (파일이 교체되면 무시)
+DURATION_SIDECAR_SUFFIX = '.duration.json'
+
+
+def _inode_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size)
+
+
+def duration_sidecar_path(path: Path) -> Path:
+    """오디오 파일의 길이 사이드카 경로"""
+    path = Path(path)
+    return path.with_name(path.name + DURATION_SIDECAR_SUFFIX)
+
+
+def _file_identity(st: os.stat_result) -> Dict[str, int]:
+    return {'ino': st.st_ino, 'size': st.st_size, 'mtimeNs': st.st_mtime_ns}
+
+
+def _write_duration_sidecar(path: Path, st: os.stat_result, duration: float):
+    sidecar = duration_sidecar_path(path)
+    temp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp.write_text(json.dumps({'duration': float(duration), **_file_identity(st)}), encoding='utf-8')
+        os.replace(temp, sidecar)
+    except OSError as e:
+        logger.warning(f"[TTS_CACHE] duration sidecar write failed: {sidecar} ({e})")
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+
+
+def _read_duration_sidecar(path: Path, st: os.stat_result) -> Optional[float]:
+    try:
+        with open(duration_sidecar_path(path), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if {k: meta.get(k) for k in ('ino', 'size', 'mtimeNs')} != _file_identity(st):
+            return None
+        return float(meta['duration'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def remember_duration(path: Path, duration: float, persist: bool = False):
+    """파일 길이 메모 (get_audio_duration이 재파싱하지 않도록)
+
+    persist=True면 사이드카에도 기록 (프로젝트 assets/audio/ 쪽 파일, 캐시 파일은 자체 사이드카 사용)
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    with _duration_lock:
+        if len(_duration_memo) >= _DURATION_MEMO_MAX:
+            _duration_memo.clear()
+        _duration_memo[(st.st_dev, st.st_ino, st.st_size)] = float(duration)
+    if persist:
+        _write_duration_sidecar(Path(path), st, duration)
+
+
+def known_duration(path: Path) -> Optional[float]:
+    """메모된 파일 길이 (프로세스 메모 -> 사이드카 순, 없으면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_dev, st.st_ino, st.st_size)
+    with _duration_lock:
+        duration = _duration_memo.get(key)
+    if duration is not None:
+        return duration
+    duration = _read_duration_sidecar(Path(path), st)
+    if duration is not None:
+        with _duration_lock:
+            if len(_duration_memo) >= _DURATION_MEMO_MAX:
+                _duration_memo.clear()
+            _duration_memo[key] = duration
+    return duration
+
+
+def _forget_duration(path: Path):
+    key = _inode_key(path)
+    if key is not None:
+        with _duration_lock:
+            _duration_memo.pop(key, None)
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC + 공백 정리)"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text or '')).strip()
+
+
+def link_or_copy(src: Path, dest: Path):
+    """src를 dest로 하드링크 (실패 시 복사)
+
+    dest는 먼저 삭제 -> 기존 파일을 제자리에서 덮어써 캐시 원본이 바뀌는 일 방지
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        dest.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+class TTSCache:
+    """
+    TTS 오디오 캐시 (storage/tts_cache/<ab>/<sha256>.<fmt> + <sha256>.json)
+
+    - 키: provider/model/voice/speed/format + 정규화 텍스트의 sha256
+    - 사이드카 JSON에 길이(duration) 저장 -> 적중 시 오디오 재파싱 없음
+    - 조회 시 mtime 갱신 -> LRU 순서, 용량/개수 초과 시 오래된 것부터 삭제
+    - 총 용량/개수는 처음 1회 스캔 후 put()마다 증분 갱신 -> 한도 이내면 evict()는 디렉토리를 보지 않음
+      (한도 초과로 실제 삭제할 때만 전체 스캔, 그 결과로 카운터 재보정)
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_TTS_CACHE_MB * 1024 ** 2, max_entries: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(0, int(max_entries))
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # None이면 아직 스캔 전
+        self._count = 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, voice: str, speed: float, fmt: str, text: str) -> str:
+        """캐시 키 (합성 조건 + 정규화 텍스트)"""
+        payload = {
+            'provider': provider,
+            'model': model or '',
+            'voice': voice or '',
+            'speed': round(float(speed or 1.0), 3),
+            'format': fmt,
+            'text': normalize_text(text),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str, fmt: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{fmt}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def temp_path_for(self, key: str, fmt: str) -> Path:
+        """합성 중 임시 출력 경로 (완료 후 put()으로 확정)"""
+        path = self.path_for(key, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.{fmt}")
+
+    def get(self, key: str, fmt: str) -> Optional[Tuple[Path, float]]:
+        """캐시 조회 -> (경로, 길이) 또는 None (적중 시 LRU 갱신)"""
+        path = self.path_for(key, fmt)
+        try:
+            if path.stat().st_size <= 0:
+                return None
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                duration = float(json.load(f)['duration'])
+            os.utime(path, None)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        remember_duration(path, duration)
+        return path, duration
+
+    def put(self, key: str, fmt: str, audio_path: Path, duration: float) -> Path:
+        """합성 결과를 캐시에 확정 (길이 사이드카 먼저 기록 후 원자적 이동)"""
+        path = self.path_for(key, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path = self._meta_path(key)
+        meta_tmp = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(meta_tmp, 'w', encoding='utf-8') as f:
+            json.dump({'duration': float(duration), 'format': fmt}, f)
+        os.replace(meta_tmp, meta_path)
+        size = os.stat(audio_path).st_size
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = None
+            os.replace(str(audio_path), str(path))
+            if self._total_bytes is not None:
+                if replaced is None:
+                    self._count += 1
+                    self._total_bytes += size
+                else:
+                    self._total_bytes += size - replaced
+        remember_duration(path, duration)
+        return path
+
+    def _scan(self):
+        """캐시 오디오 파일 [(mtime, size, path)] (메타/임시 파일 제외)"""
+        files = []
+        for f in self.cache_dir.glob('*/*'):
+            if f.suffix == '.json' or '.tmp' in f.name:
+                continue
+            st = f.stat()
+            files.append((st.st_mtime, st.st_size, f))
+        return files
+
+    def _over_limit(self, total: int, count: int) -> bool:
+        return bool((self.max_bytes and total > self.max_bytes) or (self.max_entries and count > self.max_entries))
+
+    def usage(self) -> Tuple[int, int]:
+        """(총 바이트, 항목 수) - 처음 호출 시 1회 스캔, 이후 증분 카운터"""
+        with self._lock:
+            self._ensure_counted()
+            return self._total_bytes or 0, self._count
+
+    def _ensure_counted(self):
+        if self._total_bytes is not None:
+            return
+        try:
+            files = self._scan()
+        except OSError:
+            files = []
+        self._total_bytes = sum(size for _, size, _ in files)
+        self._count = len(files)
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """용량/개수 제한 초과 시 LRU 순으로 삭제 (keep 키는 보존) - 삭제 개수 반환"""
+        if not self.max_bytes and not self.max_entries:
+            return 0
+        keep = set(keep)
+        with self._lock:
+            self._ensure_counted()
+            if not self._over_limit(self._total_bytes, self._count):
+                return 0
+            try:
+                files = self._scan()
+            except OSError:
+                return 0
+
+            total = sum(size for _, size, _ in files)
+            count = len(files)
+            removed = 0
+            files.sort(key=lambda x: x[0])  # 오래된 것부터
+            for _, size, f in files:
+                if not self._over_limit(total, count):
+                    break
+                key = f.name.split('.', 1)[0]
+                if key in keep:
+                    continue
+                try:
+                    _forget_duration(f)
+                    f.unlink()
+                    self._meta_path(key).unlink(missing_ok=True)
+                except OSError:
+                    continue
+                total -= size
+                count -= 1
+                removed += 1
+            # 다른 프로세스가 같은 캐시에 쓴 만큼의 차이도 여기서 재보정
+            self._total_bytes, self._count = total, count
+            if removed:
+                logger.info(f"[TTS_CACHE] evicted {removed} files ({self.cache_dir})")
+            return removed
+
+
+_cache: Optional[TTSCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> Optional[TTSCache]:
+    """프로세스 공용 TTS 캐시 (tts.cache.enabled가 false면 None)"""
+    global _cache
+    if not settings.get('tts.cache.enabled', True):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                max_mb = float(settings.get('tts.cache.max_mb', DEFAULT_TTS_CACHE_MB))
+                max_entries = int(settings.get('tts.cache.max_entries', 0))
+            except (TypeError, ValueError):
+                max_mb, max_entries = DEFAULT_TTS_CACHE_MB, 0
+            cache_dir = settings.get('tts.cache.dir') or DEFAULT_TTS_CACHE_DIR
+            _cache = TTSCache(Path(cache_dir), max_bytes=int(max_mb * 1024 * 1024), max_entries=max_entries)
+        return _cache
+
+
+def synthesize_cached(
+    dest_path: Path,
+    text: str,
+    synthesize: Callable[[Path], None],
+    measure: Callable[[Path], Optional[float]],
+    provider: str,
+    model: str = '',
+    voice: str = '',
+    speed: float = 1.0,
+    cache: Optional[TTSCache] = None
+) -> Tuple[float, bool]:
+    """
+    캐시를 거쳐 dest_path에 TTS 오디오 생성
+
+    Args:
+        dest_path: 최종 오디오 경로 (확장자가 포맷)
+        text: 합성 텍스트
+        synthesize: 경로를 받아 그 위치에 오디오를 쓰는 함수 (실패 시 예외)
+        measure: 오디오 길이 측정 함수 (실패 시 None)
+        provider/model/voice/speed: 캐시 키 구성 요소
+        cache: 사용할 캐시 (None이면 get_tts_cache())
+
+    Returns:
+        (길이(초), 캐시 적중 여부)
+
+    Raises:
+        RuntimeError: 길이 측정 실패 시
+    """
+    dest_path = Path(dest_path)
+    fmt = dest_path.suffix.lstrip('.').lower()
+    cache = cache if cache is not None else get_tts_cache()
+
+    if cache is None:
+        try:
+            dest_path.unlink()
+        except FileNotFoundError:
+            pass
+        synthesize(dest_path)
+        duration = measure(dest_path)
+        if duration is None:
+            raise RuntimeError("Failed to measure audio duration")
+        remember_duration(dest_path, duration, persist=True)
+        return duration, False
+
+    key = cache.make_key(provider, model, voice, speed, fmt, text)
+    hit = cache.get(key, fmt)
+    if hit is not None:
+        cached_path, duration = hit
+        link_or_copy(cached_path, dest_path)
+        remember_duration(dest_path, duration, persist=True)
+        logger.info(f"[TTS_CACHE] hit {key[:12]} -> {dest_path.name}")
+        return duration, True
+
+    temp_path = cache.temp_path_for(key, fmt)
+    try:
+        synthesize(temp_path)
+        duration = measure(temp_path)
+        if duration is None:
+            raise RuntimeError("Failed to measure audio duration")
+        cached_path = cache.put(key, fmt, temp_path, duration)
+    finally:
+        if temp_path.exists():
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+    link_or_copy(cached_path, dest_path)
+    remember_duration(dest_path, duration, persist=True)
+    cache.evict(keep=[key])
+    return duration, False
@@ -0,0 +1,118 @@
+"""TTS 스트리밍 저장 (청크 단위 기록 + 완료 시 원자적 이름 변경 + 합성 중 부분 파일 제공)"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from ..common.logger import logger
+
+
+class PartialAudio:
+    """합성 중인 오디오 (part_path에 기록 중, 완료 후 final_path로 확정)"""
+
+    def __init__(self, part_path: Path, final_path: Path):
+        self.part_path = Path(part_path)
+        self.final_path = Path(final_path)
+        self.done = threading.Event()
+        self.failed = False
+
+
+# (project_id, 파일명) -> 합성 중인 오디오
+_partials: Dict[Tuple[str, str], PartialAudio] = {}
+_partials_lock = threading.Lock()
+
+
+def register_partial(key: Tuple[str, str], part_path: Path, final_path: Path) -> PartialAudio:
+    """합성 시작 등록 (같은 키의 이전 항목은 교체)"""
+    entry = PartialAudio(part_path, final_path)
+    with _partials_lock:
+        _partials[key] = entry
+    return entry
+
+
+def finish_partial(key: Tuple[str, str], entry: PartialAudio, failed: bool = False):
+    """합성 종료 통지 (tail_partial 대기 해제)"""
+    entry.failed = failed
+    entry.done.set()
+    with _partials_lock:
+        if _partials.get(key) is entry:
+            del _partials[key]
+
+
+def get_partial(key: Tuple[str, str]) -> Optional[PartialAudio]:
+    """합성 중인 오디오 조회 (없으면 None)"""
+    with _partials_lock:
+        return _partials.get(key)
+
+
+def part_path_for(path: Path) -> Path:
+    """기록 중 임시 경로 (<파일명>.<pid>.<tid>.part)"""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.part")
+
+
+def write_stream(chunks: Iterable[bytes], output_path: Path, part_path: Optional[Path] = None) -> int:
+    """
+    오디오 청크를 임시 파일에 순서대로 기록 후 output_path로 원자적 이름 변경
+
+    메모리에는 청크 하나만 유지 (응답 전체를 읽지 않음)
+
+    Returns:
+        기록한 바이트 수
+
+    Raises:
+        청크 반복 중 발생한 예외 (임시 파일은 삭제)
+    """
+    output_path = Path(output_path)
+    part_path = Path(part_path) if part_path else part_path_for(output_path)
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    try:
+        with open(part_path, 'wb') as f:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                f.write(chunk)
+                # 부분 파일을 읽는 쪽이 바로 볼 수 있도록
+                f.flush()
+                written += len(chunk)
+        os.replace(part_path, output_path)
+    finally:
+        if part_path.exists():
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
+    return written
+
+
+def tail_partial(entry: PartialAudio, chunk_size: int = 64 * 1024, poll: float = 0.05,
+                 timeout: float = 300.0) -> Iterator[bytes]:
+    """
+    합성 중인 파일을 늘어나는 대로 읽어 전달 (완료 후 남은 부분은 확정 파일에서 읽음)
+
+    매번 열고 닫아 Windows에서도 기록 측의 이름 변경을 막지 않음
+    """
+    offset = 0
+    deadline = time.monotonic() + timeout
+    while True:
+        done = entry.done.is_set()
+        source = entry.final_path if done else entry.part_path
+        if done and entry.failed:
+            return
+        data = b''
+        try:
+            with open(source, 'rb') as f:
+                f.seek(offset)
+                data = f.read(chunk_size)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[TTS_STREAM] partial read failed: {e}")
+        if data:
+            offset += len(data)
+            yield data
+            continue
+        if done or time.monotonic() > deadline:
+            return
+        time.sleep(poll)
@@ -166,7 +166,7 @@ print("="*60)
 try:
     resp = requests.post(
         f"{API_URL}/api/projects/{PROJECT_ID}/render/preview",
-        json={}
+        json={"async": False}
     )
     
     if resp.status_code == 200:
@@ -358,7 +358,7 @@ print("="*60)
 try:
     resp = requests.post(
         f"{API_URL}/api/projects/{PROJECT_ID}/render/final",
-        json={}
+        json={"async": False}
     )
     
     if resp.status_code == 200:
@@ -0,0 +1,11 @@
+"""pytest 공용 설정 (저장소 루트 import 경로 + 테스트 중 logs/ 파일 로그 생략)"""
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# setup_logger는 핸들러가 이미 있으면 그대로 쓰므로, 먼저 등록해 logs/<시각>.log 생성을 막음
+logging.getLogger("youtube-auto").addHandler(logging.NullHandler())
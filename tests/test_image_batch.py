@@ -0,0 +1,59 @@
+"""이미지 일괄 생성: 토큰 버킷 / 429 재시도 (FakeImageProvider)"""
+import time
+
+import pytest
+
+from backend.image_batch import (
+    FakeImageProvider, RateLimitedError, TokenBucket, generate_with_retry, run_image_batch
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate_per_sec=20, capacity=3)
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    assert bucket.acquire(timeout=0) is False
+    start = time.monotonic()
+    assert bucket.acquire(timeout=1.0)
+    assert time.monotonic() - start >= 0.03
+
+
+def test_token_bucket_pause_blocks_until_resumed():
+    bucket = TokenBucket(rate_per_sec=100, capacity=5)
+    bucket.pause(0.15)
+    assert bucket.acquire(timeout=0.05) is False
+    assert bucket.acquire(timeout=1.0)
+
+
+def test_generate_with_retry_recovers_from_rate_limit():
+    provider = FakeImageProvider(latency=0, rate_limit_every=2)
+    bucket = TokenBucket(rate_per_sec=1000, capacity=10)
+    first = generate_with_retry(provider, "a cat", "256x256", bucket, max_retries=2, base_delay=0.01)
+    second = generate_with_retry(provider, "a cat", "256x256", bucket, max_retries=2, base_delay=0.01)
+    assert first.startswith(PNG_SIGNATURE)
+    assert second == first  # 같은 프롬프트는 같은 색
+    assert provider.calls == 3  # 두 번째 호출이 429 후 재시도
+
+
+def test_generate_with_retry_gives_up():
+    provider = FakeImageProvider(latency=0, rate_limit_every=1)
+    bucket = TokenBucket(rate_per_sec=1000, capacity=10)
+    with pytest.raises(RateLimitedError):
+        generate_with_retry(provider, "always limited", "256x256", bucket, max_retries=2, base_delay=0.01)
+    assert provider.calls == 3
+
+
+def test_run_image_batch_reports_failures_per_item():
+    provider = FakeImageProvider(latency=0, fail_prompts=["broken"])
+    items = [{"sceneId": f"s{i}", "prompt": "broken" if i == 1 else f"scene {i}"} for i in range(4)]
+
+    def _generate(item):
+        provider.generate(item["prompt"], "256x256")
+        return {"ok": True, "sceneId": item["sceneId"]}
+
+    results = {r["sceneId"]: r for r in run_image_batch(items, _generate, concurrency=2)}
+    assert set(results) == {"s0", "s1", "s2", "s3"}
+    assert results["s1"]["ok"] is False
+    assert "fake provider failure" in results["s1"]["error"]
+    assert all(results[s]["ok"] for s in ("s0", "s2", "s3"))
@@ -0,0 +1,86 @@
+"""JSON 백엔드: orjson/표준 json 결과 동일성, 표준 json 대체 경로 (큰 정수, NaN/Infinity)"""
+import json
+import math
+
+import pytest
+
+from backend import json_backend
+
+SAMPLE = {
+    "id": "p_1",
+    "topic": "한글 제목",
+    "scenes": [{"id": "s1", "durationSec": 2.5, "tags": ["a", "b"]}, {"id": "s2", "durationSec": None}],
+    "revision": 3,
+    "archived": False,
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param and json_backend.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_backend, "use_orjson", lambda: request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_round_trip(backend, compact):
+    encoded = json_backend.dumps(SAMPLE, compact=compact)
+    assert isinstance(encoded, bytes)
+    assert json_backend.loads(encoded) == SAMPLE
+    assert "한글 제목" in encoded.decode("utf-8")  # ensure_ascii=False
+    assert (b"\n" in encoded) is not compact
+
+
+def test_matches_stdlib_output(backend):
+    expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode("utf-8")
+    assert json_backend.dumps(SAMPLE, compact=False) == expected
+
+
+def test_big_int_falls_back_to_stdlib(backend):
+    data = {"big": 2 ** 70}
+    assert json_backend.loads(json_backend.dumps(data)) == data
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_non_finite_floats_keep_stdlib_output_when_checked(backend, compact, monkeypatch):
+    monkeypatch.setattr(json_backend, "check_non_finite", lambda: True)
+    data = {"scenes": [{"durationSec": float("nan")}, {"durationSec": float("inf")}], "empty": None}
+    encoded = json_backend.dumps(data, compact=compact)
+    assert b"NaN" in encoded and b"Infinity" in encoded
+    decoded = json_backend.loads(encoded)
+    assert math.isnan(decoded["scenes"][0]["durationSec"])
+    assert decoded["scenes"][1]["durationSec"] == float("inf")
+    assert decoded["empty"] is None
+
+
+def test_default_dumps_does_not_walk_data(backend, monkeypatch):
+    def _walk(data):
+        raise AssertionError("dumps() walked the data")
+
+    monkeypatch.setattr(json_backend, "has_non_finite", _walk)
+    data = {"scenes": [{"durationSec": None}] * 3}
+    assert json_backend.loads(json_backend.dumps(data)) == data
+
+
+def test_loads_accepts_stdlib_only_input(backend):
+    assert math.isnan(json_backend.loads('{"x": NaN}')["x"])
+
+
+def test_load_path(tmp_path, backend):
+    path = tmp_path / "project.json"
+    path.write_bytes(json_backend.dumps(SAMPLE))
+    assert json_backend.load_path(path) == SAMPLE
+
+
+def test_response_provider_matches_default(backend):
+    flask = pytest.importorskip("flask")
+    if json_backend.FastJSONProvider is None:
+        pytest.skip("Flask 2.2+ required")
+    app = flask.Flask(__name__)
+    default_body = app.json.dumps({"b": 1, "a": [1.5, "값"]})
+    app.json = json_backend.FastJSONProvider(app)
+    assert json.loads(app.json.dumps({"b": 1, "a": [1.5, "값"]})) == json.loads(default_body)
+    with app.app_context():
+        response = flask.jsonify({"b": 1, "a": 2})
+    assert list(json.loads(response.get_data())) == ["a", "b"]  # 기본 provider처럼 키 정렬
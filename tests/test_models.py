@@ -0,0 +1,91 @@
+"""모델 인코딩: ProjectView / Project.to_dict 동일성, slots 모델 / 필드 테이블 인코더"""
+from dataclasses import asdict
+
+import pytest
+
+from backend.models import Project, ProjectView, Scene, encode_dataclass, scene_from_dict, scene_to_dict
+
+
+def _project_dict():
+    return {
+        "id": "p_test", "createdAt": "2025-01-01T00:00:00", "updatedAt": "2025-01-02T00:00:00",
+        "topic": "모델 테스트", "script": "대본", "blueprint": {"tone": "calm"},
+        "characters": [{"id": "c1", "name": "화자", "description": "narrator"}],
+        "scenes": [
+            {"id": "s1", "text": "첫 씬", "imagePrompt": "a cat", "duration": 3.5,
+             "image_path": "assets/images/s1.png", "effects": {"zoom": 1.1}},
+            {"id": "s2", "narration_ko": "둘째 씬", "prompt": "a dog", "durationSec": 2.0,
+             "audio_path": "assets/audio/s2.mp3", "unknownKey": 1},
+        ],
+        "thumbnail": {"text": "제목"},
+        "settings": {"video": {"fps": 24}, "subtitles": {"enabled": True}},
+        "status": {"script": "done", "archived": True},
+        "lastRun": {"timingsMs": {"tts": 1200}},
+        "revision": 4,
+    }
+
+
+def test_view_to_dict_matches_project():
+    data = _project_dict()
+    assert ProjectView(data).to_dict() == Project.from_dict(data).to_dict()
+
+
+def test_view_matches_after_scene_access():
+    data = _project_dict()
+    view = ProjectView(data)
+    assert [s.id for s in view.scenes] == ["s1", "s2"]
+    assert view.scene_count == 2
+    assert view.to_dict() == Project.from_dict(data).to_dict()
+
+
+def test_scene_aliases_round_trip():
+    scenes = Project.from_dict(_project_dict()).to_dict()["scenes"]
+    assert scenes[0]["narration_ko"] == "첫 씬"
+    assert scenes[0]["image_prompt_en"] == "a cat"
+    assert scenes[0]["durationSec"] == 3.5
+    assert "unknownKey" not in scenes[1]
+
+
+def test_view_delegates_header_fields():
+    view = ProjectView(_project_dict())
+    assert view.topic == "모델 테스트"
+    assert view.status.archived is True
+    assert view.settings.video.fps == 24
+
+
+def test_models_use_slots():
+    scene = Scene(id="s1")
+    assert not hasattr(scene, "__dict__")
+    with pytest.raises(AttributeError):
+        scene.not_a_field = 1
+
+
+def test_encode_dataclass_matches_asdict_and_copies_containers():
+    project = Project.from_dict(_project_dict())
+    encoded = encode_dataclass(project.settings)
+    assert encoded == asdict(project.settings)
+    encoded["subtitles"]["enabled"] = False
+    assert project.settings.subtitles["enabled"] is True
+
+
+def test_scene_round_trip_is_stable():
+    for raw in _project_dict()["scenes"]:
+        once = scene_to_dict(scene_from_dict(raw))
+        assert scene_to_dict(scene_from_dict(once)) == once
+
+
+def test_non_finite_scene_times_are_cleaned():
+    data = _project_dict()
+    data["scenes"][0]["duration"] = float("nan")
+    data["scenes"][1]["durationSec"] = float("inf")
+    data["scenes"][1]["startTime"] = float("-inf")
+
+    project = Project.from_dict(data)
+    assert [s.durationSec for s in project.scenes] == [None, None]
+    assert project.scenes[1].startTime is None
+    assert ProjectView(data).to_dict() == project.to_dict()
+    assert ProjectView(data).scene_values("durationSec") == [None, None]
+
+    # API에서 직접 대입한 값은 저장 시 정리
+    project.scenes[0].durationSec = float("nan")
+    assert project.to_dict()["scenes"][0]["durationSec"] is None
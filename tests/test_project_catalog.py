@@ -0,0 +1,172 @@
+"""ProjectCatalog: 필터 / 정렬 / 페이지 / 검색 / 통계, 키셋 커서 / fields= 선택"""
+import sqlite3
+
+import pytest
+
+from backend.project_catalog import (
+    ProjectCatalog, decode_cursor, encode_cursor, expand_fields, project_fields
+)
+
+
+@pytest.fixture
+def catalog():
+    catalog = ProjectCatalog(":memory:")
+    for i in range(7):
+        project_id = f"p_{i:02d}"
+        meta = {
+            "id": project_id,
+            "title": f"프로젝트 {i % 3}",
+            "status": "archived" if i == 6 else "active",
+            "createdAt": f"2025-01-0{i + 1}T00:00:00",
+            # 같은 updatedAt이 있어도 id로 순서가 정해져야 함
+            "updatedAt": f"2025-02-0{i // 2 + 1}T00:00:00",
+            "scenesCount": i,
+            "isPinned": i == 2,
+        }
+        metadata = {"hasFinalVideo": i < 2, "durationSeconds": 60 if i < 2 else None}
+        catalog.upsert(project_id, project_id, (i,), {"meta": meta, "project": {"id": project_id}, "metadata": metadata})
+    yield catalog
+    catalog.close()
+
+
+def _ids(entries):
+    return [entry["meta"]["id"] for entry in entries]
+
+
+def test_sort_with_id_tiebreak(catalog):
+    assert _ids(catalog.query(sort="createdAt", descending=False)) == [f"p_{i:02d}" for i in range(7)]
+    assert _ids(catalog.query(sort="updatedAt"))[:3] == ["p_06", "p_05", "p_04"]
+    with pytest.raises(ValueError):
+        catalog.query(sort="size")
+
+
+def test_limit_offset_pages_cover_all(catalog):
+    pages = [_ids(catalog.query(limit=3, offset=offset)) for offset in (0, 3, 6)]
+    assert sum(pages, []) == _ids(catalog.query())
+    assert [len(p) for p in pages] == [3, 3, 1]
+
+
+def test_status_pinned_and_count(catalog):
+    assert "p_06" not in _ids(catalog.query(status="active"))
+    assert catalog.count(status="active") == 6
+    assert catalog.count(status="archived") == 1
+    assert _ids(catalog.query(pinned=True)) == ["p_02"]
+
+
+def test_search_is_case_insensitive_and_escapes_like(catalog):
+    catalog.upsert("p_x", "p_x", (9,), {"meta": {"id": "p_x", "title": "Cats_100%"}, "project": {}})
+    assert _ids(catalog.query(search="cats_100%")) == ["p_x"]
+    assert catalog.count(search="_") == 1
+    assert catalog.count(search="프로젝트 1") == 2
+
+
+def test_get_returns_payload_and_delete_removes(catalog):
+    entry = catalog.get("p_03")
+    assert entry["meta"]["scenesCount"] == 3
+    assert entry["project"] == {"id": "p_03"}
+    catalog.delete("p_03")
+    assert catalog.get("p_03") is None
+    assert catalog.count() == 6
+
+
+def test_stats(catalog):
+    stats = catalog.stats()
+    assert stats["totalProjects"] == 7
+    assert stats["archivedProjects"] == 1
+    assert stats["completedProjects"] == 2
+    assert stats["avgScenesCount"] == 3.5
+    assert stats["avgDurationSeconds"] == 60
+
+
+def test_file_catalog_keeps_rows_and_signatures(tmp_path):
+    path = tmp_path / "catalog.db"
+    catalog = ProjectCatalog(path)
+    catalog.upsert("p_1", "folder_1", (1, 2), {"meta": {"id": "p_1", "title": "저장"}, "project": {"id": "p_1"}})
+    catalog.close()
+
+    reopened = ProjectCatalog(path)
+    assert reopened.get("p_1")["meta"]["title"] == "저장"
+    assert set(reopened.signatures()) == {"p_1"}
+    reopened.close()
+
+
+
+def test_payload_is_parsed_per_query_not_held_in_memory(catalog):
+    assert not hasattr(catalog, "_payloads")
+    first = catalog.query(search="프로젝트 0")
+    first[0]["project"]["title"] = "변경"
+    again = catalog.query(search="프로젝트 0")
+    assert again[0]["project"] == {"id": again[0]["meta"]["id"]}
+    assert catalog.get("p_00")["project"] == {"id": "p_00"}
+
+
+def test_old_schema_catalog_is_rebuilt(tmp_path):
+    path = tmp_path / "catalog.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE projects (id TEXT PRIMARY KEY, payload BLOB)")
+    conn.execute("INSERT INTO projects VALUES ('p_old', '{\"scenes\": []}')")
+    conn.execute("PRAGMA user_version=1")
+    conn.commit()
+    conn.close()
+
+    catalog = ProjectCatalog(path)
+    assert catalog.get("p_old") is None
+    assert catalog.count() == 0
+    catalog.close()
+
+@pytest.mark.parametrize("sort", ["updatedAt", "createdAt", "title"])
+@pytest.mark.parametrize("descending", [True, False])
+def test_cursor_walk_matches_unpaged_order(catalog, sort, descending):
+    expected = _ids(catalog.query(sort=sort, descending=descending, payload=False))
+    walked, after = [], None
+    while True:
+        page = catalog.query(sort=sort, descending=descending, limit=3, after=after, payload=False)
+        if not page:
+            break
+        walked.extend(_ids(page))
+        # API와 같이 문자열 커서를 거쳐 왕복
+        cursor_sort, cursor_desc, after = decode_cursor(encode_cursor(sort, descending, page[-1]["key"]))
+        assert (cursor_sort, cursor_desc) == (sort, descending)
+    assert walked == expected
+    assert len(walked) == 7
+
+
+def test_cursor_with_filter(catalog):
+    page = catalog.query(status="active", limit=4, payload=False)
+    rest = catalog.query(status="active", after=page[-1]["key"], payload=False)
+    assert _ids(page) + _ids(rest) == _ids(catalog.query(status="active", payload=False))
+    assert "p_06" not in _ids(page) + _ids(rest)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor("updatedAt", True, ("x", "p"))[:-2] + "@@"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError, match="invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursor_rejects_unknown_sort():
+    import base64
+    raw = base64.urlsafe_b64encode(b'["size","asc",1,"p"]').decode("ascii")
+    with pytest.raises(ValueError):
+        decode_cursor(raw)
+
+
+def test_expand_fields():
+    assert expand_fields(None) is None
+    assert expand_fields(" ") is None
+    assert expand_fields("id,title,id") == ("id", "title")
+    assert expand_fields("id,counts") == ("id", "scenesCount", "imagesCount", "ttsCount")
+    with pytest.raises(ValueError, match="unknown field: scenes"):
+        expand_fields("id,scenes")
+
+
+def test_project_fields_uses_columns_only(catalog):
+    fields = expand_fields("id,title,archived,pinned,counts")
+    rows = catalog.query(sort="createdAt", descending=False, payload=False)
+    assert all("project" not in row for row in rows)
+    projected = [project_fields(row["meta"], fields) for row in rows]
+    assert projected[2] == {
+        "id": "p_02", "title": "프로젝트 2", "archived": False, "pinned": True,
+        "scenesCount": 2, "imagesCount": 0, "ttsCount": 0,
+    }
+    assert projected[6]["archived"] is True
@@ -0,0 +1,124 @@
+"""ProjectMetaIndex: 쓰기/감시자 통지 시 해당 프로젝트만 무효화"""
+import json
+
+import pytest
+
+from backend.project_catalog import ProjectCatalog
+from backend.project_index import ProjectMetaIndex
+from backend.project_manager import ProjectManager
+
+
+def _build_entry(project_id, project_dir):
+    data = json.loads((project_dir / "project.json").read_text(encoding="utf-8"))
+    meta = {
+        "id": project_id,
+        "title": data.get("topic") or "",
+        "status": "archived" if (data.get("status") or {}).get("archived") else "active",
+        "createdAt": data.get("createdAt"),
+        "updatedAt": data.get("updatedAt"),
+        "scenesCount": len(data.get("scenes") or []),
+    }
+    return {"meta": meta, "project": {"id": project_id, "title": meta["title"]}}
+
+
+@pytest.fixture
+def pm(tmp_path):
+    return ProjectManager(projects_root=str(tmp_path / "projects"))
+
+
+@pytest.fixture
+def index(pm):
+    idx = ProjectMetaIndex(pm, _build_entry)
+    pm.add_change_listener(idx.invalidate)
+    return idx
+
+
+def _titles(index):
+    return {entry["meta"]["id"]: entry["meta"]["title"] for entry in index.query()}
+
+
+def _edit_outside(pm, project_id, topic):
+    # 다른 프로세스의 쓰기 (ProjectManager 리스너를 거치지 않음)
+    json_path = pm.get_project_dir(project_id) / "project.json"
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data["topic"] = topic
+    json_path.write_text(json.dumps(data, ensure_ascii=False) + "\n" * 8, encoding="utf-8")
+
+
+def test_build_and_save_invalidates_project(pm, index):
+    a = pm.create_project(topic="alpha")
+    b = pm.create_project(topic="beta")
+    assert index.build() == 2
+    assert _titles(index) == {a.id: "alpha", b.id: "beta"}
+
+    a.topic = "alpha 2"
+    pm.save_project(a)
+    assert _titles(index)[a.id] == "alpha 2"
+    assert index.get(a.id)["meta"]["title"] == "alpha 2"
+
+
+def test_new_project_is_picked_up_after_build(pm, index):
+    pm.create_project(topic="first")
+    index.build()
+    created = pm.create_project(topic="second")
+    assert _titles(index)[created.id] == "second"
+
+
+def test_outside_edit_is_detected_by_stat_signature(pm, index):
+    project = pm.create_project(topic="before")
+    index.build()
+    _edit_outside(pm, project.id, "after")
+    assert _titles(index)[project.id] == "after"
+
+
+def test_watcher_driven_index_waits_for_notification(pm, index):
+    project = pm.create_project(topic="watched")
+    index.build()
+    index.set_watcher_driven(True)
+
+    _edit_outside(pm, project.id, "edited outside")
+    assert _titles(index)[project.id] == "watched"
+
+    index.invalidate_path(pm.get_project_dir(project.id))
+    assert _titles(index)[project.id] == "edited outside"
+
+
+def test_invalidate_path_for_unknown_folder_rescans_ids(pm, index):
+    pm.create_project(topic="first")
+    index.build()
+    index.set_watcher_driven(True)
+
+    created = pm.create_project(topic="second")
+    index.invalidate_path(pm.get_project_dir(created.id))
+    assert _titles(index)[created.id] == "second"
+
+
+def test_deleted_project_is_dropped(pm, index):
+    keep = pm.create_project(topic="keep")
+    gone = pm.create_project(topic="gone")
+    index.build()
+    pm.delete_project(gone.id)
+    assert set(_titles(index)) == {keep.id}
+
+
+def test_restart_reuses_unchanged_catalog_rows(pm, tmp_path):
+    kept = pm.create_project(topic="kept")
+    changed = pm.create_project(topic="changed")
+    built = []
+
+    def _counting_build(project_id, project_dir):
+        built.append(project_id)
+        return _build_entry(project_id, project_dir)
+
+    catalog = ProjectCatalog(tmp_path / "catalog.db")
+    ProjectMetaIndex(pm, _counting_build, catalog).build()
+    catalog.close()
+
+    _edit_outside(pm, changed.id, "changed while stopped")
+    built.clear()
+    catalog = ProjectCatalog(tmp_path / "catalog.db")
+    index = ProjectMetaIndex(pm, _counting_build, catalog)
+    assert index.build() == 2
+    assert built == [changed.id]
+    assert _titles(index) == {kept.id: "kept", changed.id: "changed while stopped"}
+    catalog.close()
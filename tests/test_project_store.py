@@ -0,0 +1,118 @@
+"""project.json 저장소: revision 충돌 감지 / 원자적 쓰기 / 프로세스 간 잠금"""
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from backend.project_manager import ProjectManager
+from backend.project_store import LOCK_FILE_NAME, ProjectConflictError, read_json, write_json_atomic
+
+
+@pytest.fixture
+def pm(tmp_path):
+    return ProjectManager(projects_root=str(tmp_path / "projects"))
+
+
+def test_save_increments_revision(pm):
+    project = pm.create_project(topic="revision")
+    assert project.revision == 0
+
+    project.topic = "first"
+    pm.save_project(project)
+    assert project.revision == 1
+    assert pm.get_project(project.id).revision == 1
+
+
+def test_stale_save_raises_conflict(pm):
+    project = pm.create_project(topic="conflict")
+    first = pm.get_project(project.id)
+    second = pm.get_project(project.id)
+
+    first.topic = "first writer"
+    pm.save_project(first)
+
+    second.topic = "second writer"
+    with pytest.raises(ProjectConflictError) as excinfo:
+        pm.save_project(second)
+    assert excinfo.value.expected == 0
+    assert excinfo.value.actual == 1
+    assert pm.get_project(project.id).topic == "first writer"
+
+
+def test_modify_project_merges_with_latest(pm):
+    project = pm.create_project(topic="merge")
+    stale = pm.get_project(project.id)
+
+    latest = pm.get_project(project.id)
+    latest.script = "saved meanwhile"
+    pm.save_project(latest)
+
+    def _rename(p):
+        p.topic = "renamed"
+
+    pm.modify_project(stale.id, _rename)
+    reloaded = pm.get_project(project.id)
+    assert reloaded.topic == "renamed"
+    assert reloaded.script == "saved meanwhile"
+    assert reloaded.revision == 2
+
+
+def test_modify_project_skips_save_when_mutate_returns_false(pm):
+    project = pm.create_project(topic="noop")
+    pm.modify_project(project.id, lambda p: False)
+    assert pm.get_project(project.id).revision == 0
+
+
+def test_update_project_json_keeps_revision(pm):
+    project = pm.create_project(topic="meta")
+
+    def _set_meta(data):
+        data["imagesCount"] = 3
+
+    pm.update_project_json(project.id, _set_meta)
+    data = read_json(pm.get_project_dir(project.id) / "project.json")
+    assert data["imagesCount"] == 3
+    assert data["revision"] == 0
+
+
+def test_write_json_atomic_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "project.json"
+    write_json_atomic(path, {"id": "p1", "title": "한글"})
+    write_json_atomic(path, {"id": "p1", "title": "두 번째"})
+    assert read_json(path) == {"id": "p1", "title": "두 번째"}
+    assert [p.name for p in tmp_path.iterdir()] == ["project.json"]
+
+
+def test_project_lock_is_reentrant_and_uses_lock_file(pm):
+    project = pm.create_project(topic="lock")
+    lock = pm.project_lock(project.id)
+    with lock:
+        with lock:
+            pass
+        assert (pm.get_project_dir(project.id) / LOCK_FILE_NAME).exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl 기반 검증")
+def test_project_lock_waits_for_other_process(pm):
+    project = pm.create_project(topic="cross process")
+    lock_path = pm.get_project_dir(project.id) / LOCK_FILE_NAME
+    holder = subprocess.Popen(
+        [sys.executable, "-c", textwrap.dedent(f"""
+            import fcntl, sys, time
+            f = open({str(lock_path)!r}, "a+b")
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            print("locked", flush=True)
+            time.sleep(0.5)
+        """)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        start = time.monotonic()
+        with pm.project_lock(project.id):
+            waited = time.monotonic() - start
+        assert waited >= 0.2
+    finally:
+        holder.wait(5)
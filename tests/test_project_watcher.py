@@ -0,0 +1,89 @@
+"""ProjectWatcher: 이벤트 경로 -> 프로젝트 폴더 매핑, 이벤트 종류 필터, 폴링 서명 비교"""
+from types import SimpleNamespace
+
+import pytest
+
+from backend.project_watcher import ProjectWatcher, _ProjectEventHandler
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "projects"
+    (root / "p1" / "assets" / "audio").mkdir(parents=True)
+    (root / "p2").mkdir()
+    return root
+
+
+@pytest.fixture
+def watcher(root):
+    changed = []
+    w = ProjectWatcher(root, changed.append, mode="polling")
+    w.changed = changed
+    return w
+
+
+def test_report_path_maps_nested_file_to_project_folder(root, watcher):
+    watcher._report_path(str(root / "p1" / "assets" / "audio" / "scene_001.mp3"))
+    watcher._report_path(str(root / "p2"))
+    assert watcher.changed == [root.resolve() / "p1", root.resolve() / "p2"]
+
+
+def test_report_path_ignores_root_and_outside_paths(root, watcher, tmp_path):
+    watcher._report_path(str(root))
+    watcher._report_path(str(tmp_path / "elsewhere" / "file.txt"))
+    watcher._report_path(None)
+    assert watcher.changed == []
+
+
+@pytest.mark.parametrize("name", [
+    ".project.lock",
+    ".project.json.123.456.tmp",
+    "scene_001.mp3.123.456.part",
+    "abc.123.456.tmp.mp3",
+])
+def test_report_path_ignores_lock_and_temp_files(root, watcher, name):
+    watcher._report_path(str(root / "p1" / name))
+    assert watcher.changed == []
+
+
+def test_handler_reports_rename_from_temp_file(root, watcher):
+    handler = _ProjectEventHandler(watcher)
+    handler.on_any_event(SimpleNamespace(event_type="moved", src_path=str(root / "p1" / ".project.json.1.2.tmp"),
+                                         dest_path=str(root / "p1" / "project.json")))
+    assert [p.name for p in watcher.changed] == ["p1"]
+
+
+def test_handler_ignores_folder_modified_events(root, watcher):
+    handler = _ProjectEventHandler(watcher)
+    handler.on_any_event(SimpleNamespace(event_type="modified", src_path=str(root / "p1"), is_directory=True))
+    assert watcher.changed == []
+    handler.on_any_event(SimpleNamespace(event_type="created", src_path=str(root / "p3"), is_directory=True))
+    assert [p.name for p in watcher.changed] == ["p3"]
+
+
+@pytest.mark.parametrize("event_type,reported", [
+    ("modified", True), ("closed", True), ("created", True),
+    ("opened", False), ("closed_no_write", False),
+])
+def test_handler_ignores_read_only_events(root, watcher, event_type, reported):
+    handler = _ProjectEventHandler(watcher)
+    handler.on_any_event(SimpleNamespace(event_type=event_type, src_path=str(root / "p1" / "project.json")))
+    assert bool(watcher.changed) is reported
+
+
+def test_handler_reports_move_destination(root, watcher):
+    handler = _ProjectEventHandler(watcher)
+    handler.on_any_event(SimpleNamespace(event_type="moved", src_path=str(root / "p1" / "a.png"),
+                                         dest_path=str(root / "p2" / "a.png")))
+    assert [p.name for p in watcher.changed] == ["p1", "p2"]
+
+
+def test_poll_once_reports_changed_added_and_removed_folders(root, watcher):
+    watcher._snapshot = watcher._scan()
+    assert watcher.poll_once() == 0
+
+    (root / "p1" / "project.json").write_text("{}", encoding="utf-8")
+    (root / "p3").mkdir()
+    (root / "p2").rmdir()
+    assert watcher.poll_once() == 3
+    assert {p.name for p in watcher.changed} == {"p1", "p2", "p3"}
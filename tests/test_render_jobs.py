@@ -0,0 +1,73 @@
+"""RenderJobQueue: 작업 프로세스 stdout 통지 줄 -> 진행률/결과 기록"""
+import json
+import time
+
+import pytest
+
+from backend import render_jobs
+from backend.render_jobs import WORKER_MESSAGE_PREFIX, RenderJobQueue
+
+
+class _FakeProc:
+    def __init__(self, lines, returncode=0):
+        self.stdout = iter(lines)
+        self.returncode = returncode
+
+    def wait(self):
+        return self.returncode
+
+
+def _message(**fields):
+    return WORKER_MESSAGE_PREFIX + json.dumps(fields) + "\n"
+
+
+def _run_job(tmp_path, monkeypatch, lines, returncode=0):
+    progress_seen = []
+    queue = RenderJobQueue(tmp_path, max_workers=1)
+    original_update = queue._update
+
+    def _record_update(job_id, **fields):
+        if 'progress' in fields:
+            progress_seen.append(fields['progress'])
+        original_update(job_id, **fields)
+
+    monkeypatch.setattr(queue, "_update", _record_update)
+    monkeypatch.setattr(render_jobs.subprocess, "Popen", lambda cmd, **kwargs: _FakeProc(lines, returncode))
+    job = queue.submit("p1", "final")
+    deadline = time.time() + 5
+    while queue.get(job['id'])['status'] in ('queued', 'running'):
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return queue.get(job['id']), progress_seen
+
+
+def test_progress_and_done_message_are_recorded(tmp_path, monkeypatch):
+    lines = [
+        "ffmpeg log line\n",
+        _message(progress=0.25),
+        "@@RENDER_JOB not json\n",
+        _message(progress=0.5),
+        _message(status="done", videoPath="renders/final.mp4"),
+    ]
+    record, progress_seen = _run_job(tmp_path, monkeypatch, lines)
+    assert progress_seen[:2] == [0.25, 0.5]
+    assert record['status'] == 'done'
+    assert record['progress'] == 1.0
+    assert record['videoPath'] == 'renders/final.mp4'
+
+
+def test_worker_exit_without_status_fails_with_log_tail(tmp_path, monkeypatch):
+    record, _ = _run_job(tmp_path, monkeypatch, ["Traceback\n", "boom\n"], returncode=1)
+    assert record['status'] == 'failed'
+    assert 'exited with code 1' in record['error']
+    assert 'boom' in record['error']
+
+
+def test_submit_returns_active_job_for_same_project(tmp_path, monkeypatch):
+    queue = RenderJobQueue(tmp_path, max_workers=1)
+    monkeypatch.setattr(queue, "_run", lambda *args, **kwargs: None)
+    first = queue.submit("p1", "final")
+    assert queue.submit("p1", "final")['id'] == first['id']
+    assert queue.submit("p1", "preview")['id'] != first['id']
+    with pytest.raises(ValueError):
+        queue.submit("p1", "unknown")
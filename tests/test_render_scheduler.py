@@ -0,0 +1,96 @@
+"""render_segments / concat_segments: 완료 순서와 무관하게 씬 순서 유지, 길이 가중 진행률"""
+import time
+from pathlib import Path
+
+import pytest
+
+from src.video import render_scheduler
+from src.video.render_scheduler import SegmentJob, SegmentRenderError, concat_segments, render_segments
+
+
+def _jobs(tmp_path, count):
+    jobs = []
+    for i in range(count):
+        image = tmp_path / f"scene_{i:03d}.png"
+        audio = tmp_path / f"scene_{i:03d}.mp3"
+        image.write_bytes(b"png %d" % i)
+        audio.write_bytes(b"mp3 %d" % i)
+        jobs.append(SegmentJob(i, f"scene_{i:03d}", image, audio, tmp_path / f"segment_{i:03d}.mp4"))
+    return jobs
+
+
+def test_render_segments_keeps_scene_order(tmp_path, monkeypatch):
+    count = 4
+
+    def fake_render(image_path, audio_path, output_path, **kwargs):
+        # 앞 씬일수록 늦게 끝나도록 해서 완료 순서를 뒤집음
+        index = int(Path(image_path).stem.rsplit("_", 1)[1])
+        time.sleep(0.02 * (count - index))
+        Path(output_path).write_bytes(Path(image_path).read_bytes())
+        return True
+
+    monkeypatch.setattr(render_scheduler, "render_video_simple", fake_render)
+    jobs = _jobs(tmp_path, count)
+    results = render_segments(jobs)
+    assert [p.name for p in results] == [f"segment_{i:03d}.mp4" for i in range(count)]
+
+
+def test_render_segments_raises_on_failed_scene(tmp_path, monkeypatch):
+    def fake_render(image_path, audio_path, output_path, **kwargs):
+        if Path(image_path).stem.endswith("_001"):
+            return False
+        Path(output_path).write_bytes(b"ok")
+        return True
+
+    monkeypatch.setattr(render_scheduler, "render_video_simple", fake_render)
+    with pytest.raises(SegmentRenderError) as exc_info:
+        render_segments(_jobs(tmp_path, 3))
+    assert exc_info.value.scene_id == "scene_001"
+
+
+def test_render_segments_progress_is_weighted_by_audio_duration(tmp_path, monkeypatch):
+    durations = {"scene_000.mp3": 1.0, "scene_001.mp3": 3.0}
+    reported = []
+
+    def fake_render(image_path, audio_path, output_path, on_progress=None, duration=None, **kwargs):
+        assert duration == durations[Path(audio_path).name]
+        if on_progress:
+            on_progress(0.5)
+        Path(output_path).write_bytes(b"segment")
+        return True
+
+    monkeypatch.setattr(render_scheduler, "render_video_simple", fake_render)
+    monkeypatch.setattr(render_scheduler, "get_audio_duration", lambda path: durations[Path(path).name])
+    render_segments(_jobs(tmp_path, 2), on_progress=reported.append)
+
+    assert reported[0] == 0.0
+    assert reported[-1] == pytest.approx(1.0)
+    # 짧은 씬(1초)만 절반 진행 = 0.5 / 4, 긴 씬(3초)만 절반 진행 = 1.5 / 4
+    assert any(r == pytest.approx(0.125) or r == pytest.approx(0.375) for r in reported)
+
+
+def test_concat_segments_writes_list_in_given_order(tmp_path, monkeypatch):
+    segments = [tmp_path / name for name in ("b.mp4", "a.mp4", "c.mp4")]
+    for segment in segments:
+        segment.write_bytes(b"x")
+    calls = []
+
+    class _Result:
+        returncode = 0
+        stderr = b""
+
+    monkeypatch.setattr(render_scheduler.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd) or _Result())
+    list_path = tmp_path / "concat.txt"
+    concat_segments(segments, tmp_path / "out.mp4", list_path)
+
+    lines = list_path.read_text(encoding="utf-8").splitlines()
+    assert [Path(line[len("file '"):-1]).name for line in lines] == ["b.mp4", "a.mp4", "c.mp4"]
+    assert calls and calls[0][-1] == str(tmp_path / "out.mp4")
+
+
+def test_concat_single_segment_copies_without_ffmpeg(tmp_path, monkeypatch):
+    segment = tmp_path / "only.mp4"
+    segment.write_bytes(b"video")
+    monkeypatch.setattr(render_scheduler.subprocess, "run", lambda *a, **k: pytest.fail("ffmpeg called"))
+    concat_segments([segment], tmp_path / "out.mp4", tmp_path / "concat.txt")
+    assert (tmp_path / "out.mp4").read_bytes() == b"video"
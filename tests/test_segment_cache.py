@@ -0,0 +1,91 @@
+"""SegmentCache: 콘텐츠 키, LRU 순 용량/개수 제한"""
+import os
+from pathlib import Path
+
+import pytest
+
+from src.video import render_scheduler
+from src.video.render_scheduler import SegmentJob, render_segments
+from src.video.segment_cache import SegmentCache
+
+
+def _put(cache, tmp_path, key, size, mtime):
+    rendered = tmp_path / f"{key}.render.mp4"
+    rendered.write_bytes(b"v" * size)
+    path = cache.put(key, rendered)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    image = tmp_path / "scene.png"
+    audio = tmp_path / "scene.mp3"
+    image.write_bytes(b"image")
+    audio.write_bytes(b"audio")
+    return image, audio
+
+
+def test_key_depends_on_content_and_params(tmp_path, inputs):
+    image, audio = inputs
+    key = SegmentCache.make_key(image, audio, {"fps": 30})
+    assert key == SegmentCache.make_key(image, audio, {"fps": 30})
+    assert key != SegmentCache.make_key(image, audio, {"fps": 24})
+
+    audio.write_bytes(b"audio changed")
+    assert key != SegmentCache.make_key(image, audio, {"fps": 30})
+
+
+def test_get_refreshes_lru_order(tmp_path):
+    cache = SegmentCache(tmp_path / "segments", max_bytes=0, max_entries=2)
+    _put(cache, tmp_path, "a", 10, 1000)
+    _put(cache, tmp_path, "b", 10, 2000)
+    _put(cache, tmp_path, "c", 10, 3000)
+
+    # a를 조회하면 최근 사용으로 갱신되어 b가 가장 오래된 항목이 됨
+    assert cache.get("a") is not None
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_evict_by_size_keeps_requested_keys(tmp_path):
+    cache = SegmentCache(tmp_path / "segments", max_bytes=25, max_entries=0)
+    _put(cache, tmp_path, "old", 10, 1000)
+    _put(cache, tmp_path, "mid", 10, 2000)
+    _put(cache, tmp_path, "new", 10, 3000)
+
+    assert cache.evict(keep=["old"]) == 1
+    assert cache.get("old") is not None
+    assert cache.get("mid") is None
+    assert cache.get("new") is not None
+
+
+def test_evict_ignores_in_progress_temp_files(tmp_path):
+    cache = SegmentCache(tmp_path / "segments", max_bytes=0, max_entries=1)
+    _put(cache, tmp_path, "a", 10, 1000)
+    temp = cache.temp_path_for("b")
+    temp.write_bytes(b"encoding")
+    assert cache.evict() == 0
+    assert temp.exists()
+
+
+def test_render_segments_skips_cached_scenes(tmp_path, monkeypatch, inputs):
+    image, audio = inputs
+    rendered = []
+
+    def fake_render(image_path, audio_path, output_path, **kwargs):
+        rendered.append(output_path)
+        Path(output_path).write_bytes(b"segment")
+        return True
+
+    monkeypatch.setattr(render_scheduler, "render_video_simple", fake_render)
+    cache = SegmentCache(tmp_path / "segments")
+
+    def job():
+        return SegmentJob(0, "scene_001", image, audio, tmp_path / "segment_001.mp4")
+
+    first = render_segments([job()], cache=cache)
+    second = render_segments([job()], cache=cache)
+    assert len(rendered) == 1
+    assert first == second and first[0].parent == cache.cache_dir
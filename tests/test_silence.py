@@ -0,0 +1,62 @@
+"""무음 검출: rms_db 창 계산, find_silences 구간, SilenceAnalysis 앞뒤 무음"""
+import numpy as np
+import pytest
+
+from src.video.silence import SilenceAnalysis, find_silences, rms_db
+
+SR = 16000
+
+
+def _tone(seconds, amplitude=0.5):
+    t = np.arange(int(seconds * SR), dtype=np.float32) / SR
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SR), dtype=np.float32)
+
+
+def _naive_rms_db(samples, window, hop):
+    out = []
+    for start in range(0, samples.size - window + 1, hop):
+        frame = samples[start:start + window].astype(np.float64)
+        out.append(10 * np.log10(max(np.mean(frame * frame), 1e-12)))
+    return np.array(out)
+
+
+@pytest.mark.parametrize("window,hop", [(320, 160), (300, 160)])
+def test_rms_db_matches_naive_windows(window, hop):
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-1, 1, SR // 4).astype(np.float32)
+    fast = rms_db(samples, window, hop)
+    naive = _naive_rms_db(samples, window, hop)
+    assert fast.shape == naive.shape
+    assert np.allclose(fast, naive, atol=1e-6)
+
+
+def test_rms_db_of_silence_is_floor():
+    assert np.all(rms_db(_silence(0.1), 320, 160) == pytest.approx(-120.0))
+
+
+def test_find_silences_locates_leading_pause_and_trailing():
+    samples = np.concatenate([_silence(0.4), _tone(1.0), _silence(0.5), _tone(1.0), _silence(0.3)])
+    silences = find_silences(samples, SR)
+    assert len(silences) == 3
+    (ls, le), (ps, pe), (ts, te) = silences
+    assert ls == 0.0 and le == pytest.approx(0.4, abs=0.02)
+    assert ps == pytest.approx(1.4, abs=0.02) and pe == pytest.approx(1.9, abs=0.02)
+    assert ts == pytest.approx(2.9, abs=0.02) and te == pytest.approx(3.2, abs=1e-3)
+
+
+def test_find_silences_drops_short_gaps():
+    samples = np.concatenate([_tone(0.5), _silence(0.1), _tone(0.5)])
+    assert find_silences(samples, SR, min_silence=0.25) == []
+    assert find_silences(np.zeros(0, dtype=np.float32), SR) == []
+
+
+def test_analysis_edges_and_pauses():
+    analysis = SilenceAnalysis(duration=3.2, silences=[(0.0, 0.4), (1.4, 1.9), (2.9, 3.2)])
+    assert analysis.leading == 0.4
+    assert analysis.trailing == pytest.approx(0.3)
+    assert analysis.speech_bounds() == (0.4, pytest.approx(2.9))
+    assert analysis.pauses() == [(1.4, 1.9)]
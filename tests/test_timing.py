@@ -0,0 +1,50 @@
+"""자막 타이밍: time_sentences"""
+import pytest
+
+from src.video.timing import time_sentences
+
+
+def _spans(cues):
+    return [(round(c.start, 3), round(c.end, 3)) for c in cues]
+
+
+def test_empty():
+    assert time_sentences([], 5.0) == []
+
+
+def test_weighted_split_covers_total():
+    cues = time_sentences(["짧다.", "이 문장은 훨씬 더 깁니다."], 6.0, offset=10.0)
+    assert cues[0].start == 10.0
+    assert cues[-1].end == pytest.approx(16.0)
+    assert cues[0].end == cues[1].start
+    # 긴 문장이 더 긴 구간
+    assert cues[1].end - cues[1].start > cues[0].end - cues[0].start
+
+
+def test_durations_are_scaled_to_total():
+    cues = time_sentences(["a", "b", "c"], 6.0, durations=[1.0, 1.0, 2.0])
+    assert _spans(cues) == [(0.0, 1.5), (1.5, 3.0), (3.0, 6.0)]
+
+
+def test_mismatched_durations_fall_back_to_weights():
+    cues = time_sentences(["하나.", "둘."], 4.0, durations=[1.0])
+    assert cues[-1].end == pytest.approx(4.0)
+    assert len(cues) == 2
+
+
+def test_boundaries_snap_to_pause():
+    sentences = ["첫 번째 문장입니다.", "두 번째 문장입니다."]
+    cues = time_sentences(sentences, 5.0, pauses=[(2.6, 2.9)], speech_span=(0.5, 4.5))
+    # 첫 cue는 씬 시작, 마지막 cue는 씬 끝까지 확장
+    assert cues[0].start == 0.0
+    assert cues[-1].end == 5.0
+    # 경계는 쉼 구간 안
+    assert 2.6 <= cues[0].end <= 2.9
+    assert cues[1].start == cues[0].end
+
+
+def test_offset_applies_to_snapped_cues():
+    cues = time_sentences(["가나다.", "라마바."], 4.0, offset=3.0, pauses=[(1.9, 2.1)], speech_span=(0.0, 4.0))
+    assert cues[0].start == 3.0
+    assert cues[-1].end == 7.0
+    assert 4.9 <= cues[0].end <= 5.1
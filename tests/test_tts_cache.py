@@ -0,0 +1,115 @@
+"""TTS 캐시: 적중 / 미스 / LRU 제거 / 재시작 후 길이 사이드카"""
+import os
+import time
+
+import pytest
+
+from src.video import tts_cache
+from src.video.tts_cache import TTSCache, duration_sidecar_path, known_duration, synthesize_cached
+
+
+class _Synth:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        path.write_bytes(b"\x00" * 100)
+
+
+def _synthesize(cache, dest, text, synth):
+    return synthesize_cached(dest, text, synth, lambda p: 1.25, "fake", voice="v", cache=cache)
+
+
+def test_miss_then_hit(tmp_path):
+    cache = TTSCache(tmp_path / "cache")
+    synth = _Synth()
+
+    duration, hit = _synthesize(cache, tmp_path / "a" / "s1.mp3", "안녕하세요", synth)
+    assert (duration, hit) == (1.25, False)
+    # 공백만 다른 같은 문장은 같은 키
+    duration, hit = _synthesize(cache, tmp_path / "b" / "s1.mp3", "  안녕하세요 ", synth)
+    assert (duration, hit) == (1.25, True)
+    assert synth.calls == 1
+    assert (tmp_path / "b" / "s1.mp3").read_bytes() == b"\x00" * 100
+
+
+def test_different_voice_is_a_miss(tmp_path):
+    cache = TTSCache(tmp_path / "cache")
+    synth = _Synth()
+    synthesize_cached(tmp_path / "x.mp3", "문장", synth, lambda p: 1.0, "fake", voice="a", cache=cache)
+    synthesize_cached(tmp_path / "y.mp3", "문장", synth, lambda p: 1.0, "fake", voice="b", cache=cache)
+    assert synth.calls == 2
+
+
+def test_eviction_by_entry_count_removes_oldest(tmp_path):
+    cache = TTSCache(tmp_path / "cache", max_bytes=0, max_entries=2)
+    synth = _Synth()
+    for i in range(3):
+        _synthesize(cache, tmp_path / "out" / f"{i}.mp3", f"문장 {i}", synth)
+        time.sleep(0.01)
+    assert cache.usage() == (200, 2)
+
+    # 가장 오래된 항목이 빠졌으므로 다시 합성, 최근 항목은 적중
+    _, hit = _synthesize(cache, tmp_path / "out" / "again.mp3", "문장 2", synth)
+    assert hit
+    _, hit = _synthesize(cache, tmp_path / "out" / "again0.mp3", "문장 0", synth)
+    assert not hit
+
+
+def test_eviction_by_size(tmp_path):
+    cache = TTSCache(tmp_path / "cache", max_bytes=250)
+    synth = _Synth()
+    for i in range(4):
+        _synthesize(cache, tmp_path / "out" / f"{i}.mp3", f"size {i}", synth)
+        time.sleep(0.01)
+    total, count = cache.usage()
+    assert total <= 250 and count == 2
+    assert len([f for f in (tmp_path / "cache").glob("*/*") if f.suffix == ".json"]) == 2
+
+
+def test_evict_within_limits_does_not_scan(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path / "cache", max_entries=10)
+    synth = _Synth()
+    _synthesize(cache, tmp_path / "first.mp3", "first", synth)
+
+    def _fail_scan():
+        raise AssertionError("evict() scanned the cache directory")
+
+    monkeypatch.setattr(cache, "_scan", _fail_scan)
+    for i in range(3):
+        _synthesize(cache, tmp_path / f"{i}.mp3", f"more {i}", synth)
+    assert cache.usage() == (400, 4)
+
+
+def test_corrupt_sidecar_is_a_miss(tmp_path):
+    cache = TTSCache(tmp_path / "cache")
+    synth = _Synth()
+    _synthesize(cache, tmp_path / "a.mp3", "sidecar", synth)
+    key = cache.make_key("fake", "", "v", 1.0, "mp3", "sidecar")
+    cache._meta_path(key).write_text("not json", encoding="utf-8")
+    assert cache.get(key, "mp3") is None
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_duration_survives_restart_via_sidecar(tmp_path, monkeypatch, use_cache):
+    cache = TTSCache(tmp_path / "cache") if use_cache else None
+    monkeypatch.setattr(tts_cache, "get_tts_cache", lambda: None)
+    dest = tmp_path / "assets" / "audio" / "scene_001.mp3"
+    dest.parent.mkdir(parents=True)
+    synthesize_cached(dest, "재시작", _Synth(), lambda p: 2.5, "fake", voice="v", cache=cache)
+    assert duration_sidecar_path(dest).exists()
+
+    # 재시작: 프로세스 내 메모 비움
+    monkeypatch.setattr(tts_cache, "_duration_memo", {})
+    assert known_duration(dest) == 2.5
+
+
+def test_duration_sidecar_ignored_after_file_replaced(tmp_path, monkeypatch):
+    dest = tmp_path / "scene_001.mp3"
+    synthesize_cached(dest, "교체", _Synth(), lambda p: 2.5, "fake", voice="v", cache=TTSCache(tmp_path / "cache"))
+    monkeypatch.setattr(tts_cache, "_duration_memo", {})
+
+    dest.unlink()
+    dest.write_bytes(b"\x01" * 300)
+    assert known_duration(dest) is None
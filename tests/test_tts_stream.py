@@ -0,0 +1,70 @@
+"""TTS 스트리밍 저장: 원자적 확정, 합성 중 부분 파일 tail"""
+import threading
+
+import pytest
+
+from src.video.tts_stream import finish_partial, get_partial, part_path_for, register_partial, tail_partial, write_stream
+
+
+def test_write_stream_renames_part_file(tmp_path):
+    out = tmp_path / "audio" / "scene_001.mp3"
+    written = write_stream([b"ab", b"", b"cde"], out)
+    assert written == 5
+    assert out.read_bytes() == b"abcde"
+    assert list(out.parent.glob("*.part")) == []
+
+
+def test_write_stream_failure_keeps_previous_file(tmp_path):
+    out = tmp_path / "scene_001.mp3"
+    out.write_bytes(b"old")
+
+    def chunks():
+        yield b"new"
+        raise ConnectionError("dropped")
+
+    with pytest.raises(ConnectionError):
+        write_stream(chunks(), out)
+    assert out.read_bytes() == b"old"
+    assert list(tmp_path.glob("*.part")) == []
+
+
+def test_tail_partial_follows_growing_file_until_done(tmp_path):
+    final = tmp_path / "scene_001.mp3"
+    part = part_path_for(final)
+    key = ("p1", final.name)
+    entry = register_partial(key, part, final)
+    assert get_partial(key) is entry
+
+    first_written = threading.Event()
+    release = threading.Event()
+
+    def chunks():
+        yield b"first-"
+        first_written.set()
+        release.wait(5)
+        yield b"second"
+
+    def writer():
+        write_stream(chunks(), final, part)
+        finish_partial(key, entry)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    assert first_written.wait(5)
+
+    received = []
+    for data in tail_partial(entry, chunk_size=4, poll=0.01, timeout=5):
+        received.append(data)
+        if b"".join(received) == b"first-":
+            release.set()
+    thread.join(5)
+
+    assert b"".join(received) == b"first-second"
+    assert get_partial(key) is None
+
+
+def test_tail_partial_stops_on_failure(tmp_path):
+    final = tmp_path / "scene_002.mp3"
+    entry = register_partial(("p1", final.name), part_path_for(final), final)
+    finish_partial(("p1", final.name), entry, failed=True)
+    assert list(tail_partial(entry, poll=0.01, timeout=1)) == []
@@ -1,9 +1,15 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { useRouter } from 'next/router';
 import ProjectLayout from '../../../components/ProjectLayout';
 import { apiGet, apiPost, previewUrl, downloadUrl } from '../../../lib/api';
 import { unwrapProject } from '../../../lib/projectUtils';
 
+const JOB_POLL_INTERVAL_MS = 1000;
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
 export default function RenderPage() {
   const router = useRouter();
   const { projectId } = router.query;
@@ -13,11 +19,20 @@ export default function RenderPage() {
   const [error, setError] = useState(null);
   const [message, setMessage] = useState(null);
   const [videoPath, setVideoPath] = useState('');
+  const [progress, setProgress] = useState(null);
+  const unmountedRef = useRef(false);
 
   useEffect(() => {
     if (projectId) loadProject();
   }, [projectId]);
 
+  useEffect(() => {
+    unmountedRef.current = false;
+    return () => {
+      unmountedRef.current = true;
+    };
+  }, []);
+
   async function loadProject() {
     try {
       const data = await apiGet(`projects/${projectId}`);
@@ -42,12 +57,29 @@ export default function RenderPage() {
   const hasScenes = project?.scenes?.length > 0;
   const hasTTS = hasScenes && project.scenes[0].audio_path;
 
+  // 비동기 렌더 작업(202 + jobId)이 끝날 때까지 진행률 폴링
+  async function waitForRenderJob(jobId) {
+    while (!unmountedRef.current) {
+      const { job } = await apiGet(`render/jobs/${jobId}`);
+      setProgress(job.progress || 0);
+      if (job.status === 'done') return job;
+      if (job.status === 'failed') throw new Error(job.error || 'render job failed');
+      await sleep(JOB_POLL_INTERVAL_MS);
+    }
+    return null;
+  }
+
   async function handleRenderFinal() {
     try {
       setLoading(true);
       setError(null);
       setMessage(null);
-      const result = await apiPost(`projects/${projectId}/render/final`, {});
+      setProgress(null);
+      let result = await apiPost(`projects/${projectId}/render/final`, {});
+      if (result.jobId) {
+        result = await waitForRenderJob(result.jobId);
+        if (!result) return;
+      }
       setVideoPath(result.videoPath || 'renders/final.mp4');
       setMessage('최종 영상이 생성되었습니다.');
       await loadProject();
@@ -55,7 +87,10 @@ export default function RenderPage() {
     } catch (err) {
       setError('렌더링 실패: ' + err.message);
     } finally {
-      setLoading(false);
+      if (!unmountedRef.current) {
+        setLoading(false);
+        setProgress(null);
+      }
     }
   }
 
@@ -90,7 +125,9 @@ export default function RenderPage() {
           {loading && (
             <div style={{ marginTop: '16px', textAlign: 'center' }}>
               <div className="spinner" />
-              <p style={{ fontSize: '13px', color: '#999' }}>렌더링 중... 시간이 걸릴 수 있습니다.</p>
+              <p style={{ fontSize: '13px', color: '#999' }}>
+                렌더링 중{progress !== null ? ` (${Math.round(progress * 100)}%)` : ''}... 시간이 걸릴 수 있습니다.
+              </p>
             </div>
           )}
 